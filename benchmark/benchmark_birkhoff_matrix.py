@@ -0,0 +1,45 @@
+import time
+import unittest
+
+from openmdao.utils.assert_utils import assert_near_equal
+
+from dymos.utils.birkhoff import birkhoff_matrix
+from dymos.utils.cgl import cgl, clenshaw_curtis
+from dymos.utils.lgl import lgl
+
+
+def _time_birkhoff_matrix(grid_type, num_nodes):
+    """
+    Build the Birkhoff matrix for a single segment, bypassing the cache, and return it with the elapsed time.
+    """
+    tau, w = lgl(num_nodes) if grid_type == 'lgl' else cgl(num_nodes)
+    start = time.perf_counter()
+    B = birkhoff_matrix.__wrapped__(tau, w, grid_type=grid_type)
+    return B, time.perf_counter() - start
+
+
+class BenchmarkBirkhoffMatrix(unittest.TestCase):
+
+    def _run_benchmark(self, grid_type, orders=(10, 50, 100, 200, 300, 500)):
+        for order in orders:
+            B, elapsed = _time_birkhoff_matrix(grid_type, order + 1)
+            print(f'birkhoff_matrix {grid_type} order {order}: {elapsed:.4f} s')
+
+            # The last row of the Birkhoff matrix integrates over the entire segment, reproducing
+            # the quadrature weights.
+            if grid_type == 'lgl':
+                _, w = lgl(order + 1)
+            else:
+                _, w = clenshaw_curtis(order + 1)
+            with self.subTest(order=order):
+                assert_near_equal(B[-1, :], w, tolerance=1.0E-8)
+
+    def benchmark_birkhoff_matrix_lgl(self):
+        self._run_benchmark('lgl')
+
+    def benchmark_birkhoff_matrix_cgl(self):
+        self._run_benchmark('cgl')
+
+
+if __name__ == '__main__':
+    unittest.main()
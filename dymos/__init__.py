@@ -9,4 +9,6 @@ from .transcriptions.grid_data import GaussLobattoGrid, ChebyshevGaussLobattoGri
 from .trajectory.trajectory import Trajectory
 from .run_problem import run_problem
 from .load_case import load_case
+from .solution_file import read_solution_file, write_solution_file
+from .utils.recorders import AsyncSqliteRecorder
 from ._options import options
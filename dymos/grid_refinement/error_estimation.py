@@ -1,10 +1,15 @@
 """
 Generic utilities for use by the grid refinement schemes.
 """
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
 import numpy as np
 from scipy.linalg import block_diag
+import scipy.sparse as sp
 
 import openmdao.api as om
+from openmdao.utils.mpi import MPI
 
 from ..transcriptions import GaussLobatto, Radau
 from ..utils.lagrange import lagrange_matrices
@@ -53,7 +58,48 @@ def interpolation_lagrange_matrix(old_grid, new_grid):
     return L, D
 
 
-def integration_matrix(grid):
+def refined_grid_interpolation_matrix(old_grid, new_grid):
+    """
+    Evaluate the lagrange matrix which interpolates values at all nodes of a solved grid onto all nodes of a refined grid.
+
+    Unlike interpolation_lagrange_matrix, the segments of the two grids need not coincide.  Each node of
+    the new grid is evaluated using the interpolating polynomial of the segment of the old grid in which it lies.
+
+    Parameters
+    ----------
+    old_grid : <GridData>
+        GridData object representing the grid on which the problem has been solved.
+    new_grid : <GridData>
+        GridData object representing the refined grid, spanning the same range of phase tau.
+
+    Returns
+    -------
+    ndarray
+        The lagrange interpolation matrix, of shape (new_grid.num_nodes, old_grid.num_nodes).
+    """
+    L = np.zeros((new_grid.num_nodes, old_grid.num_nodes))
+
+    # The segment of the old grid in which each node of the new grid lies.
+    new_ptau = new_grid.node_ptau
+    old_seg_idxs = np.clip(np.searchsorted(old_grid.segment_ends, new_ptau, side='right') - 1,
+                           0, old_grid.num_segments - 1)
+
+    for iseg in range(old_grid.num_segments):
+        new_idxs = np.where(old_seg_idxs == iseg)[0]
+        if new_idxs.size == 0:
+            continue
+
+        i1, i2 = old_grid.segment_indices[iseg]
+        ptau_a, ptau_b = old_grid.segment_ends[iseg:iseg + 2]
+        nodes_eval = 2.0 * (new_ptau[new_idxs] - ptau_a) / (ptau_b - ptau_a) - 1.0
+
+        L_block, _ = lagrange_matrices(old_grid.node_stau[i1:i2], nodes_eval, compute_diff_matrix=False)
+        L[new_idxs, i1:i2] = L_block
+
+    return L
+
+
+def integration_matrix(grid, sparse=False):
     """
     Evaluate the Integration matrix of the given grid.
 
@@ -61,31 +107,114 @@ def integration_matrix(grid):
     ----------
     grid : <GridData>
         GridData object containing the grid where the integration matrix will be evaluated.
+    sparse : bool
+        If True, the returned matrix will be in scipy CSR sparse format.  Otherwise, it is
+        returned as a dense numpy.array.
 
     Returns
     -------
-    ndarray
+    ndarray or csr_matrix
         The integration matrix used to propagate initial states over segments.
     """
     I_blocks = []
 
+    # Segments with the same nodes (in segment tau space) share the same block.
+    seg_blocks = {}
+
     for iseg in range(grid.num_segments):
         i1, i2 = grid.subset_segment_indices['all'][iseg, :]
         indices = grid.subset_node_indices['all'][i1:i2]
         nodes_given = grid.node_stau[indices]
 
-        i1, i2 = grid.subset_segment_indices['all'][iseg, :]
-        indices = grid.subset_node_indices['all'][i1:i2]
-        nodes_eval = grid.node_stau[indices][1:]
-
-        _, D_block = lagrange_matrices(nodes_given, nodes_eval)
-        I_block = np.linalg.inv(D_block[:, 1:])
-        I_blocks.append(I_block)
+        key = nodes_given.tobytes()
+        if key not in seg_blocks:
+            _, D_block = lagrange_matrices(nodes_given, nodes_given[1:])
+            seg_blocks[key] = np.linalg.inv(D_block[:, 1:])
+        I_blocks.append(seg_blocks[key])
 
+    if sparse:
+        return sp.block_diag(I_blocks, format='csr')
     return block_diag(*I_blocks)
 
 
-def eval_ode_on_grid(phase, transcription):
+# The phases whose errors are computed by a check_error worker process, inherited from the process which forked
+# it, and the error estimation problems setup by the worker.
+_worker_phases = None
+_worker_problem_cache = None
+
+
+def _setup_refinement_problem(phase, grid_data):
+    """
+    Create and setup a problem which evaluates the ODE of the given phase at all nodes of the given grid.
+
+    Parameters
+    ----------
+    phase : Phase
+        The Phase whose ODE is to be evaluated.
+    grid_data : GridData
+        The grid at whose nodes the ODE is evaluated.
+
+    Returns
+    -------
+    Problem
+        The setup problem containing a GridRefinementODESystem.
+    """
+    p_refine = om.Problem(model=om.Group())
+    grid_refinement_system = GridRefinementODESystem(grid_data=grid_data,
+                                                     time=phase.time_options,
+                                                     states=phase.state_options,
+                                                     controls=phase.control_options,
+                                                     parameters=phase.parameter_options,
+                                                     ode_class=phase.options['ode_class'],
+                                                     ode_init_kwargs=phase.options[
+                                                         'ode_init_kwargs'],
+                                                     calc_exprs=phase._calc_exprs)
+    p_refine.model.add_subsystem('grid_refinement_system', grid_refinement_system, promotes=['*'])
+    p_refine.setup()
+
+    return p_refine
+
+
+def _get_phase_values(phase):
+    """
+    Return the values of a solved phase from which its ODE is evaluated on another grid.
+
+    Parameters
+    ----------
+    phase : Phase
+        A Phase object which has been executed.
+
+    Returns
+    -------
+    dict
+        The timeseries values of time, the states, the controls, and (if they are included in the timeseries)
+        the control rates of the phase, along with the values of its parameters and its duration.
+    """
+    t_name = phase.time_options['name']
+    state_prefix = 'states:' if phase.timeseries_options['use_prefix'] else ''
+    control_prefix = 'controls:' if phase.timeseries_options['use_prefix'] else ''
+
+    values = {'time': phase.get_val(f'timeseries.{t_name}', units=phase.time_options['units']),
+              't_duration': phase.get_val('t_duration'),
+              'states': {}, 'controls': {}, 'control_rates': {}, 'control_rates2': {}, 'parameters': {}}
+
+    for name, options in phase.state_options.items():
+        values['states'][name] = phase.get_val(f'timeseries.{state_prefix}{name}', units=options['units'])
+
+    for name, options in phase.control_options.items():
+        values['controls'][name] = phase.get_val(f'timeseries.{control_prefix}{name}', units=options['units'])
+        if phase.timeseries_options['include_control_rates']:
+            values['control_rates'][name] = phase.get_val(f'timeseries.control_rates:{name}_rate')
+            values['control_rates2'][name] = phase.get_val(f'timeseries.control_rates:{name}_rate2')
+
+    for name, options in phase.parameter_options.items():
+        # The value of the parameter at one node
+        values['parameters'][name] = phase.get_val(f'parameter_vals:{name}', units=options['units'])[0, ...]
+
+    return values
+
+
+def eval_ode_on_grid(phase, transcription, problem=None):
     """
     Evaluate the ODE from the given phase at all nodes of the given transcription.
 
@@ -96,6 +225,9 @@ def eval_ode_on_grid(phase, transcription):
         of the given transcription.
     transcription : Radau or GaussLobatto transcription instance
         The transcription object at which to execute the ODE of the given phase at all nodes.
+    problem : Problem or None
+        A problem previously returned by this function's setup step for the same phase and number of nodes.
+        If None, a new problem is created and setup.
 
     Returns
     -------
@@ -106,6 +238,37 @@ def eval_ode_on_grid(phase, transcription):
     dict of (str: ndarray)
         A dictionary of the state rates computed in the phase's ODE at the new transcription points.
     """
+    return _eval_ode_on_grid(phase, phase.options['transcription'].grid_data, transcription.grid_data,
+                             _get_phase_values(phase), problem)
+
+
+def _eval_ode_on_grid(phase, old_grid, grid_data, values, problem=None):
+    """
+    Evaluate the ODE of the given phase at all nodes of the given grid from the values of the phase on its own grid.
+
+    Parameters
+    ----------
+    phase : Phase
+        The Phase whose ODE is to be evaluated. Only its options are used.
+    old_grid : GridData
+        The grid on which the phase was solved.
+    grid_data : GridData
+        The grid at whose nodes the ODE is evaluated.
+    values : dict
+        The values of the solved phase, as returned by _get_phase_values.
+    problem : Problem or None
+        A problem previously returned by _setup_refinement_problem for the same phase and number of nodes.
+        If None, a new problem is created and setup.
+
+    Returns
+    -------
+    dict of (str: ndarray)
+        A dictionary of the state values from the phase interpolated to the new grid.
+    dict of (str: ndarray)
+        A dictionary of the control values from the phase interpolated to the new grid.
+    dict of (str: ndarray)
+        A dictionary of the state rates computed in the phase's ODE at the new grid points.
+    """
     x = {}
     u = {}
     u_rate = {}
@@ -116,34 +279,18 @@ def eval_ode_on_grid(phase, transcription):
 
     # Build the interpolation matrix which interpolates from all nodes on the old grid to
     # all nodes on the new grid.
-    grid_data = transcription.grid_data
-    L, _ = interpolation_lagrange_matrix(old_grid=phase.options['transcription'].grid_data,
-                                         new_grid=grid_data)
+    L, _ = interpolation_lagrange_matrix(old_grid=old_grid, new_grid=grid_data)
 
-    # Create a new problem for the grid_refinement
-    # For this test, use the same grid as the original problem.
-    p_refine = om.Problem(model=om.Group())
-    grid_refinement_system = GridRefinementODESystem(grid_data=grid_data,
-                                                     time=phase.time_options,
-                                                     states=phase.state_options,
-                                                     controls=phase.control_options,
-                                                     parameters=phase.parameter_options,
-                                                     ode_class=phase.options['ode_class'],
-                                                     ode_init_kwargs=phase.options[
-                                                         'ode_init_kwargs'],
-                                                     calc_exprs=phase._calc_exprs)
-    p_refine.model.add_subsystem('grid_refinement_system', grid_refinement_system, promotes=['*'])
-    p_refine.setup()
+    # Create a new problem for the grid_refinement unless one was provided.
+    p_refine = _setup_refinement_problem(phase, grid_data) if problem is None else problem
 
     # Set the values in the refinement problem using the outputs from the first
     ode = p_refine.model.grid_refinement_system.ode
 
-    t_name = phase.time_options['name']
-
-    t_prev = phase.get_val(f'timeseries.{t_name}', units=phase.time_options['units'])
+    t_prev = values['time']
     t_phase_prev = t_prev - t_prev[0]
-    t_initial = np.repeat(t_prev[0, 0], repeats=transcription.grid_data.num_nodes, axis=0)
-    t_duration = np.repeat(t_prev[-1, 0], repeats=transcription.grid_data.num_nodes, axis=0)
+    t_initial = np.repeat(t_prev[0, 0], repeats=grid_data.num_nodes, axis=0)
+    t_duration = np.repeat(t_prev[-1, 0], repeats=grid_data.num_nodes, axis=0)
     t = np.dot(L, t_prev)
     t_phase = np.dot(L, t_phase_prev)
     targets = get_targets(ode, 'time', phase.time_options['targets'])
@@ -159,12 +306,8 @@ def eval_ode_on_grid(phase, transcription):
     if t_duration_targets:
         p_refine.set_val('t_duration', t_duration)
 
-    state_prefix = 'states:' if phase.timeseries_options['use_prefix'] else ''
-    control_prefix = 'controls:' if phase.timeseries_options['use_prefix'] else ''
-
     for name, options in phase.state_options.items():
-        x_prev = phase.get_val(f'timeseries.{state_prefix}{name}', units=options['units'])
-        x[name] = np.dot(L, x_prev)
+        x[name] = np.dot(L, values['states'][name])
         targets = get_targets(ode, name, options['targets'])
         if targets:
             p_refine.set_val(f'states:{name}', x[name])
@@ -174,27 +317,23 @@ def eval_ode_on_grid(phase, transcription):
         rate_targets = get_targets(ode, f'{name}_rate', options['rate_targets'])
         rate2_targets = get_targets(ode, f'{name}_rate2', options['rate2_targets'])
 
-        u_prev = phase.get_val(f'timeseries.{control_prefix}{name}', units=options['units'])
-        u[name] = np.dot(L, u_prev)
+        u[name] = np.dot(L, values['controls'][name])
         if targets:
             p_refine.set_val(f'controls:{name}', u[name])
 
         if phase.timeseries_options['include_control_rates']:
             if rate_targets:
-                u_rate_prev = phase.get_val(f'timeseries.control_rates:{name}_rate')
-                u_rate[name] = np.dot(L, u_rate_prev)
+                u_rate[name] = np.dot(L, values['control_rates'][name])
                 p_refine.set_val(f'control_rates:{name}_rate', u_rate[name])
 
             if rate2_targets:
-                u_rate2_prev = phase.get_val(f'timeseries.control_rates:{name}_rate2')
-                u_rate2[name] = np.dot(L, u_rate2_prev)
+                u_rate2[name] = np.dot(L, values['control_rates2'][name])
                 p_refine.set_val(f'control_rates:{name}_rate2', u_rate2[name])
 
     # Configure the parameters
     for name, options in phase.parameter_options.items():
         targets = get_targets(ode, name, options['targets'])
-        # The value of the parameter at one node
-        param[name] = phase.get_val(f'parameter_vals:{name}', units=options['units'])[0, ...]
+        param[name] = values['parameters'][name]
         if targets:
             p_refine.set_val(f'parameters:{name}', param[name], units=options['units'])
 
@@ -259,6 +398,30 @@ def compute_state_quadratures(x_hat, f_hat, t_duration, transcription):
     transcription : Radau or GaussLobatto
         The transcription instance used to compute f_hat.
 
+    Returns
+    -------
+    dict
+        A dictionary keyed by state name containing the estimated state values at each node,
+        computed using a quadrature.
+    """
+    return _compute_state_quadratures(x_hat, f_hat, t_duration, transcription.grid_data)
+
+
+def _compute_state_quadratures(x_hat, f_hat, t_duration, grid_data):
+    """
+    Compute the integral of the given states at each node of the given grid.
+
+    Parameters
+    ----------
+    x_hat : dict of (str: float)
+        The interpolated state values at the nodes for each state.
+    f_hat : dict of (str: float)
+        State rates computed using the interpolated state values at each node.
+    t_duration : float
+        The time duration of the phase.
+    grid_data : GridData
+        The grid at whose nodes f_hat was computed.
+
     Returns
     -------
     dict
@@ -266,35 +429,219 @@ def compute_state_quadratures(x_hat, f_hat, t_duration, transcription):
         computed using a quadrature.
     """
     x_prime = {}
-    gd = transcription.grid_data
+    gd = grid_data
 
     # Build the integration matrix which integrates state values at all nodes on the new grid.
-    I = integration_matrix(gd)  # noqa: E741, allow ambiguous variable name `I`
+    I = integration_matrix(gd, sparse=True)  # noqa: E741, allow ambiguous variable name `I`
 
     left_end_idxs = gd.subset_node_indices['segment_ends'][0::2]
     all_idxs = gd.subset_node_indices['all']
-    not_left_end_idxs = np.array(sorted(set(all_idxs).difference(left_end_idxs)))
+    not_left_end_idxs = np.setdiff1d(all_idxs, left_end_idxs)
+    num_not_left_end = len(not_left_end_idxs)
 
-    dt_dstau = np.atleast_2d(0.5 * t_duration * gd.node_dptau_dstau[not_left_end_idxs]).T
+    dt_dstau = np.reshape(0.5 * t_duration * gd.node_dptau_dstau[not_left_end_idxs], (num_not_left_end, 1))
 
     if x_hat.keys() != f_hat.keys():
         raise ValueError('x_hat and f_hat don\'t contain the same states.\n'
                          f'x_hat states are: {list(x_hat.keys())}\n'
                          f'f_hat states are: {list(f_hat.keys())}')
 
-    for state_name in x_hat:
-        x_prime[state_name] = np.zeros_like(x_hat[state_name])
-        x_prime[state_name][left_end_idxs, ...] = x_hat[state_name][left_end_idxs, ...]
-        nnps = np.array(gd.subset_num_nodes_per_segment['all']) - 1
-        left_end_idxs_repeated = np.repeat(left_end_idxs, nnps)
+    nnps = np.array(gd.subset_num_nodes_per_segment['all']) - 1
+    left_end_idxs_repeated = np.repeat(left_end_idxs, nnps)
+
+    # Integrate the rates of all states at once, with each column of the stacked rates being one
+    # element of one state.
+    if x_hat:
+        f_stacked = np.hstack([np.reshape(f_hat[state_name][not_left_end_idxs, ...], (num_not_left_end, -1))
+                               for state_name in x_hat])
+        dx_stacked = dt_dstau * (I @ f_stacked)
+
+    col = 0
+    for state_name, x in x_hat.items():
+        size = int(np.prod(x.shape[1:]))
+        x_prime[state_name] = np.zeros_like(x)
+        x_prime[state_name][left_end_idxs, ...] = x[left_end_idxs, ...]
         x_prime[state_name][not_left_end_idxs, ...] = \
-            x_hat[state_name][left_end_idxs_repeated, ...] \
-            + dt_dstau * np.dot(I, f_hat[state_name][not_left_end_idxs, ...])
+            x[left_end_idxs_repeated, ...] \
+            + np.reshape(dx_stacked[:, col:col + size], (num_not_left_end,) + x.shape[1:])
+        col += size
 
     return x_prime
 
 
-def check_error(phases):
+def _get_error_estimation_transcription(phase):
+    """
+    Return the higher-order transcription of the given phase used to estimate its error.
+
+    Parameters
+    ----------
+    phase : Phase
+        The phase whose error is being estimated.
+
+    Returns
+    -------
+    Radau or GaussLobatto or None
+        A copy of the transcription of the phase with the order increased by 1 for Radau and by 2 for
+        Gauss-Lobatto, or None if the phase uses a transcription which is not refined.
+    """
+    tx = phase.options['transcription']
+    new_num_segments = tx.options['num_segments']
+    new_segment_ends = tx.options['segment_ends']
+    new_compressed = tx.options['compressed']
+    if isinstance(tx, GaussLobatto):
+        new_order = tx.options['order'] + 2
+        return GaussLobatto(num_segments=new_num_segments, order=new_order,
+                            segment_ends=new_segment_ends, compressed=new_compressed)
+    elif isinstance(tx, Radau):
+        new_order = tx.options['order'] + 1
+        return Radau(num_segments=new_num_segments, order=new_order,
+                     segment_ends=new_segment_ends, compressed=new_compressed)
+    # Only refine GuassLobatto or Radau transcription phases
+    return None
+
+
+def _compute_phase_error(phase, old_grid, new_grid, values, problem=None):
+    """
+    Compute the error in every segment of the given phase.
+
+    Parameters
+    ----------
+    phase : Phase
+        The solved phase whose error is being estimated. Only its options are used.
+    old_grid : GridData
+        The grid on which the phase was solved.
+    new_grid : GridData
+        The grid of the higher-order transcription on which the error is estimated.
+    values : dict
+        The values of the solved phase, as returned by _get_phase_values.
+    problem : Problem or None
+        A previously setup problem which evaluates the ODE of the phase on the nodes of new_grid.
+
+    Returns
+    -------
+    dict
+        The refinement results of the phase.
+    """
+    numseg = old_grid.num_segments
+
+    phase_results = {}
+
+    # Save the original grid to the refine results
+    phase_results['num_segments'] = numseg
+    phase_results['order'] = old_grid.transcription_order
+    phase_results['segment_ends'] = old_grid.segment_ends
+    phase_results['need_refinement'] = np.zeros(numseg, dtype=bool)
+    phase_results['max_rel_error'] = np.zeros(numseg, dtype=float)  # Eq. 21
+    phase_results['error_state'] = ['' for _ in phase.state_options]
+
+    # Let x be the interpolated states on the new grid
+    # Let f by the evaluated state rates given the interpolation of the states and controls
+    # onto the new grid.
+    x, _, _, f = _eval_ode_on_grid(phase, old_grid, new_grid, values, problem=problem)
+
+    # x_hat is the state value at each node computed using a quadrature
+    # from the initial state value in each segment and the computed state rates
+    # at each node in the new grid.
+    x_hat = _compute_state_quadratures(x, f, values['t_duration'], new_grid)
+
+    all_idxs = new_grid.subset_node_indices['all']
+    seg_starts = new_grid.subset_segment_indices['all'][:, 0]
+
+    for state_name in phase.state_options:
+        x_i = np.reshape(x[state_name][all_idxs, ...], (len(all_idxs), -1))
+        E_i = np.abs(np.reshape(x_hat[state_name][all_idxs, ...], x_i.shape) - x_i)  # Equation 20.1
+
+        # Equation 20.2, reduced to the maximum over the nodes and elements of the state in each segment.
+        seg_max_abs_x = np.maximum.reduceat(np.max(np.abs(x_i), axis=1), seg_starts)
+        seg_max_E = np.maximum.reduceat(np.max(E_i, axis=1), seg_starts)
+        seg_max_e = seg_max_E / (1.0 + seg_max_abs_x)
+
+        if np.any(seg_max_e > phase_results['max_rel_error']):
+            phase_results['error_state'] = state_name
+            np.maximum(phase_results['max_rel_error'], seg_max_e, out=phase_results['max_rel_error'])
+
+    phase_results['need_refinement'][:] = phase_results['max_rel_error'] > phase.refine_options['tolerance']
+
+    return phase_results
+
+
+def _init_check_error_worker(phases, problem_cache):
+    """
+    Set the phases whose errors are computed by this worker process.
+
+    Parameters
+    ----------
+    phases : dict
+        Dict of phase paths and phases, inherited from the process which forked this worker.
+    problem_cache : dict or None
+        The error estimation problems already setup by the forking process, keyed by phase path and number of
+        nodes. The worker adds the problems it sets up to its own copy.
+    """
+    global _worker_phases, _worker_problem_cache
+    _worker_phases = phases
+    _worker_problem_cache = {} if problem_cache is None else problem_cache
+
+
+def _compute_phase_error_in_worker(args):
+    """
+    Compute the error in every segment of a phase in a worker process.
+
+    Parameters
+    ----------
+    args : tuple
+        The phase path, the grid on which the phase was solved, the grid on which its error is estimated,
+        and the values of the solved phase.
+
+    Returns
+    -------
+    dict
+        The refinement results of the phase.
+    """
+    phase_path, old_grid, new_grid, values = args
+    phase = _worker_phases[phase_path]
+
+    key = (phase_path, new_grid.num_nodes)
+    if key not in _worker_problem_cache:
+        _worker_problem_cache[key] = _setup_refinement_problem(phase, new_grid)
+
+    return _compute_phase_error(phase, old_grid, new_grid, values, _worker_problem_cache[key])
+
+
+def _get_check_error_executor(phases, num_workers, problem_cache=None):
+    """
+    Return a pool of worker processes in which check_error computes the errors of the given phases.
+
+    The workers are forked from this process the first time the pool is used and inherit the phases, along
+    with any problems already in problem_cache. Only the options of the phases are used by the workers. The
+    grids and values of each phase are sent with each task, so a single pool may be used by every call to
+    check_error while the phases are solved again on refined grids.
+
+    Parameters
+    ----------
+    phases : dict
+        Dict of phase paths and phases.
+    num_workers : int
+        The maximum number of worker processes.
+    problem_cache : dict or None
+        The error estimation problems already setup, keyed by phase path and number of nodes.
+
+    Returns
+    -------
+    ProcessPoolExecutor or None
+        The pool of worker processes, or None if the errors are to be computed serially because only a single
+        worker is requested, fork is unavailable, or this process is running under MPI.
+    """
+    num_workers = min(num_workers, len(phases))
+
+    if num_workers <= 1 or (MPI and MPI.COMM_WORLD.size > 1) or \
+            'fork' not in multiprocessing.get_all_start_methods():
+        return None
+
+    return ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context('fork'),
+                               initializer=_init_check_error_worker, initargs=(phases, problem_cache))
+
+
+def check_error(phases, num_workers=1, problem_cache=None, executor=None):
     """
     Compute the error in every solved segment of the given phases.
 
@@ -302,71 +649,53 @@ def check_error(phases):
     ----------
     phases : dict
         Dict of phase paths and phases.
+    num_workers : int
+        The maximum number of processes in which the errors of the phases are computed concurrently.
+        The error of each phase is independent of the others. Ignored if executor is given.
+    problem_cache : dict or None
+        If given, the problems used to evaluate the ODE of each phase on its error estimation grid are
+        stored in this dictionary, keyed by phase path and number of nodes, and reused by subsequent calls
+        in which the same phase has the same number of error estimation nodes.
+    executor : ProcessPoolExecutor or None
+        A pool of worker processes returned by _get_check_error_executor for these phases. If None, a pool is
+        started for this call when more than one worker is requested and shut down before returning.
 
     Returns
     -------
     dict
         Indicator for which segments of each phase require grid refinement.
     """
-    refine_results = {}
+    grids = {}
 
     for phase_path, phase in phases.items():
-        refine_results[phase_path] = {}
-
-        # Save the original grid to the refine results
-        tx = phase.options['transcription']
-        gd = tx.grid_data
-        numseg = gd.num_segments
-
-        refine_results[phase_path]['num_segments'] = numseg
-        refine_results[phase_path]['order'] = gd.transcription_order
-        refine_results[phase_path]['segment_ends'] = gd.segment_ends
-        refine_results[phase_path]['need_refinement'] = np.zeros(numseg, dtype=bool)
-        refine_results[phase_path]['max_rel_error'] = np.zeros(numseg, dtype=float)  # Eq. 21
-        refine_results[phase_path]['error_state'] = ['' for _ in phase.state_options]
-
         # Instantiate a new phase as a copy of the old one, but first up the transcription order
         # by 1 for Radau and by 2 for Gauss-Lobatto
-        new_num_segments = tx.options['num_segments']
-        new_segment_ends = tx.options['segment_ends']
-        new_compressed = tx.options['compressed']
-        if isinstance(tx, GaussLobatto):
-            new_order = tx.options['order'] + 2
-            new_tx = GaussLobatto(num_segments=new_num_segments, order=new_order,
-                                  segment_ends=new_segment_ends, compressed=new_compressed)
-        elif isinstance(tx, Radau):
-            new_order = tx.options['order'] + 1
-            new_tx = Radau(num_segments=new_num_segments, order=new_order,
-                           segment_ends=new_segment_ends, compressed=new_compressed)
-        else:
-            # Only refine GuassLobatto or Radau transcription phases
-            continue
-
-        # Let x be the interpolated states on the new transcription
-        # Let f by the evaluated state rates given the interpolation of the states and controls
-        # onto the new grid.
-        x, _, _, f = eval_ode_on_grid(phase=phase, transcription=new_tx)
-
-        # x_hat is the state value at each node computed using a quadrature
-        # from the initial state value in each segment and the computed state rates
-        # at each node in the new transcription.
-        x_hat = compute_state_quadratures(x, f, phase.get_val('t_duration'), new_tx)
-
-        E = {}  # The absolute error computed in each state at each node (Eq. 20 pt 1)
-        e = {}  # The relative error computed in each state at each node (Eq. 20 pt 2)
-
-        for state_name in phase.state_options:
-            E[state_name] = np.abs(x_hat[state_name] - x[state_name])  # Equation 20.1
-            e[state_name] = np.zeros_like(E[state_name])               # Equation 20.2
-            for k in range(numseg):
-                i1, i2 = new_tx.grid_data.subset_segment_indices['all'][k, :]
-                k_idxs = new_tx.grid_data.subset_node_indices['all'][i1:i2]
-                e[state_name][k_idxs, ...] = E[state_name][k_idxs] \
-                    / (1.0 + np.max(np.abs(x[state_name][k_idxs])))
-                if np.any(np.max(e[state_name][k_idxs]) > refine_results[phase_path]['max_rel_error'][k]):
-                    refine_results[phase_path]['max_rel_error'][k] = np.max(e[state_name][k_idxs])
-                    refine_results[phase_path]['error_state'] = state_name
-                    if refine_results[phase_path]['max_rel_error'][k] > phase.refine_options['tolerance']:
-                        refine_results[phase_path]['need_refinement'][k] = True
-
-    return refine_results
+        new_tx = _get_error_estimation_transcription(phase)
+        if new_tx is not None:
+            grids[phase_path] = (phase.options['transcription'].grid_data, new_tx.grid_data)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = _get_check_error_executor(phases, num_workers, problem_cache)
+
+    if executor is None:
+        results = {}
+        for phase_path, (old_grid, new_grid) in grids.items():
+            phase = phases[phase_path]
+            key = (phase_path, new_grid.num_nodes)
+            if problem_cache is None:
+                problem = None
+            elif key in problem_cache:
+                problem = problem_cache[key]
+            else:
+                problem = problem_cache[key] = _setup_refinement_problem(phase, new_grid)
+            results[phase_path] = _compute_phase_error(phase, old_grid, new_grid, _get_phase_values(phase), problem)
+        return results
+
+    try:
+        args = [(phase_path, old_grid, new_grid, _get_phase_values(phases[phase_path]))
+                for phase_path, (old_grid, new_grid) in grids.items()]
+        return dict(zip(grids, executor.map(_compute_phase_error_in_worker, args)))
+    finally:
+        if own_executor:
+            executor.shutdown()
@@ -5,14 +5,197 @@ from .ph_adaptive.ph_adaptive import PHAdaptive
 from .hp_adaptive.hp_adaptive import HPAdaptive
 from .write_iteration import write_error, write_refine_iter
 
-from dymos.grid_refinement.error_estimation import check_error
+from dymos.grid_refinement.error_estimation import check_error, refined_grid_interpolation_matrix, \
+    _get_check_error_executor
 from dymos.load_case import find_phases
+from dymos.utils.misc import _abs2prom
 
 import numpy as np
 import sys
 
 
-def _refine_iter(problem, refine_iteration_limit=0, refine_method='hp', case_prefix=None, reset_iter_counts=True):
+def _is_in_systems(abs_name, sys_paths):
+    """
+    Return True if the given absolute variable name belongs to any of the given systems.
+
+    Parameters
+    ----------
+    abs_name : str
+        The absolute name of a variable.
+    sys_paths : Iterable of str
+        The pathnames of the systems.
+
+    Returns
+    -------
+    bool
+        True if the variable belongs to any of the systems.
+    """
+    return any(abs_name.startswith(f'{path}.') for path in sys_paths)
+
+
+def _get_model_values(model):
+    """
+    Return a copy of the value of every output in the model.
+
+    Outputs of the automatic IndepVarComp are keyed by the absolute name of an input which they feed,
+    since their own names are assigned during setup.
+
+    Parameters
+    ----------
+    model : System
+        The model whose values are copied.
+
+    Returns
+    -------
+    dict
+        The flat value of each output, keyed by its absolute name.
+    """
+    values = {}
+
+    for abs_name, meta in model.list_outputs(val=True, prom_name=False, out_stream=None):
+        if isinstance(meta['val'], np.ndarray):
+            values[abs_name] = meta['val'].ravel().copy()
+
+    auto_ivcs = set()
+    for abs_in, _ in model.list_inputs(val=False, prom_name=False, out_stream=None):
+        src = model.get_source(abs_in)
+        if src.startswith('_auto_ivc.') and src not in auto_ivcs:
+            auto_ivcs.add(src)
+            val = model.get_val(src, flat=True)
+            if isinstance(val, np.ndarray):
+                values[abs_in] = val.copy()
+
+    return values
+
+
+def _set_model_values(model, values, exclude_paths=()):
+    """
+    Set values previously returned by _get_model_values into a model which has been setup again.
+
+    Values belonging to the systems in exclude_paths, or whose size no longer matches that of the variable,
+    are skipped.
+
+    Parameters
+    ----------
+    model : System
+        The model which has been setup again.
+    values : dict
+        The values returned by _get_model_values.
+    exclude_paths : Iterable of str
+        The pathnames of the systems whose values are not set.
+    """
+    outputs = {abs_name for abs_name, _ in model.list_outputs(val=False, prom_name=False, out_stream=None)}
+    inputs = {abs_name for abs_name, _ in model.list_inputs(val=False, prom_name=False, out_stream=None)}
+
+    for key, val in values.items():
+        if _is_in_systems(key, exclude_paths):
+            continue
+        if key in outputs:
+            src = key
+        elif key in inputs and model.get_source(key).startswith('_auto_ivc.'):
+            src = model.get_source(key)
+        else:
+            continue
+        if np.size(model.get_val(src)) == val.size:
+            model.set_val(src, val)
+
+
+def _get_phase_solutions(model, phase_paths):
+    """
+    Return the outputs of the given phases in the form accepted by Phase.load_case.
+
+    Parameters
+    ----------
+    model : System
+        The model containing the phases.
+    phase_paths : Iterable of str
+        The pathnames of the phases.
+
+    Returns
+    -------
+    dict
+        A dictionary with keys 'inputs' and 'outputs', in the format returned by list_inputs and
+        list_outputs with units=True, prom_name=True, and return_format='dict'.
+    """
+    abs2meta = model._var_allprocs_abs2meta['output']
+
+    outputs = {abs_name: {'val': np.copy(val),
+                          'units': abs2meta[abs_name]['units'],
+                          'prom_name': _abs2prom(model, abs_name)}
+               for abs_name, val in model._outputs._abs_item_iter(flat=False)
+               if _is_in_systems(abs_name, phase_paths)}
+
+    return {'inputs': {}, 'outputs': outputs}
+
+
+def _get_warm_start_values(phase):
+    """
+    Return the values of the states and controls of the given phase at all nodes of its grid.
+
+    Parameters
+    ----------
+    phase : Phase
+        A solved phase whose grid is about to be refined.
+
+    Returns
+    -------
+    dict
+        The values of each state and control at all nodes, in the units of the variable, keyed by
+        'states' and 'controls', or None if the timeseries of the phase is not provided at all nodes.
+    """
+    prefix = phase.timeseries_options['use_prefix']
+    num_nodes = phase.options['transcription'].grid_data.num_nodes
+
+    values = {'states': {}, 'controls': {}}
+
+    for name, options in phase.state_options.items():
+        values['states'][name] = phase.get_val(f'timeseries.{"states:" if prefix else ""}{name}',
+                                               units=options['units'])
+
+    for name, options in phase.control_options.items():
+        if options['control_type'] == 'full':
+            values['controls'][name] = phase.get_val(f'timeseries.{"controls:" if prefix else ""}{name}',
+                                                     units=options['units'])
+
+    if any(val.shape[0] != num_nodes for vals in values.values() for val in vals.values()):
+        return None
+
+    return values
+
+
+def _set_warm_start_values(phase, old_grid, values):
+    """
+    Set the states and controls of a refined phase by polynomial interpolation of the solution on its old grid.
+
+    The states and controls are evaluated using the same interpolating polynomials as the transcription on
+    the old grid, so the collocation defects of the new grid begin near zero.
+
+    Parameters
+    ----------
+    phase : Phase
+        The phase whose transcription has been refined and setup.
+    old_grid : GridData
+        The grid on which the phase was previously solved.
+    values : dict
+        The values of the states and controls on the old grid, as returned by _get_warm_start_values.
+    """
+    new_grid = phase.options['transcription'].grid_data
+    L = refined_grid_interpolation_matrix(old_grid, new_grid)
+
+    for var_type, subset, var_options in (('states', 'state_input', phase.state_options),
+                                          ('controls', 'control_input', phase.control_options)):
+        idxs = new_grid.subset_node_indices[subset]
+        for name, old_val in values[var_type].items():
+            options = var_options[name]
+            new_val = np.reshape(L @ np.reshape(old_val, (old_grid.num_nodes, -1)),
+                                 (new_grid.num_nodes,) + old_val.shape[1:])[idxs, ...]
+            if options['lower'] is not None or options['upper'] is not None:
+                new_val = new_val.clip(options['lower'], options['upper'])
+            phase.set_val(f'{var_type}:{name}', new_val, units=options['units'])
+
+
+def _refine_iter(problem, refine_iteration_limit=0, refine_method='hp', case_prefix=None, reset_iter_counts=True,
+                 num_workers=1):
     """
     This function performs grid refinement for a phases in which solve_segments is true.
 
@@ -28,6 +211,8 @@ def _refine_iter(problem, refine_iteration_limit=0, refine_method='hp', case_pre
         Prefix to prepend to coordinates when recording.
     reset_iter_counts : bool
         If True and model has been run previously, reset all iteration counters.
+    num_workers : int
+        The maximum number of processes in which the errors of the phases are estimated concurrently.
     """
     phases = find_phases(problem.model)
     refinement_methods = {'hp': HPAdaptive, 'ph': PHAdaptive}
@@ -41,38 +226,59 @@ def _refine_iter(problem, refine_iteration_limit=0, refine_method='hp', case_pre
         out_file = 'grid_refinement.out'
 
         ref = refinement_methods[refine_method](phases)
+
+        # Error estimation problems are reused by phases whose grids are unchanged between iterations, and a
+        # single pool of worker processes estimates the errors of every iteration.
+        error_problems = {}
+        executor = _get_check_error_executor(phases, num_workers, error_problems)
         with open(out_file, 'w+') as f:
-            for i in range(1, refine_iteration_limit + 1):
-                refine_results = check_error(phases)
+            try:
+                for i in range(1, refine_iteration_limit + 1):
+                    refine_results = check_error(phases, problem_cache=error_problems, executor=executor)
+
+                    refined_phases = [phase_path for phase_path in refine_results if
+                                      phases[phase_path].refine_options['refine'] and
+                                      np.any(refine_results[phase_path]['need_refinement'])]
+
+                    for stream in f, sys.stdout:
+                        write_error(stream, i, phases, refine_results)
 
-                refined_phases = [phase_path for phase_path in refine_results if
-                                  phases[phase_path].refine_options['refine'] and
-                                  np.any(refine_results[phase_path]['need_refinement'])]
+                    if not refined_phases:
+                        break
 
-                for stream in f, sys.stdout:
-                    write_error(stream, i, phases, refine_results)
+                    # Save the solution of each refined phase on its current grid, before the grid is refined.
+                    prev_grids = {}
+                    warm_start_vals = {}
+                    for phase_path in refined_phases:
+                        vals = _get_warm_start_values(phases[phase_path])
+                        if vals is not None:
+                            prev_grids[phase_path] = phases[phase_path].options['transcription'].grid_data
+                            warm_start_vals[phase_path] = vals
 
-                if not refined_phases:
-                    break
+                    ref.refine(refine_results, i)
 
-                ref.refine(refine_results, i)
+                    for stream in f, sys.stdout:
+                        write_refine_iter(stream, i, phases, refine_results)
 
-                for stream in f, sys.stdout:
-                    write_refine_iter(stream, i, phases, refine_results)
+                    # Only the refined phases need their solutions interpolated onto their new grids.
+                    # Every other value in the model is copied directly back into place after setup.
+                    prev_vals = _get_model_values(problem.model)
+                    prev_soln = _get_phase_solutions(problem.model, refined_phases)
 
-                prev_soln = {
-                    'inputs': problem.model.list_inputs(out_stream=None, return_format='dict',
-                                                        units=True, prom_name=True),
-                    'outputs': problem.model.list_outputs(out_stream=None, return_format='dict',
-                                                          units=True, prom_name=True)
-                }
+                    problem.setup()
+                    problem.final_setup()
 
-                problem.setup()
-                for phase_path in refined_phases:
-                    phs = problem.model._get_subsystem(phase_path)
-                    phs.load_case(prev_soln)
+                    _set_model_values(problem.model, prev_vals, exclude_paths=refined_phases)
+                    for phase_path in refined_phases:
+                        phs = problem.model._get_subsystem(phase_path)
+                        phs.load_case(prev_soln)
+                        if phase_path in warm_start_vals:
+                            _set_warm_start_values(phs, prev_grids[phase_path], warm_start_vals[phase_path])
 
-                failed = problem.run_driver(case_prefix=f'{_case_prefix}{refine_method}_{i}_')
+                    failed = problem.run_driver(case_prefix=f'{_case_prefix}{refine_method}_{i}_')
+            finally:
+                if executor is not None:
+                    executor.shutdown()
 
             for stream in [f, sys.stdout]:
                 if i == refine_iteration_limit - 1:
@@ -1,4 +1,6 @@
+from types import SimpleNamespace
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -8,7 +10,11 @@ from openmdao.utils.testing_utils import use_tempdirs, require_pyoptsparse
 
 import dymos as dm
 from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
-from dymos.grid_refinement.error_estimation import eval_ode_on_grid, compute_state_quadratures
+from dymos.grid_refinement import error_estimation
+from dymos.grid_refinement.error_estimation import eval_ode_on_grid, compute_state_quadratures, check_error, \
+    refined_grid_interpolation_matrix, _get_check_error_executor
+from dymos.transcriptions.grid_data import GaussLobattoGrid, RadauGrid
+from dymos.load_case import find_phases
 
 from openmdao.utils.general_utils import set_pyoptsparse_opt
 OPT, OPTIMIZER = set_pyoptsparse_opt('SLSQP', fallback=True)
@@ -115,3 +121,120 @@ class TestBrachistochroneExample(unittest.TestCase):
                             assert_near_equal(x[name].ravel(), x_solution.ravel())
                             assert_near_equal(f[name].ravel(), f_solution.ravel())
                             assert_near_equal(x_hat[name], x[name], tolerance=err_tol)
+
+
+@use_tempdirs
+class TestCheckError(unittest.TestCase):
+
+    def _make_problem(self):
+        p = om.Problem(model=om.Group())
+
+        traj = p.model.add_subsystem('traj0', dm.Trajectory())
+
+        for name, tx in (('phase0', dm.Radau(num_segments=5, order=3, compressed=False)),
+                         ('phase1', dm.GaussLobatto(num_segments=4, order=3, compressed=False)),
+                         ('phase2', dm.Radau(num_segments=3, order=5))):
+            phase = traj.add_phase(name, dm.Phase(ode_class=BrachistochroneODE, transcription=tx))
+            phase.set_time_options(fix_initial=True, fix_duration=True)
+            phase.add_state('x', fix_initial=True)
+            phase.add_state('y', fix_initial=True)
+            phase.add_state('v', fix_initial=True)
+            phase.add_control('theta', units='deg', lower=0.01, upper=179.9)
+            phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+
+        p.setup()
+        self._set_values(p)
+
+        return p
+
+    def _set_values(self, p, theta_final=100):
+        for name, theta in (('phase0', [5, theta_final]), ('phase1', [20, 80]), ('phase2', [50, 60])):
+            phase = p.model.traj0.phases._get_subsystem(name)
+            phase.set_time_val(initial=0.0, duration=2.0)
+            phase.set_state_val('x', [0, 10])
+            phase.set_state_val('y', [10, 5])
+            phase.set_state_val('v', [0, 9.9])
+            phase.set_control_val('theta', theta)
+
+        p.run_model()
+
+    def _assert_results_equal(self, results, expected):
+        self.assertEqual(results.keys(), expected.keys())
+        for phase_path, phase_results in expected.items():
+            with self.subTest(phase_path):
+                assert_near_equal(results[phase_path]['max_rel_error'], phase_results['max_rel_error'],
+                                  tolerance=1.0E-12)
+                np.testing.assert_array_equal(results[phase_path]['need_refinement'],
+                                              phase_results['need_refinement'])
+
+    def test_check_error_cached_and_concurrent(self):
+        p = self._make_problem()
+        phases = find_phases(p.model)
+
+        expected = check_error(phases)
+
+        problem_cache = {}
+        results_1 = check_error(phases, problem_cache=problem_cache)
+        cached_problems = dict(problem_cache)
+        results_2 = check_error(phases, num_workers=2, problem_cache=problem_cache)
+
+        # The error estimation problems are setup once and reused while the grids are unchanged.
+        self.assertEqual(len(cached_problems), len(phases))
+        for key, prob in problem_cache.items():
+            self.assertIs(prob, cached_problems[key])
+
+        for results in (results_1, results_2):
+            self._assert_results_equal(results, expected)
+
+    def test_check_error_executor_reused(self):
+        p = self._make_problem()
+        phases = find_phases(p.model)
+
+        executor = _get_check_error_executor(phases, num_workers=2)
+        if executor is None:
+            raise unittest.SkipTest('fork is not available')
+
+        try:
+            self._assert_results_equal(check_error(phases, executor=executor), check_error(phases))
+
+            # The workers use the values and grids of the phases at the time of each call, not those inherited
+            # when they were forked.
+            tx = phases['traj0.phases.phase0'].options['transcription']
+            tx.options['num_segments'] = 7
+            tx.init_grid()
+            p.setup()
+            self._set_values(p, theta_final=120)
+
+            expected = check_error(phases)
+            self.assertEqual(expected['traj0.phases.phase0']['num_segments'], 7)
+            self._assert_results_equal(check_error(phases, executor=executor), expected)
+        finally:
+            executor.shutdown()
+
+    def test_check_error_serial_under_mpi(self):
+        p = self._make_problem()
+        phases = find_phases(p.model)
+
+        with mock.patch.object(error_estimation, 'MPI', SimpleNamespace(COMM_WORLD=SimpleNamespace(size=2))):
+            self.assertIsNone(_get_check_error_executor(phases, num_workers=2))
+
+        self.assertIsNone(_get_check_error_executor(phases, num_workers=1))
+
+
+class TestRefinedGridInterpolationMatrix(unittest.TestCase):
+
+    def test_polynomial_reproduced_on_refined_grid(self):
+        # A cubic is represented exactly on each segment of the old grid, so interpolating it onto a grid
+        # with split segments and increased order reproduces it exactly.
+        for grid_class in (RadauGrid, GaussLobattoGrid):
+            old_grid = grid_class(num_segments=3, nodes_per_seg=5,
+                                  segment_ends=np.array([-1.0, -0.2, 0.5, 1.0]), compressed=True)
+            new_grid = grid_class(num_segments=5, nodes_per_seg=[5, 7, 5, 7, 5],
+                                  segment_ends=np.array([-1.0, -0.6, -0.2, 0.1, 0.5, 1.0]), compressed=True)
+
+            L = refined_grid_interpolation_matrix(old_grid, new_grid)
+
+            f = np.polynomial.Polynomial([1.0, 1.0, -2.0, 1.0])
+            with self.subTest(grid_class.__name__):
+                self.assertEqual(L.shape, (new_grid.num_nodes, old_grid.num_nodes))
+                assert_near_equal(L @ f(old_grid.node_ptau), f(new_grid.node_ptau), tolerance=1.0E-12)
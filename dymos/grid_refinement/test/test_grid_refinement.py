@@ -3,8 +3,11 @@ import unittest
 
 import numpy as np
 import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.grid_refinement.refinement import _get_model_values, _get_phase_solutions, _set_model_values
 
 
 class _BrysonDenhamODE(om.ExplicitComponent):
@@ -143,5 +146,69 @@ class TestGridRefinement(unittest.TestCase):
         self.assertGreaterEqual(sum(seg_orders), 5 * 3)
 
 
+@use_tempdirs
+class TestRefinementValueTransfer(unittest.TestCase):
+
+    def test_values_restored_after_refinement_setup(self):
+        p = om.Problem()
+
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+        traj.add_parameter('g', units='m/s**2', val=9.80665, opt=False, static_target=True)
+
+        for name in ('phase0', 'phase1'):
+            phase = traj.add_phase(name, dm.Phase(ode_class=BrachistochroneODE,
+                                                  transcription=dm.Radau(num_segments=4, order=3)))
+            phase.set_time_options(fix_initial=True, fix_duration=True)
+            phase.add_state('x', fix_initial=True)
+            phase.add_state('y', fix_initial=True)
+            phase.add_state('v', fix_initial=True)
+            phase.add_control('theta', units='deg', lower=0.01, upper=179.9)
+            phase.add_parameter('g', units='m/s**2', opt=False)
+
+        p.setup()
+
+        traj.set_parameter_val('g', 1.62)
+        for name, duration in (('phase0', 2.0), ('phase1', 3.0)):
+            phase = traj.phases._get_subsystem(name)
+            phase.set_time_val(initial=0.0, duration=duration)
+            phase.set_state_val('x', [0, 10])
+            phase.set_state_val('y', [10, 5])
+            phase.set_state_val('v', [0, 9.9])
+            phase.set_control_val('theta', [5, 100])
+
+        p.run_model()
+
+        phase1_x = p.get_val('traj.phase1.states:x').copy()
+        phase1_theta = p.get_val('traj.phase1.controls:theta').copy()
+
+        # Refine phase0 and setup again, restoring the previous values.
+        refined_phases = ['traj.phases.phase0']
+        prev_vals = _get_model_values(p.model)
+        prev_soln = _get_phase_solutions(p.model, refined_phases)
+
+        traj.phases.phase0.options['transcription'].options['order'] = 5
+        traj.phases.phase0.options['transcription'].init_grid()
+
+        p.setup()
+        p.final_setup()
+
+        _set_model_values(p.model, prev_vals, exclude_paths=refined_phases)
+        traj.phases.phase0.load_case(prev_soln)
+
+        p.run_model()
+
+        # The unrefined phase and the trajectory parameters retain their values.
+        assert_near_equal(p.get_val('traj.phase1.states:x'), phase1_x)
+        assert_near_equal(p.get_val('traj.phase1.controls:theta'), phase1_theta)
+        assert_near_equal(p.get_val('traj.phase1.t_duration'), 3.0)
+        assert_near_equal(p.get_val('traj.parameters:g'), 1.62)
+
+        # The refined phase is interpolated onto its new grid.
+        x0 = p.get_val('traj.phase0.timeseries.x')
+        self.assertEqual(x0.shape[0], 4 * 6)
+        assert_near_equal(p.get_val('traj.phase0.t_duration'), 2.0)
+        assert_near_equal(x0[[0, -1], 0], [0.0, 10.0], tolerance=1.0E-12)
+
+
 if __name__ == '__main__':
     unittest.main()
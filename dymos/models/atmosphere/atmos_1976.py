@@ -1429,6 +1429,141 @@ USatm1976Data.akima_dT = \
               [-1.1352152426520887e-03, 2.2984460541655878e-08, -1.0557396818103798e-12, -2.1855394583432683e-17],
               [-1.0328000000000006e-03, -4.6869514695815243e-09, 0.0000000000000000e+00, 0.0000000000000000e+00]])
 
+# The Akima coefficients of all tables stacked with shape (num_bins, num_tables, 4) so that every
+# table is evaluated from a single gather of the coefficients in the bin of each altitude.
+_TEMP, _PRES, _RHO, _VISC, _DRHO, _DT = range(6)
+_akima_coeffs = np.stack((USatm1976Data.akima_T, USatm1976Data.akima_P, USatm1976Data.akima_rho,
+                          USatm1976Data.akima_viscosity, USatm1976Data.akima_drho, USatm1976Data.akima_dT),
+                         axis=1)
+_h_bin_left = np.hstack((USatm1976Data.alt[0], USatm1976Data.alt))
+
+
+def _resample_akima_coefs(coeffs, spacing):
+    """
+    Resample the Akima coefficients of the atmosphere tables onto a uniform altitude grid.
+
+    Each altitude in the table must lie on the uniform grid.  The cubic polynomials of the original
+    bins are then re-expanded about the left end of each uniform bin, which is exact.
+
+    Parameters
+    ----------
+    coeffs : ndarray
+        The Akima coefficients of the tables at the points of USatm1976Data.alt, with shape (num_bins, ..., 4).
+    spacing : float
+        The spacing of the uniform altitude grid, in feet.
+
+    Returns
+    -------
+    alt : ndarray
+        The altitudes of the uniform grid.
+    uniform_coeffs : ndarray
+        The Akima coefficients of the tables at the altitudes of the uniform grid.
+    """
+    alt_min = USatm1976Data.alt[0]
+    alt_max = USatm1976Data.alt[-1]
+    alt = alt_min + spacing * np.arange(int(round((alt_max - alt_min) / spacing)) + 1)
+
+    if not np.allclose(np.round((USatm1976Data.alt - alt_min) / spacing), (USatm1976Data.alt - alt_min) / spacing):
+        raise ValueError(f'The atmosphere table altitudes do not lie on a uniform grid with a spacing of {spacing} ft.')
+
+    # The original bin in which each uniform bin (including the extrapolation bins) lies.
+    bin_mid = np.hstack((alt[0] - 0.5 * spacing, alt[:-1] + 0.5 * spacing, alt[-1] + 0.5 * spacing))
+    idx = np.searchsorted(USatm1976Data.alt, bin_mid, side='left')
+
+    # Shift each cubic from the left end of the original bin to the left end of the uniform bin.
+    shape = (len(idx),) + (1,) * (coeffs.ndim - 2)
+    s = np.reshape(np.hstack((alt[0], alt)) - _h_bin_left[idx], shape)
+    a, b, c, d = np.moveaxis(coeffs[idx], -1, 0)
+
+    uniform_coeffs = np.stack((a + s * (b + s * (c + s * d)),
+                               b + s * (2.0 * c + 3.0 * d * s),
+                               c + 3.0 * d * s,
+                               d), axis=-1)
+
+    return alt, uniform_coeffs
+
+
+# The Akima coefficients resampled onto a uniform altitude grid, on which the bin of each altitude is
+# found by integer division rather than by binary search.
+_UNIFORM_SPACING = 1000.0
+_uniform_alt, _uniform_akima_coeffs = _resample_akima_coefs(_akima_coeffs, _UNIFORM_SPACING)
+_uniform_h_bin_left = np.hstack((_uniform_alt[0], _uniform_alt))
+
+
+def _evaluate_akima_coefs(coeffs, dx):
+    """
+    Evaluate the Akima polynomials of every table and their derivatives.
+
+    Parameters
+    ----------
+    coeffs : ndarray
+        The Akima coefficients of each table in the bin of each altitude, with shape (num_nodes, num_tables, 4).
+    dx : ndarray
+        The distance of each altitude from the left end of its bin, with shape (num_nodes, 1).
+
+    Returns
+    -------
+    values : ndarray
+        The value of each table at each altitude, with shape (num_nodes, num_tables).
+    derivs : ndarray
+        The derivative of each table with respect to geopotential altitude, with shape (num_nodes, num_tables).
+    """
+    a = coeffs[..., 0]
+    b = coeffs[..., 1]
+    c = coeffs[..., 2]
+    d = coeffs[..., 3]
+
+    values = a + dx * (b + dx * (c + dx * d))
+    derivs = b + dx * (2.0 * c + 3.0 * d * dx)
+
+    return values, derivs
+
+
+def _akima_lookup(z):
+    """
+    Evaluate every atmosphere table and its derivative at the given geopotential altitudes.
+
+    Parameters
+    ----------
+    z : ndarray
+        Geopotential altitude in feet.
+
+    Returns
+    -------
+    values : ndarray
+        The value of each table at each altitude, with shape (num_nodes, num_tables).
+    derivs : ndarray
+        The derivative of each table with respect to geopotential altitude, with shape (num_nodes, num_tables).
+    """
+    idx = np.searchsorted(USatm1976Data.alt, z, side='left')
+    dx = (z - _h_bin_left[idx])[:, np.newaxis]
+
+    return _evaluate_akima_coefs(_akima_coeffs[idx], dx)
+
+
+def _uniform_akima_lookup(z):
+    """
+    Evaluate every atmosphere table and its derivative using the coefficients on the uniform altitude grid.
+
+    Parameters
+    ----------
+    z : ndarray
+        Geopotential altitude in feet.
+
+    Returns
+    -------
+    values : ndarray
+        The value of each table at each altitude, with shape (num_nodes, num_tables).
+    derivs : ndarray
+        The derivative of each table with respect to geopotential altitude, with shape (num_nodes, num_tables).
+    """
+    # Bins are closed on the right, consistent with searchsorted(..., side='left') in _akima_lookup.
+    idx = np.ceil((np.real(z) - _uniform_alt[0]) / _UNIFORM_SPACING)
+    idx = np.clip(idx, 0, len(_uniform_alt)).astype(int)
+    dx = (z - _uniform_h_bin_left[idx])[:, np.newaxis]
+
+    return _evaluate_akima_coefs(_uniform_akima_coeffs[idx], dx)
+
 
 class USatm1976Comp(om.ExplicitComponent):
     """
@@ -1460,6 +1595,9 @@ class USatm1976Comp(om.ExplicitComponent):
                                   'it will be converted to geopotential based on Equation 19 in the original standard.')
         self.options.declare('output_dsos_dh', types=bool, default=False,
                              desc='If true, the derivative of the speed of sound will be added as an output')
+        self.options.declare('uniform_table', types=bool, default=False,
+                             desc='If True, interpolate the tables resampled onto a uniform altitude grid, so that '
+                                  'the bin of each altitude is found by integer division rather than binary search.')
 
     def setup(self):
         """
@@ -1470,6 +1608,7 @@ class USatm1976Comp(om.ExplicitComponent):
 
         self._geodetic = self.options['h_def'] == 'geodetic'
         self._R0 = 6_356_766 / 0.3048  # Value of R0 from the original standard (m -> ft)
+        self._lookup_cache = None
 
         self.add_input('h', val=1. * np.ones(nn), units='ft')
 
@@ -1488,6 +1627,37 @@ class USatm1976Comp(om.ExplicitComponent):
         if output_dsos_dh:
             self.declare_partials('dsos_dh', 'h', rows=arange, cols=arange)
 
+    def _lookup(self, h):
+        """
+        Return the table values and derivatives at the given altitude, reusing those of the previous call if possible.
+
+        The lookup performed by compute is shared with the subsequent call to compute_partials at the same point.
+
+        Parameters
+        ----------
+        h : ndarray
+            The altitude input of the component, in feet.
+
+        Returns
+        -------
+        values : ndarray
+            The value of each table at each altitude, with shape (num_nodes, num_tables).
+        derivs : ndarray
+            The derivative of each table with respect to geopotential altitude, with shape (num_nodes, num_tables).
+        """
+        cache = self._lookup_cache
+        if cache is not None and cache[0].dtype == h.dtype and np.array_equal(cache[0], h):
+            return cache[1], cache[2]
+
+        z = h / (self._R0 + h) * self._R0 if self._geodetic else h  # Equation 19 from the original standard.
+        if self.options['uniform_table']:
+            values, derivs = _uniform_akima_lookup(z)
+        else:
+            values, derivs = _akima_lookup(z)
+        self._lookup_cache = (h.copy(), values, derivs)
+
+        return values, derivs
+
     def compute(self, inputs, outputs):
         """
         Interpolate atmospheric properties for a given altitude.
@@ -1499,38 +1669,20 @@ class USatm1976Comp(om.ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        table_points = USatm1976Data.alt
-        h = inputs['h']
         output_dsos_dh = self.options['output_dsos_dh']
 
-        if self._geodetic:
-            h = h / (self._R0 + h) * self._R0  # Equation 19 from the original standard.
-
-        # From this point forward, h is geopotential altitude (z in the original reference).
+        values, derivs = self._lookup(inputs['h'])
 
-        idx = np.searchsorted(table_points, h, side='left')
-        h_bin_left = np.hstack((table_points[0], table_points))
-        dx = h - h_bin_left[idx]
-
-        coeffs = USatm1976Data.akima_T[idx]
-        T = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
+        T = values[:, _TEMP]
         outputs['temp'] = T
+        outputs['pres'] = values[:, _PRES]
+        outputs['rho'] = values[:, _RHO]
+        outputs['drhos_dh'] = derivs[:, _RHO]
+        outputs['viscosity'] = values[:, _VISC]
 
-        coeffs = USatm1976Data.akima_P[idx]
-        outputs['pres'] = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-
-        coeffs = USatm1976Data.akima_rho[idx]
-        outputs['rho'] = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-        outputs['drhos_dh'] = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-
-        coeffs = USatm1976Data.akima_viscosity[idx]
-        outputs['viscosity'] = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-
-        outputs['sos'] = np.sqrt(self._K * outputs['temp'])
+        outputs['sos'] = np.sqrt(self._K * T)
         if output_dsos_dh:
-            coeffs = USatm1976Data.akima_dT[idx]
-            dT_dh = (coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))).ravel()
-            outputs['dsos_dh'] = (0.5 / np.sqrt(self._K * T) * dT_dh * self._K)
+            outputs['dsos_dh'] = (0.5 / np.sqrt(self._K * T) * values[:, _DT] * self._K)
 
     def compute_partials(self, inputs, partials):
         """
@@ -1543,47 +1695,26 @@ class USatm1976Comp(om.ExplicitComponent):
         partials : Jacobian
             Subjac components written to partials[output_name, input_name].
         """
-        table_points = USatm1976Data.alt
         h = inputs['h']
         dz_dh = 1.0
         output_dsos_dh = self.options['output_dsos_dh']
 
         if self._geodetic:
             dz_dh = (self._R0 / (self._R0 + h)) ** 2
-            h = h / (self._R0 + h) * self._R0  # Equation 19 from the original standard.
-
-        # From this point forward, h is geopotential altitude (z in the original reference).
-
-        idx = np.searchsorted(table_points, h, side='left')
-        h_index = np.hstack((table_points[0], table_points))
-        dx = h - h_index[idx]
-
-        coeffs = USatm1976Data.akima_T[idx]
-        dT_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-        T = coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))
-
-        coeffs = USatm1976Data.akima_P[idx]
-        dP_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
-
-        coeffs = USatm1976Data.akima_rho[idx]
-        drho_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
 
-        coeffs = USatm1976Data.akima_viscosity[idx]
-        dvisc_dh = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
+        values, derivs = self._lookup(h)
 
-        coeffs = USatm1976Data.akima_drho[idx]
-        d2rho_dh2 = coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)
+        T = values[:, _TEMP]
+        dT_dh = derivs[:, _TEMP]
 
-        partials['temp', 'h'][...] = dT_dh.ravel()
-        partials['pres', 'h'][...] = dP_dh.ravel()
-        partials['rho', 'h'][...] = drho_dh.ravel()
-        partials['viscosity', 'h'][...] = dvisc_dh.ravel()
-        partials['drhos_dh', 'h'][...] = d2rho_dh2.ravel()
+        partials['temp', 'h'][...] = dT_dh
+        partials['pres', 'h'][...] = derivs[:, _PRES]
+        partials['rho', 'h'][...] = derivs[:, _RHO]
+        partials['viscosity', 'h'][...] = derivs[:, _VISC]
+        partials['drhos_dh', 'h'][...] = derivs[:, _DRHO]
         partials['sos', 'h'][...] = (0.5 / np.sqrt(self._K * T) * partials['temp', 'h'] * self._K)
         if output_dsos_dh:
-            coeffs = USatm1976Data.akima_dT[idx]
-            _dT_dh = (coeffs[:, 0] + dx * (coeffs[:, 1] + dx * (coeffs[:, 2] + dx * coeffs[:, 3]))).ravel()
-            d2T_dh2 = (coeffs[:, 1] + dx * (2.0 * coeffs[:, 2] + 3.0 * coeffs[:, 3] * dx)).ravel()
+            d2T_dh2 = derivs[:, _DT]
             partials['dsos_dh', 'h'] = 0.5 * np.sqrt(self._K / T) * (d2T_dh2 - 0.5 * dT_dh**2 / T)
 
         if self._geodetic:
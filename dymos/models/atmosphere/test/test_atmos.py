@@ -1,9 +1,12 @@
 import unittest
+from unittest import mock
+
 import numpy as np
 
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials
 
+from dymos.models.atmosphere import atmos_1976
 from dymos.models.atmosphere.atmos_1976 import USatm1976Comp, USatm1976Data, _build_akima_coefs
 from scipy.interpolate import Akima1DInterpolator
 
@@ -99,6 +102,61 @@ class TestAtmosphere(unittest.TestCase):
             saved_vals = getattr(USatm1976Data, key.split('.')[-1])
             assert_near_equal(vals, saved_vals, tolerance=1.0E-15)
 
+    def test_atmos_lookup_shared_with_partials(self):
+        n = 20
+
+        p = om.Problem(model=om.Group())
+        p.model.add_subsystem('atmos', subsys=USatm1976Comp(num_nodes=n), promotes_inputs=['h'])
+        p.setup()
+        p.set_val('h', np.linspace(0, 50000, n), units='ft')
+
+        with mock.patch.object(atmos_1976, '_akima_lookup', wraps=atmos_1976._akima_lookup) as lookup:
+            p.run_model()
+            p.compute_totals(of=['atmos.rho', 'atmos.sos'], wrt=['h'])
+            self.assertEqual(lookup.call_count, 1)
+
+            p.set_val('h', np.linspace(1000, 60000, n), units='ft')
+            p.run_model()
+            totals = p.compute_totals(of=['atmos.rho'], wrt=['h'])
+            self.assertEqual(lookup.call_count, 2)
+
+        assert_near_equal(np.diag(totals['atmos.rho', 'h']), p.get_val('atmos.drhos_dh'), tolerance=1.0E-12)
+
+    def test_uniform_table_lookup(self):
+        # Include every table point, points within each bin, and points in the extrapolation bins.
+        z = np.hstack((USatm1976Data.alt,
+                       np.random.default_rng(0).uniform(-20000, 260000, 10000),
+                       [-15500.0, 250500.0]))
+
+        values, derivs = atmos_1976._akima_lookup(z)
+        uniform_values, uniform_derivs = atmos_1976._uniform_akima_lookup(z)
+
+        assert_near_equal(uniform_values, values, tolerance=1.0E-12)
+        assert_near_equal(uniform_derivs, derivs, tolerance=1.0E-10)
+
+    def test_atmos_comp_uniform_table(self):
+        n = USatm1976Data.alt.size
+
+        p = om.Problem(model=om.Group())
+        p.model.add_subsystem('atmos', subsys=USatm1976Comp(num_nodes=n, h_def='geodetic', output_dsos_dh=True,
+                                                            uniform_table=True),
+                              promotes_inputs=['h'])
+        p.setup(force_alloc_complex=True)
+
+        h = USatm1976Data.alt * 0.3048  # altitude data in meters
+        R0 = 6_356_766  # US 1976 std atm R0 in m
+        p.set_val('h', R0 / (R0 - h) * h, units='m')  # US 1976 std atm geopotential altitude to geodetic (m)
+
+        p.run_model()
+
+        assert_near_equal(p.get_val('atmos.temp', units='degR'), USatm1976Data.T, tolerance=1.0E-4)
+        assert_near_equal(p.get_val('atmos.pres', units='psi'), USatm1976Data.P, tolerance=1.0E-4)
+        assert_near_equal(p.get_val('atmos.rho', units='slug/ft**3'), USatm1976Data.rho, tolerance=1.0E-4)
+        assert_near_equal(p.get_val('atmos.sos', units='ft/s'), USatm1976Data.a, tolerance=1.0E-4)
+
+        cpd = p.check_partials(method='cs', out_stream=None)
+        assert_check_partials(cpd)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
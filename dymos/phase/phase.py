@@ -2951,55 +2951,56 @@ class Phase(om.Group):
         """
         # allow old style arguments using a Case or OpenMDAO problem instead of dictionary
         assert (isinstance(case, Case) or isinstance(case, dict))
-        if isinstance(case, Case):
-            previous_solution = {
-                'inputs': case.list_inputs(out_stream=None, return_format='dict',
-                                           units=True, prom_name=True),
-                'outputs': case.list_outputs(out_stream=None, return_format='dict',
-                                             units=True, prom_name=True)
-            }
-        else:
-            previous_solution = case
-
-        prev_vars_abs2prom = {}
-        prev_vars_abs2prom.update({k: v['prom_name'] for k, v in previous_solution['inputs'].items()})
-        prev_vars_abs2prom.update({k: v['prom_name'] for k, v in previous_solution['outputs'].items()})
-        prev_vars_prom2abs = {v: k for k, v in prev_vars_abs2prom.items()}
 
-        prev_vars = {}
-        prev_vars.update({v['prom_name']: {'val': v['val'], 'units': v['units'], 'abs_name': k}
-                          for k, v in previous_solution['inputs'].items()})
-        prev_vars.update({v['prom_name']: {'val': v['val'], 'units': v['units'], 'abs_name': k}
-                          for k, v in previous_solution['outputs'].items()})
+        prev_timeseries_path = f'{self.pathname}.timeseries'
 
-        phase_io = {'inputs': self.list_inputs(units=True, prom_name=True, out_stream=None),
-                    'outputs': self.list_outputs(units=True, prom_name=True, out_stream=None)}
-
-        phase_vars = {}
-        phase_vars.update({f"{self.pathname}.{v['prom_name']}": {'val': v['val'], 'units': v['units'], 'abs_name': k}
-                           for k, v in phase_io['inputs']})
-        phase_vars.update({f"{self.pathname}.{v['prom_name']}": {'val': v['val'], 'units': v['units'], 'abs_name': k}
-                           for k, v in phase_io['outputs']})
+        if isinstance(case, Case):
+            case_meta = case.get_io_metadata(iotypes='output', metadata_keys=['units'],
+                                             includes=[f'{prev_timeseries_path}.*',
+                                                       f'{self.pathname}.param_comp.parameter_vals:*'])
+
+        def get_prev_var(abs_path):
+            """
+            Return the value and units of the variable at the given absolute path in the case.
+
+            Only the variables needed to restart the phase are read, rather than listing every
+            variable in the case for each phase.
+
+            Parameters
+            ----------
+            abs_path : str
+                The absolute path of the variable.
+
+            Returns
+            -------
+            tuple of (ndarray, str) or None
+                The value and units of the variable, or None if the case does not contain it.
+            """
+            if isinstance(case, Case):
+                if abs_path in case_meta:
+                    return case.get_val(abs_path), case_meta[abs_path]['units']
+                return None
+            for io in ('outputs', 'inputs'):
+                if abs_path in case[io]:
+                    meta = case[io][abs_path]
+                    return meta['val'], meta['units']
+            return None
 
         phase_name = self.name
 
         # Get the initial time and duration from the previous result and set them into the new phase.
         integration_name = self.time_options['name']
 
-        try:
-            prev_time_path = prev_vars_abs2prom[f'{self.pathname}.timeseries.{integration_name}']
-        except KeyError:
+        prev_time = get_prev_var(f'{prev_timeseries_path}.{integration_name}')
+
+        if prev_time is None:
             om.issue_warning(f'load_case for phase {self.name} failed - phase not found in case data.')
             return
 
-        prev_timeseries_prom_path, _, _ = prev_time_path.rpartition(f'.{integration_name}')
-        prev_phase_prom_path, _, _ = prev_timeseries_prom_path.rpartition('.timeseries')
-        prev_time_val = prev_vars[prev_time_path]['val']
-
+        prev_time_val, prev_time_units = prev_time
         t_initial = prev_time_val[0]
         t_duration = prev_time_val[-1] - prev_time_val[0]
         prev_time_val, unique_idxs = np.unique(prev_time_val, return_index=True)
-        prev_time_units = prev_vars[prev_time_path]['units']
 
         if t_duration < 0:
             # Unique sorts the data. In reverse-time phases, we need to undo it.
@@ -3011,17 +3012,14 @@ class Phase(om.Group):
         # Interpolate the timeseries state outputs from the previous solution onto the new grid.
         if not isinstance(self, dm.AnalyticPhase):
             for state_name, options in self.state_options.items():
-                if f'{prev_timeseries_prom_path}.states:{state_name}' in prev_vars_prom2abs:
-                    prev_state_path = f'{prev_timeseries_prom_path}.states:{state_name}'
-                elif f'{prev_timeseries_prom_path}.{state_name}' in prev_vars_prom2abs:
-                    prev_state_path = f'{prev_timeseries_prom_path}.{state_name}'
-                else:
+                prev_state = get_prev_var(f'{prev_timeseries_path}.states:{state_name}') or \
+                    get_prev_var(f'{prev_timeseries_path}.{state_name}')
+                if prev_state is None:
                     issue_warning(f'Unable to find state {state_name} in timeseries data from case being loaded.',
                                   om.OpenMDAOWarning)
                     continue
 
-                prev_state_val = prev_vars[prev_state_path]['val']
-                prev_state_units = prev_vars[prev_state_path]['units']
+                prev_state_val, prev_state_units = prev_state
                 if options['lower'] is not None or options['upper'] is not None:
                     prev_state_val = prev_state_val.clip(options['lower'], options['upper'])
                 self.set_state_val(state_name,
@@ -3037,17 +3035,14 @@ class Phase(om.Group):
 
             # Interpolate the timeseries control outputs from the previous solution onto the new grid.
             for control_name, options in self.control_options.items():
-                if f'{prev_timeseries_prom_path}.controls:{control_name}' in prev_vars_prom2abs:
-                    prev_control_path = f'{prev_timeseries_prom_path}.controls:{control_name}'
-                elif f'{prev_timeseries_prom_path}.{control_name}' in prev_vars_prom2abs:
-                    prev_control_path = f'{prev_timeseries_prom_path}.{control_name}'
-                else:
+                prev_control = get_prev_var(f'{prev_timeseries_path}.controls:{control_name}') or \
+                    get_prev_var(f'{prev_timeseries_path}.{control_name}')
+                if prev_control is None:
                     issue_warning(f'Unable to find control {control_name} in timeseries data from case being loaded.',
                                   om.OpenMDAOWarning)
                     continue
 
-                prev_control_val = prev_vars[prev_control_path]['val']
-                prev_control_units = prev_vars[prev_control_path]['units']
+                prev_control_val, prev_control_units = prev_control
                 if options['lower'] is not None or options['upper'] is not None:
                     prev_control_val = prev_control_val.clip(options['lower'], options['upper'])
                 self.set_control_val(control_name,
@@ -3062,10 +3057,11 @@ class Phase(om.Group):
 
         # Set the timeseries parameter outputs from the previous solution as the parameter value
         for param_name in self.parameter_options:
-            if f'{prev_phase_prom_path}.parameter_vals:{param_name}' in prev_vars:
-                prev_param_val = prev_vars[f'{prev_phase_prom_path}.parameter_vals:{param_name}']['val']
-                prev_param_units = prev_vars[f'{prev_phase_prom_path}.parameter_vals:{param_name}']['units']
+            prev_param_path = f'{self.pathname}.param_comp.parameter_vals:{param_name}'
+            prev_param = get_prev_var(prev_param_path)
+            if prev_param is not None:
+                prev_param_val, prev_param_units = prev_param
                 self.set_parameter_val(param_name, prev_param_val[0, ...], units=prev_param_units)
             else:
-                issue_warning(f'Unable to find "{prev_phase_prom_path}.parameter_vals:{param_name}" '
+                issue_warning(f'Unable to find "{prev_param_path}" '
                               f'in data from case being loaded.')
@@ -24,6 +24,17 @@ class SimulationPhase(Phase):
                              'to create a simulation Phase.')
         super().__init__(transcription=transcription, **kwargs)
 
+        # The _ConcurrentPhaseRunOnce solver of the simulation trajectory while it runs this phase concurrently
+        # with other phases.
+        self._concurrent_solver = None
+
+    def _solve_nonlinear(self):
+        """
+        Compute the outputs of the phase, in a worker process if it is run concurrently with other phases.
+        """
+        if self._concurrent_solver is None or not self._concurrent_solver._submit_phase(self):
+            super()._solve_nonlinear()
+
     def duplicate(self, *args, **kwargs):
         """
         Create a copy of this phase where most options and attributes are deep copies of those in the original.
@@ -56,14 +67,14 @@ class SimulationPhase(Phase):
         from_phase : Phase
             The dymos phase from which this simulation phase should pull its values.
         """
-        # The use of `from_src=False` in the get_val calls here is due to the fact that the input/output
-        # vectors are in `from_phase` are already populated and we don't need to track these values
-        # to their ultimate source.
+        # The values are retrieved from their sources since many of them, such as t_initial, t_duration,
+        # the parameters, and the controls, are inputs of `from_phase` which may be promoted from more than one
+        # input or which take their values from their sources.
 
-        t_initial = from_phase.get_val('t_initial', units=self.time_options['units'], from_src=False)
+        t_initial = from_phase.get_val('t_initial', units=self.time_options['units'], from_src=True)
         self.set_val('t_initial', t_initial, units=self.time_options['units'])
 
-        t_duration = from_phase.get_val('t_duration', units=self.time_options['units'], from_src=False)
+        t_duration = from_phase.get_val('t_duration', units=self.time_options['units'], from_src=True)
         self.set_val('t_duration', t_duration, units=self.time_options['units'])
 
         avail_io = {meta['prom_name'] for meta in
@@ -71,19 +82,19 @@ class SimulationPhase(Phase):
 
         for name, options in self.state_options.items():
             if f'states:{name}' in avail_io:
-                val = from_phase.get_val(f'states:{name}', units=options['units'], from_src=False)[0, ...]
+                val = from_phase.get_val(f'states:{name}', units=options['units'], from_src=True)[0, ...]
             elif f'initial_states:{name}' in avail_io:
-                val = from_phase.get_val(f'initial_states:{name}', units=options['units'], from_src=False)
+                val = from_phase.get_val(f'initial_states:{name}', units=options['units'], from_src=True)
             else:
                 raise RuntimeError('Unable to find state values in original phase')
             self.set_val(f'initial_states:{name}', val, units=options['units'])
 
         for name, options in self.parameter_options.items():
-            val = from_phase.get_val(f'parameters:{name}', units=options['units'], from_src=False)
+            val = from_phase.get_val(f'parameters:{name}', units=options['units'], from_src=True)
             self.set_val(f'parameters:{name}', val, units=options['units'])
 
         for name, options in self.control_options.items():
-            val = from_phase.get_val(f'controls:{name}', units=options['units'], from_src=False)
+            val = from_phase.get_val(f'controls:{name}', units=options['units'], from_src=True)
             self.set_val(f'controls:{name}', val, units=options['units'])
 
     def add_boundary_constraint(self, name, loc, constraint_name=None, units=None,
@@ -1,12 +1,26 @@
 import unittest
+from unittest import mock
 
 import numpy as np
 
+import networkx as nx
+
 import openmdao.api as om
 from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.utils.assert_utils import assert_near_equal
 
 import dymos as dm
+from dymos.trajectory import trajectory
+from dymos.trajectory.trajectory import _phase_generations
+
+
+def _get_phase_vals(sim_prob):
+    """
+    Return the values of all inputs and outputs of the phases of the simulated trajectory.
+    """
+    phases = sim_prob.model.traj.phases
+    io = phases.list_inputs(out_stream=None, prom_name=False) + phases.list_outputs(out_stream=None, prom_name=False)
+    return {name: meta['val'].copy() for name, meta in io}
 
 
 class MainPhase(dm.Phase):
@@ -128,5 +142,217 @@ class TestSimulateShapedParams(unittest.TestCase):
         assert_near_equal(p.get_val('hop0.main_phase.timeseries.impulse')[-1, 0], -7836.66666, tolerance=1.0E-4)
 
 
+@use_tempdirs
+class TestSimulateReuse(unittest.TestCase):
+
+    def _make_problem(self):
+        from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+
+        p = om.Problem(model=om.Group())
+
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+        phase = traj.add_phase('phase0', dm.Phase(ode_class=BrachistochroneODE,
+                                                  transcription=dm.Radau(num_segments=5, order=3)))
+
+        phase.set_time_options(fix_initial=True, fix_duration=True, units='s')
+        phase.add_state('x', fix_initial=True)
+        phase.add_state('y', fix_initial=True)
+        phase.add_state('v', fix_initial=True)
+        phase.add_control('theta', units='deg', lower=0.01, upper=179.9)
+        phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+
+        p.setup()
+
+        phase.set_time_val(initial=0.0, duration=2.0)
+        phase.set_state_val('x', [0, 10])
+        phase.set_state_val('y', [10, 5])
+        phase.set_state_val('v', [0, 9.9])
+        phase.set_control_val('theta', [5, 100])
+
+        return p, traj, phase
+
+    def test_simulation_problem_reused(self):
+        p, traj, phase = self._make_problem()
+
+        p.run_model()
+        sim_prob_1 = traj.simulate(record_file='sim_1.db')
+        x_1 = sim_prob_1.get_val('traj.phase0.timeseries.x')[-1, 0]
+
+        # Change the inputs of the phase and simulate again.
+        phase.set_control_val('theta', [20, 80])
+        p.run_model()
+        sim_prob_2 = traj.simulate(record_file='sim_2.db')
+        x_2 = sim_prob_2.get_val('traj.phase0.timeseries.x')[-1, 0]
+
+        self.assertIs(sim_prob_2, sim_prob_1)
+        self.assertNotAlmostEqual(x_1, x_2, places=3)
+
+        # The recorded simulation reflects the new inputs.
+        case = om.CaseReader(sim_prob_2.get_outputs_dir() / 'sim_2.db').get_case('final')
+        assert_near_equal(case.get_val('traj.phase0.timeseries.x')[-1, 0], x_2)
+
+        # Changing the simulation arguments requires a new simulation problem, which gives the same result.
+        sim_prob_3 = traj.simulate(times_per_seg=20)
+        x_3 = sim_prob_3.get_val('traj.phase0.timeseries.x')[-1, 0]
+
+        self.assertIsNot(sim_prob_3, sim_prob_2)
+        assert_near_equal(x_3, x_2, tolerance=1.0E-6)
+
+    def test_simulation_problem_invalidated_by_simulate_options(self):
+        p, traj, phase = self._make_problem()
+
+        p.run_model()
+        sim_prob_1 = traj.simulate()
+        sim_prob_2 = traj.simulate()
+
+        self.assertIs(sim_prob_2, sim_prob_1)
+
+        phase.simulate_options['rtol'] = 1.0E-6
+        sim_prob_3 = traj.simulate()
+
+        self.assertIsNot(sim_prob_3, sim_prob_2)
+        self.assertEqual(sim_prob_3.model.traj.phases.phase0.simulate_options['rtol'], 1.0E-6)
+
+    def test_simulation_problem_invalidated_by_setup(self):
+        p, traj, phase = self._make_problem()
+
+        p.run_model()
+        sim_prob_1 = traj.simulate()
+
+        p.setup()
+        phase.set_time_val(initial=0.0, duration=2.0)
+        phase.set_state_val('x', [0, 10])
+        phase.set_state_val('y', [10, 5])
+        phase.set_state_val('v', [0, 9.9])
+        phase.set_control_val('theta', [5, 100])
+        p.run_model()
+
+        sim_prob_2 = traj.simulate()
+
+        self.assertIsNot(sim_prob_2, sim_prob_1)
+
+
+@use_tempdirs
+class TestSimulateConcurrentPhases(unittest.TestCase):
+
+    def test_simulate_phases_concurrently(self):
+        from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+
+        p = om.Problem(model=om.Group())
+
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+
+        for i, theta in enumerate(([5, 100], [20, 80], [50, 50])):
+            phase = traj.add_phase(f'phase{i}', dm.Phase(ode_class=BrachistochroneODE,
+                                                         transcription=dm.Radau(num_segments=5, order=3)))
+
+            phase.set_time_options(fix_initial=True, fix_duration=True, units='s')
+            phase.add_state('x', fix_initial=True)
+            phase.add_state('y', fix_initial=True)
+            phase.add_state('v', fix_initial=True)
+            phase.add_control('theta', units='deg', lower=0.01, upper=179.9)
+            phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+
+        p.setup()
+
+        for i, theta in enumerate(([5, 100], [20, 80], [50, 50])):
+            phase = traj.phases._get_subsystem(f'phase{i}')
+            phase.set_time_val(initial=0.0, duration=2.0)
+            phase.set_state_val('x', [0, 10])
+            phase.set_state_val('y', [10, 5])
+            phase.set_state_val('v', [0, 9.9])
+            phase.set_control_val('theta', theta)
+
+        p.run_model()
+
+        with mock.patch.object(trajectory, 'ProcessPoolExecutor', wraps=trajectory.ProcessPoolExecutor) as pool:
+            for theta_final in (100, 120):
+                traj.phases.phase0.set_control_val('theta', [5, theta_final])
+                p.run_model()
+
+                serial_vals = _get_phase_vals(traj.simulate())
+                concurrent_vals = _get_phase_vals(traj.simulate(num_workers=2))
+
+                self.assertEqual(serial_vals.keys(), concurrent_vals.keys())
+                for name, val in serial_vals.items():
+                    with self.subTest(theta_final=theta_final, name=name):
+                        assert_near_equal(concurrent_vals[name], val, tolerance=1.0E-12)
+
+            # Each simulation problem uses a single pool of workers, which is reused when it is run again.
+            self.assertEqual(pool.call_count, 2)
+            sim_prob = traj.sim_prob
+            self.assertIs(traj.simulate(num_workers=2), sim_prob)
+            self.assertEqual(pool.call_count, 2)
+            assert_near_equal(sim_prob.get_val('traj.phase0.timeseries.x'), concurrent_vals['phase0.timeseries.x'],
+                              tolerance=1.0E-12)
+
+        # The pool is shut down when the simulation problem is replaced.
+        traj.simulate()
+        self.assertIsNone(sim_prob.model.traj.phases.nonlinear_solver._executor)
+
+    def test_simulate_linked_phases_concurrently(self):
+        from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+
+        p = om.Problem(model=om.Group())
+
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+
+        for i in range(3):
+            phase = traj.add_phase(f'phase{i}', dm.Phase(ode_class=BrachistochroneODE,
+                                                         transcription=dm.Radau(num_segments=5, order=3)))
+
+            phase.set_time_options(fix_initial=i == 0, fix_duration=True, units='s')
+            phase.add_state('x', fix_initial=i == 0)
+            phase.add_state('y', fix_initial=i == 0)
+            phase.add_state('v', fix_initial=i == 0)
+            phase.add_control('theta', units='deg', lower=0.01, upper=179.9)
+            phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+
+        # Two branches which both begin at the end of phase0.
+        traj.link_phases(['phase0', 'phase1'], vars=['time', 'x', 'y', 'v'])
+        traj.link_phases(['phase0', 'phase2'], vars=['time', 'x', 'y', 'v'])
+
+        p.setup()
+
+        for i, theta in enumerate(([5, 50], [50, 100], [50, 80])):
+            phase = traj.phases._get_subsystem(f'phase{i}')
+            phase.set_time_val(initial=0.0 if i == 0 else 1.0, duration=1.0)
+            phase.set_state_val('x', [0, 5] if i == 0 else [5, 10])
+            phase.set_state_val('y', [10, 7] if i == 0 else [7, 5])
+            phase.set_state_val('v', [0, 5] if i == 0 else [5, 9.9])
+            phase.set_control_val('theta', theta)
+
+        p.run_model()
+
+        sim_prob_serial = traj.simulate()
+        x_serial = {f'phase{i}': sim_prob_serial.get_val(f'traj.phase{i}.timeseries.x') for i in range(3)}
+
+        sim_prob_concurrent = traj.simulate(num_workers=2)
+
+        # Only the branches are simulated at the same time, after the phase on which they both depend.
+        solver = sim_prob_concurrent.model.traj.phases.nonlinear_solver
+        self.assertEqual(solver.options['phase_generations'], [['phase0'], ['phase1', 'phase2']])
+
+        for phase_name, x in x_serial.items():
+            with self.subTest(phase_name):
+                assert_near_equal(sim_prob_concurrent.get_val(f'traj.{phase_name}.timeseries.x'), x,
+                                  tolerance=1.0E-12)
+
+    def test_phase_generations(self):
+        phase_graph = nx.DiGraph([('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'e')])
+
+        self.assertEqual(_phase_generations(phase_graph, ['a', 'b', 'c', 'd', 'e', 'f']),
+                         [['a', 'f'], ['b', 'c'], ['d', 'e']])
+
+        # Phases without simulations are omitted, but still order the phases linked through them.
+        self.assertEqual(_phase_generations(phase_graph, ['a', 'c', 'd', 'e']),
+                         [['a'], ['c'], ['d', 'e']])
+
+        # Cyclic linkages are run serially.
+        phase_graph.add_edge('d', 'a')
+        self.assertEqual(_phase_generations(phase_graph, ['a', 'b', 'c', 'd', 'e']),
+                         [['a'], ['b'], ['c'], ['d'], ['e']])
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -9,6 +9,61 @@ from dymos.trajectory.trajectory import Trajectory
 from dymos.visualization.timeseries_plots import timeseries_plots
 
 from .grid_refinement.refinement import _refine_iter
+from .load_case import find_phases
+from .solution_file import read_solution_file, write_solution_file, _load_solution
+from .utils.misc import _abs2prom
+
+
+_RECORDING_PRESETS = ('all', 'timeseries', 'desvars', 'none')
+
+
+def _get_timeseries_includes(model):
+    """
+    Return the recording includes which match the timeseries outputs and parameter values of the model.
+
+    Parameters
+    ----------
+    model : System
+        The model containing the phases.
+
+    Returns
+    -------
+    list of str
+        A pattern matching the promoted names of the outputs of each timeseries of each phase, and a
+        pattern matching the parameter values of all phases and trajectories.
+    """
+    timeseries_paths = {f'{phase_path}.{ts_name}'
+                        for phase_path, phase in find_phases(model).items() for ts_name in phase._timeseries}
+
+    includes = set()
+    for abs_name in model._var_allprocs_abs2meta['output']:
+        sys_path, _, var_name = abs_name.rpartition('.')
+        if sys_path in timeseries_paths:
+            prom_name = _abs2prom(model, abs_name)
+            includes.add(f'{prom_name[:-len(var_name)]}*')
+
+    return sorted(includes) + ['*parameter_vals:*']
+
+
+def _set_recording_preset(problem, preset):
+    """
+    Set the recording options of the problem for the given preset.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The OpenMDAO problem whose recording options are set.
+    preset : str
+        One of 'all', 'timeseries', or 'desvars'.
+    """
+    # record_outputs is need to capture the timeseries outputs
+    problem.recording_options['record_outputs'] = True
+
+    # The design variables, objectives and constraints are recorded regardless of the includes.
+    if preset == 'timeseries':
+        problem.recording_options['includes'] = _get_timeseries_includes(problem.model)
+    elif preset == 'desvars':
+        problem.recording_options['includes'] = []
 
 
 def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_driver=True,
@@ -21,6 +76,9 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
                 reset_iter_counts=True,
                 simulate_kwargs=None,
                 plot_kwargs=None,
+                refine_num_workers=1,
+                solution_file=None,
+                recording_preset='all',
                 ):
     """
     A Dymos-specific interface to execute an OpenMDAO problem containing Dymos Trajectories or
@@ -41,11 +99,12 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
     simulate : bool
         If True, perform a simulation of any Trajectories found in the Problem model after the driver
         has been run and grid refinement is complete.
-    restart : str, Case, or None
+    restart : str, Case, dict, or None
         If given as a dict returned by om.CaseReader.get_case, automatically load the states, controls, and
         parameters as given in the provided case as the initial guess for the next run.
         If given as a string, assume the user is providing the path to a CaseRecorder file that contains a case named
-        "final" that the user wants to use as the guess for the case.
+        "final" that the user wants to use as the guess for the case, or the path to a dymos solution file with
+        the extension '.npz'. A dictionary returned by read_solution_file may also be given.
     make_plots : bool
         If True, automatically generate plots of all timeseries outputs.
         These are stored in the reports subdirectory generated by OpenMDAO.
@@ -63,34 +122,58 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
         Prefix to prepend to coordinates when recording.
     reset_iter_counts : bool
         If True and model has been run previously, reset all iteration counters.
+    refine_num_workers : int
+        The maximum number of processes in which the errors of the phases are estimated concurrently
+        during grid refinement.
+    solution_file : str or None
+        If given, the path of a compact dymos solution file to which the final solution is written, which can be
+        given as the restart of a later run. Relative paths are placed in the outputs directory of the problem.
+    recording_preset : str
+        The variables recorded in the final case of the solution record file, when it is added by run_problem.
+        If 'all', every output of the model is recorded. If 'timeseries', only the timeseries outputs and
+        parameter values, which are needed to plot the solution or restart from it, and the design variables,
+        objectives, and constraints are recorded. If 'desvars', only the design variables, objectives, and
+        constraints are recorded. If 'none', no solution record file is written, in which case a solution_file
+        may be used to restart from the solution.
     """
+    if recording_preset not in _RECORDING_PRESETS:
+        raise ValueError(f'Option recording_preset must be one of {_RECORDING_PRESETS}, '
+                         f'but got {recording_preset!r}.')
+
+    if make_plots and recording_preset in ('desvars', 'none'):
+        raise ValueError(f'Plots cannot be made when recording_preset is {recording_preset!r}, since the '
+                         f'timeseries outputs are not recorded.')
+
     if restart is not None:
-        if isinstance(restart, (str, pathlib.Path)):
+        if isinstance(restart, (str, pathlib.Path)) and pathlib.Path(restart).suffix == '.npz':
+            case = read_solution_file(restart)
+        elif isinstance(restart, (str, pathlib.Path)):
             case = om.CaseReader(restart).get_case('final')
-        elif isinstance(restart, Case):
+        elif isinstance(restart, (Case, dict)):
             case = restart
         else:
             raise ValueError('If given, option restart must specify a string to the filepath of a valid dymos '
-                             'output case, or a case dictionary returned from om.CaseReader.get_case.')
+                             'output case or solution file, or a case returned from om.CaseReader.get_case.')
 
-    if solution_record_file not in [rec._filepath for rec in iter(problem._rec_mgr)]:
+    if recording_preset != 'none' and solution_record_file not in [rec._filepath for rec in iter(problem._rec_mgr)]:
         recorder = om.SqliteRecorder(solution_record_file)
         problem.add_recorder(recorder)
-
-        # record_outputs is need to capture the timeseries outputs
-        problem.recording_options['record_outputs'] = True
+        _set_recording_preset(problem, recording_preset)
 
     problem.final_setup()
 
     if restart is not None:
-        problem.load_case(case)
+        if isinstance(case, dict) and 'grids' in case:
+            _load_solution(problem, case)
+        else:
+            problem.load_case(case)
 
     for traj in problem.model.system_iter(include_self=True, recurse=True, typ=Trajectory):
         traj._check_phase_graph()
 
     if run_driver:
         failed = _refine_iter(problem, refine_iteration_limit, refine_method, case_prefix=case_prefix,
-                              reset_iter_counts=reset_iter_counts)
+                              reset_iter_counts=reset_iter_counts, num_workers=refine_num_workers)
     else:
         failed = problem.run_model()
         if refine_iteration_limit > 0:
@@ -100,6 +183,14 @@ def run_problem(problem, refine_method='hp', refine_iteration_limit=0, run_drive
     problem.record(f'{_case_prefix}final')  # save case for potential restart
     problem.cleanup()
 
+    if solution_file is not None:
+        if pathlib.Path(solution_file).is_absolute():
+            _solution_file = solution_file
+        else:
+            _solution_file = problem.get_outputs_dir() / solution_file
+            _solution_file.parent.mkdir(parents=True, exist_ok=True)
+        write_solution_file(problem, _solution_file)
+
     sims = {}
     if simulate:
         _simulate_kwargs = simulate_kwargs if simulate_kwargs is not None else {}
@@ -0,0 +1,154 @@
+"""
+Reading and writing of compact dymos solution files.
+
+A solution file stores the final state of a problem in the form needed to restart it: the
+timeseries outputs, parameter values and grid of each phase, and the values of the variables
+outside of the phases. Each variable is saved as its own array in an uncompressed numpy npz
+archive, so a solution file is much smaller than a case recorder file and loads without
+unpickling any data.
+"""
+import json
+import pathlib
+
+import numpy as np
+
+import openmdao.api as om
+
+from .load_case import find_phases
+from .grid_refinement.refinement import _is_in_systems
+from .utils.misc import _abs2prom
+
+
+_METADATA_KEY = '__dymos_solution__'
+_FORMAT_VERSION = 1
+
+
+def _is_restart_var(abs_name, phase_paths):
+    """
+    Return True if the given output of a phase is needed to restart the phase.
+
+    Parameters
+    ----------
+    abs_name : str
+        The absolute name of an output of a phase.
+    phase_paths : Iterable of str
+        The pathnames of the phases in the model.
+
+    Returns
+    -------
+    bool
+        True if the output is a timeseries output or parameter value of its phase.
+    """
+    return any(abs_name.startswith((f'{path}.timeseries.', f'{path}.param_comp.parameter_vals:'))
+               for path in phase_paths)
+
+
+def write_solution_file(problem, filename):
+    """
+    Write the current solution of the given problem to a compact dymos solution file.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The OpenMDAO Problem containing one or more dymos phases, after it has been run.
+    filename : str or Path
+        The path of the solution file.  By convention it has the extension '.npz'.
+    """
+    model = problem.model
+    phases = find_phases(model)
+    abs2meta = model._var_allprocs_abs2meta['output']
+
+    arrays = {}
+    metadata = {'version': _FORMAT_VERSION, 'outputs': {}, 'inputs': {}, 'grids': {}}
+
+    for abs_name, val in model._outputs._abs_item_iter(flat=False):
+        if abs_name.startswith('_auto_ivc.'):
+            continue
+        if _is_in_systems(abs_name, phases) and not _is_restart_var(abs_name, phases):
+            continue
+        arrays[abs_name] = val
+        metadata['outputs'][abs_name] = {'units': abs2meta[abs_name]['units'],
+                                         'prom_name': _abs2prom(model, abs_name)}
+
+    # Inputs outside of the phases which are fed by the automatic IndepVarComp, such as the parameters
+    # of trajectories, are saved in place of the auto_ivc outputs, whose names are assigned during setup.
+    in_abs2meta = model._var_allprocs_abs2meta['input']
+    for abs_in, abs_out in model._conn_global_abs_in2out.items():
+        if abs_out.startswith('_auto_ivc.') and not _is_in_systems(abs_in, phases):
+            arrays[abs_in] = model._inputs._abs_get_val(abs_in, flat=False)
+            metadata['inputs'][abs_in] = {'units': in_abs2meta[abs_in]['units'],
+                                          'prom_name': _abs2prom(model, abs_in, 'input')}
+
+    for phase_path, phase in phases.items():
+        grid_data = phase.options['transcription'].grid_data
+        metadata['grids'][phase_path] = {'transcription': grid_data.transcription}
+        arrays[f'{phase_path}:segment_ends'] = grid_data.segment_ends
+        arrays[f'{phase_path}:node_ptau'] = grid_data.node_ptau
+
+    arrays[_METADATA_KEY] = np.array(json.dumps(metadata))
+
+    np.savez(pathlib.Path(filename), **arrays)
+
+
+def read_solution_file(filename):
+    """
+    Read a compact dymos solution file.
+
+    The returned dictionary may be given as the restart of run_problem, or passed to load_case of an
+    individual Phase, to use the solution as the initial guess of a problem.
+
+    Parameters
+    ----------
+    filename : str or Path
+        The path of the solution file.
+
+    Returns
+    -------
+    dict
+        A dictionary with keys 'inputs' and 'outputs', in the format returned by list_inputs and
+        list_outputs with units=True, prom_name=True, and return_format='dict'.  The key 'grids'
+        maps the pathname of each phase to the transcription, segment ends and node locations in
+        phase tau space of its grid.
+    """
+    with np.load(pathlib.Path(filename), allow_pickle=False) as data:
+        metadata = json.loads(data[_METADATA_KEY].item())
+
+        if metadata['version'] > _FORMAT_VERSION:
+            raise ValueError(f'{filename} was written in dymos solution file format version {metadata["version"]}, '
+                             f'but only versions up to {_FORMAT_VERSION} are supported.')
+
+        solution = {io: {abs_name: {'val': data[abs_name], **meta} for abs_name, meta in metadata[io].items()}
+                    for io in ('inputs', 'outputs')}
+
+        solution['grids'] = {phase_path: {'transcription': meta['transcription'],
+                                          'segment_ends': data[f'{phase_path}:segment_ends'],
+                                          'node_ptau': data[f'{phase_path}:node_ptau']}
+                             for phase_path, meta in metadata['grids'].items()}
+
+    return solution
+
+
+def _load_solution(problem, solution):
+    """
+    Load a solution read from a dymos solution file into the given problem.
+
+    The outputs are loaded with load_case of the problem.  The inputs fed by the automatic
+    IndepVarComp are set by their promoted names, since the names of the auto_ivc outputs which
+    feed them may differ from those of the problem which wrote the solution file.
+
+    Parameters
+    ----------
+    problem : om.Problem
+        The OpenMDAO Problem, after final_setup.
+    solution : dict
+        A solution returned by read_solution_file.
+    """
+    problem.load_case({'inputs': {}, 'outputs': solution['outputs']})
+
+    input_vals = {meta['prom_name']: meta for meta in solution['inputs'].values()}
+    for prom_name, meta in input_vals.items():
+        try:
+            problem.set_val(prom_name, meta['val'], units=meta['units'])
+        except KeyError:
+            om.issue_warning(f"{problem.msginfo}: Input variable, '{prom_name}', in the solution is not found "
+                             "in the model.")
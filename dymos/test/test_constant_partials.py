@@ -0,0 +1,176 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_totals
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.transcriptions.common import TimeComp, TimeseriesOutputComp
+from dymos.transcriptions.common.continuity_comp import ContinuityCompBase
+from dymos.transcriptions.pseudospectral.components import GaussLobattoInterleaveComp, ControlEndpointDefectComp
+from dymos.trajectory.phase_linkage_comp import PhaseLinkageComp
+from dymos.utils.testing_utils import assert_check_partials
+
+
+# Components which are linear in their inputs, and therefore should declare all of their partials
+# with constant values and never be linearized.
+_LINEAR_COMPONENTS = (TimeComp, TimeseriesOutputComp, GaussLobattoInterleaveComp, ControlEndpointDefectComp,
+                      PhaseLinkageComp, ContinuityCompBase)
+
+
+def _is_linear(comp):
+    """
+    Return True if the given instance of one of the linear component classes is linear in its inputs.
+
+    Timeseries rate outputs and control rate continuity defects are divided by dt_dstau, so a component
+    with either of them is not linear.
+
+    Parameters
+    ----------
+    comp : Component
+        The component being tested.
+
+    Returns
+    -------
+    bool
+        True if the given component is linear in its inputs.
+    """
+    if isinstance(comp, TimeseriesOutputComp):
+        return not comp._rate_jacs
+    elif isinstance(comp, ContinuityCompBase):
+        return not comp._rate_continuity_partials
+    return isinstance(comp, _LINEAR_COMPONENTS)
+
+
+def _make_problem(transcription, rate_outputs=False):
+    p = om.Problem(model=om.Group())
+
+    traj = p.model.add_subsystem('traj', dm.Trajectory())
+
+    for i in range(2):
+        phase = dm.Phase(ode_class=BrachistochroneODE, transcription=transcription(i))
+        traj.add_phase(f'phase{i}', phase)
+
+        phase.set_time_options(fix_initial=i == 0, duration_bounds=(0.5, 10))
+        phase.add_state('x', fix_initial=i == 0)
+        phase.add_state('y', fix_initial=i == 0)
+        phase.add_state('v', fix_initial=i == 0)
+        phase.add_control('theta', units='deg', lower=0.01, upper=179.9, continuity=True,
+                          rate_continuity=rate_outputs)
+        phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+        if rate_outputs:
+            phase.add_timeseries_rate_output('check')
+
+    traj.link_phases(['phase0', 'phase1'], vars=['time', 'x', 'y', 'v'])
+    traj.phases.phase1.add_objective('time', loc='final')
+
+    p.setup(force_alloc_complex=True)
+
+    for i in range(2):
+        phase = traj.phases._get_subsystem(f'phase{i}')
+        phase.set_time_val(initial=i, duration=1.0)
+        phase.set_state_val('x', [0, 10])
+        phase.set_state_val('y', [10, 5])
+        phase.set_state_val('v', [0.1, 9.9])
+        phase.set_control_val('theta', [5, 100])
+
+    p.run_model()
+
+    return p
+
+
+def _record_written_partials(comp, written):
+    """
+    Wrap compute_partials of the given component to record the keys of the partials it writes.
+
+    Parameters
+    ----------
+    comp : Component
+        The component whose compute_partials is wrapped.
+    written : dict
+        Maps the pathname of the component to a list of the keys of the partials written by each call
+        of its compute_partials.
+    """
+    compute_partials = comp.compute_partials
+    written[comp.pathname] = []
+
+    class _RecordingPartials(object):
+
+        def __init__(self, partials):
+            self._partials = partials
+            self.keys = set()
+
+        def __getitem__(self, key):
+            return self._partials[key]
+
+        def __setitem__(self, key, val):
+            self.keys.add(key)
+            self._partials[key] = val
+
+    def wrapper(inputs, partials, *args):
+        recording_partials = _RecordingPartials(partials)
+        compute_partials(inputs, recording_partials, *args)
+        written[comp.pathname].append(recording_partials.keys)
+
+    comp.compute_partials = wrapper
+
+
+@use_tempdirs
+class TestConstantPartials(unittest.TestCase):
+
+    transcriptions = {'radau': lambda i: dm.Radau(num_segments=3, order=3, compressed=bool(i)),
+                      'gauss-lobatto': lambda i: dm.GaussLobatto(num_segments=3, order=3, compressed=bool(i)),
+                      'birkhoff': lambda i: dm.Birkhoff(num_nodes=7)}
+
+    def test_linear_components_write_no_partials(self):
+        for tx_name, transcription in self.transcriptions.items():
+            for rate_outputs in (False, True):
+                with self.subTest(transcription=tx_name, rate_outputs=rate_outputs):
+                    dm.options['include_check_partials'] = True
+                    p = _make_problem(transcription, rate_outputs=rate_outputs)
+                    dm.options['include_check_partials'] = False
+
+                    linear_comps = [comp for comp in p.model.system_iter(recurse=True, typ=om.ExplicitComponent)
+                                    if isinstance(comp, _LINEAR_COMPONENTS)]
+
+                    self.assertTrue(any(_is_linear(comp) for comp in linear_comps))
+
+                    written = {}
+                    for comp in linear_comps:
+                        _record_written_partials(comp, written)
+
+                    # Linearize the model twice, at different points.
+                    wrt = 'traj.phase0.t_duration'
+                    p.compute_totals(of=['traj.phase0.timeseries.time'], wrt=[wrt])
+                    p.set_val(wrt, 1.5)
+                    p.run_model()
+                    totals = p.compute_totals(of=['traj.phase0.timeseries.time'], wrt=[wrt])
+                    self.assertTrue(np.any(totals['traj.phase0.timeseries.time', wrt]))
+
+                    for comp in linear_comps:
+                        calls = written[comp.pathname]
+                        if _is_linear(comp):
+                            # The partials declared with constant values are never recomputed.
+                            self.assertTrue(all(not keys for keys in calls), msg=comp.pathname)
+                        else:
+                            self.assertTrue(all(keys for keys in calls), msg=comp.pathname)
+
+                    # The timeseries of phase0 is linearized each time, but only recomputes any rate partials.
+                    self.assertEqual(len(written['traj.phases.phase0.timeseries']), 2)
+                    self.assertEqual(any(written['traj.phases.phase0.timeseries']), rate_outputs)
+
+                    # The declared constant values remain correct away from the initial point.
+                    cpd = p.check_partials(method='cs', out_stream=None,
+                                           includes=[comp.pathname for comp in linear_comps])
+                    assert_check_partials(cpd)
+
+                    cpd = p.check_totals(of=['traj.phase0.timeseries.time', 'traj.phase0.timeseries.x'],
+                                         wrt=[wrt, 'traj.phase0.states:x'], method='cs', out_stream=None)
+                    assert_check_totals(cpd)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -350,6 +350,39 @@ class TestLoadCase(unittest.TestCase):
         with assert_warning(UserWarning, msg):
             q.load_case(case)
 
+    def test_load_case_reads_only_phase_vars(self):
+        from unittest import mock
+        import numpy as np
+        import openmdao.api as om
+        from openmdao.recorders.case import Case
+        from openmdao.utils.assert_utils import assert_near_equal
+        import dymos as dm
+
+        p = setup_problem(dm.GaussLobatto(num_segments=10))
+        p.set_val('phase0.parameters:g', 1.62)
+        dm.run_problem(p, run_driver=False)
+
+        case = om.CaseReader(p.get_outputs_dir() / 'dymos_solution.db').get_case('final')
+
+        q = setup_problem(dm.Radau(num_segments=20))
+
+        # The phase reads its variables directly from the case, rather than listing every variable in it.
+        with mock.patch.object(Case, 'list_inputs') as list_inputs, \
+                mock.patch.object(Case, 'list_outputs') as list_outputs:
+            q.load_case(case)
+        list_inputs.assert_not_called()
+        list_outputs.assert_not_called()
+
+        time_val, idx = np.unique(case.get_val('phase0.timeseries.time'), return_index=True)
+
+        assert_near_equal(q.get_val('phase0.t_duration'), 2.0)
+        assert_near_equal(q.get_val('phase0.parameters:g'), 1.62)
+        for name in ('x', 'y', 'v'):
+            assert_near_equal(q.get_val(f'phase0.states:{name}'),
+                              q.model.phase0.interp(name, xs=time_val,
+                                                    ys=case.get_val(f'phase0.timeseries.{name}')[idx]),
+                              tolerance=1.0E-12)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
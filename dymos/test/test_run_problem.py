@@ -796,6 +796,84 @@ class TestRunProblemPlotting(unittest.TestCase):
         dm.options['plots'] = plots_cache
 
 
+@use_tempdirs
+class TestRecordingPresets(unittest.TestCase):
+
+    def _make_problem(self):
+        p = om.Problem(model=om.Group())
+        p.driver = om.ScipyOptimizeDriver()
+
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+        phase0 = traj.add_phase('phase0', dm.Phase(ode_class=BrachistochroneODE,
+                                                   transcription=dm.Radau(num_segments=10, order=3)))
+        phase0.set_time_options(fix_initial=True, duration_bounds=(.5, 10))
+        phase0.add_state('x', fix_initial=True, fix_final=True)
+        phase0.add_state('y', fix_initial=True, fix_final=True)
+        phase0.add_state('v', fix_initial=True)
+        phase0.add_control('theta', units='deg', lower=0.01, upper=179.9)
+        phase0.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+        phase0.add_objective('time', loc='final', scaler=10)
+
+        p.setup()
+
+        phase0.set_time_val(initial=0.0, duration=2.0)
+        phase0.set_state_val('x', [0, 10])
+        phase0.set_state_val('y', [10, 5])
+        phase0.set_state_val('v', [0, 9.9])
+        phase0.set_control_val('theta', [5, 100])
+
+        return p
+
+    def test_timeseries_preset(self):
+        p = self._make_problem()
+        dm.run_problem(p, run_driver=False, recording_preset='timeseries')
+
+        case = om.CaseReader(p.get_outputs_dir() / 'dymos_solution.db').get_case('final')
+        outputs = case.list_outputs(out_stream=None, prom_name=True, return_format='dict')
+
+        self.assertIn('traj.phases.phase0.timeseries.x', outputs)
+        self.assertIn('traj.phases.phase0.param_comp.parameter_vals:g', outputs)
+        self.assertIn('traj.phases.phase0.indep_states.states:x', outputs)
+        self.assertNotIn('traj.phases.phase0.rhs_all.xdot', outputs)
+
+        # The recorded case holds everything needed to restart from it.
+        q = self._make_problem()
+        dm.run_problem(q, run_driver=False, restart=p.get_outputs_dir() / 'dymos_solution.db')
+        for name in ('t_duration', 'states:x', 'states:y', 'states:v', 'controls:theta'):
+            assert_near_equal(q.get_val(f'traj.phase0.{name}'), p.get_val(f'traj.phase0.{name}'))
+
+    def test_desvars_preset(self):
+        p = self._make_problem()
+        dm.run_problem(p, run_driver=False, recording_preset='desvars')
+
+        case = om.CaseReader(p.get_outputs_dir() / 'dymos_solution.db').get_case('final')
+
+        self.assertIn('traj.phase0.states:x', case.get_design_vars())
+        self.assertNotIn('traj.phase0.timeseries.x', case.outputs)
+
+    def test_none_preset(self):
+        p = self._make_problem()
+        dm.run_problem(p, run_driver=False, recording_preset='none', solution_file='dymos_solution.npz')
+
+        self.assertFalse((p.get_outputs_dir() / 'dymos_solution.db').exists())
+        self.assertTrue((p.get_outputs_dir() / 'dymos_solution.npz').exists())
+
+    def test_invalid_preset(self):
+        p = self._make_problem()
+
+        with self.assertRaises(ValueError) as e:
+            dm.run_problem(p, run_driver=False, recording_preset='final')
+
+        self.assertEqual(str(e.exception), "Option recording_preset must be one of "
+                                           "('all', 'timeseries', 'desvars', 'none'), but got 'final'.")
+
+        with self.assertRaises(ValueError) as e:
+            dm.run_problem(p, run_driver=False, recording_preset='desvars', make_plots=True)
+
+        self.assertEqual(str(e.exception), "Plots cannot be made when recording_preset is 'desvars', since the "
+                                           "timeseries outputs are not recorded.")
+
+
 @use_tempdirs
 class TestSimulateArrayParam(unittest.TestCase):
 
@@ -0,0 +1,76 @@
+import os
+import unittest
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+
+
+def _make_problem(transcription):
+    p = om.Problem(model=om.Group())
+    p.driver = om.ScipyOptimizeDriver()
+
+    traj = p.model.add_subsystem('traj', dm.Trajectory())
+    phase = traj.add_phase('phase0', dm.Phase(ode_class=BrachistochroneODE, transcription=transcription))
+
+    phase.set_time_options(fix_initial=True, duration_bounds=(.5, 10))
+    phase.add_state('x', fix_initial=True, fix_final=True)
+    phase.add_state('y', fix_initial=True, fix_final=True)
+    phase.add_state('v', fix_initial=True)
+    phase.add_control('theta', units='deg', lower=0.01, upper=179.9, continuity=True, rate_continuity=True)
+
+    phase.add_parameter('g', units='m/s**2', opt=False)
+    traj.add_parameter('g', units='m/s**2', opt=False, val=9.80665)
+
+    phase.add_objective('time', loc='final', scaler=10)
+
+    p.model.linear_solver = om.DirectSolver()
+
+    p.setup()
+
+    phase.set_time_val(initial=0.0, duration=2.0)
+    phase.set_state_val('x', [0, 10])
+    phase.set_state_val('y', [10, 5])
+    phase.set_state_val('v', [0, 9.9])
+    phase.set_control_val('theta', [5, 100.5])
+
+    return p
+
+
+@use_tempdirs
+class TestSolutionFile(unittest.TestCase):
+
+    def test_restart_from_solution_file(self):
+        p = _make_problem(dm.GaussLobatto(num_segments=10))
+        p.set_val('traj.parameters:g', 1.62)
+        dm.run_problem(p, solution_file=os.path.join('solutions', 'dymos_solution.npz'))
+
+        solution_file = p.get_outputs_dir() / 'solutions' / 'dymos_solution.npz'
+        record_file = p.get_outputs_dir() / 'dymos_solution.db'
+
+        self.assertLess(os.path.getsize(solution_file), os.path.getsize(record_file) / 10)
+
+        solution = dm.read_solution_file(solution_file)
+        assert_near_equal(solution['grids']['traj.phases.phase0']['segment_ends'],
+                          p.model.traj.phases.phase0.options['transcription'].grid_data.segment_ends)
+        self.assertEqual(solution['inputs']['traj.param_comp.parameters:g']['prom_name'], 'traj.parameters:g')
+
+        # Restarting on a different grid from the solution file gives the same initial guess as
+        # restarting from the recorded case.
+        q = _make_problem(dm.Radau(num_segments=15))
+        dm.run_problem(q, run_driver=False, restart=solution_file)
+
+        r = _make_problem(dm.Radau(num_segments=15))
+        dm.run_problem(r, run_driver=False, restart=record_file)
+
+        for name in ('t_initial', 't_duration', 'states:x', 'states:y', 'states:v', 'controls:theta'):
+            assert_near_equal(q.get_val(f'traj.phase0.{name}'), r.get_val(f'traj.phase0.{name}'), tolerance=1.0E-12)
+        assert_near_equal(q.get_val('traj.parameters:g'), 1.62)
+        assert_near_equal(q.get_val('traj.phase0.parameter_vals:g'), [[1.62]])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -1,7 +1,10 @@
 import warnings
 from collections import OrderedDict
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 import itertools
+import multiprocessing
+import weakref
 
 from openmdao.utils.om_warnings import warn_deprecation
 from openmdao.utils.units import unit_conversion
@@ -23,6 +26,249 @@ from ..utils.misc import create_subprob, get_rate_units, \
 from ..utils.introspection import get_source_metadata, _get_common_metadata
 
 
+# The phases container being solved by a _ConcurrentPhaseRunOnce solver, inherited by forked worker processes.
+_worker_phases_group = None
+
+
+def _init_phase_worker(phases_group):
+    """
+    Set the phases container whose phases are solved by this worker process.
+
+    Parameters
+    ----------
+    phases_group : Group
+        The phases container inherited from the process which forked this worker.
+    """
+    global _worker_phases_group
+    _worker_phases_group = phases_group
+
+    # The phases are solved directly by the worker rather than submitted to another worker.
+    for phase in phases_group.system_iter(recurse=False):
+        phase._concurrent_solver = None
+
+
+def _solve_phase_in_worker(phase_name, inputs, outputs):
+    """
+    Solve a single phase of the phases container inherited from the parent process.
+
+    Parameters
+    ----------
+    phase_name : str
+        The name of the phase within the phases container.
+    inputs : np.array
+        The input vector of the phase in the parent process.
+    outputs : np.array
+        The output vector of the phase in the parent process.
+
+    Returns
+    -------
+    tuple of np.array
+        The input, output, and residual vectors of the phase after it has been solved.
+    """
+    phase = _worker_phases_group._get_subsystem(phase_name)
+    phase._inputs.set_val(inputs)
+    phase._outputs.set_val(outputs)
+    phase._solve_nonlinear()
+    return phase._inputs.asarray().copy(), phase._outputs.asarray().copy(), phase._residuals.asarray().copy()
+
+
+def _phase_generations(phase_graph, phase_names):
+    """
+    Return the given phases grouped into generations ordered by the linkages between phases.
+
+    No phase is linked, directly or indirectly, to another phase of the same generation, and every
+    phase follows the phases linked to it in previous generations.
+
+    Parameters
+    ----------
+    phase_graph : nx.DiGraph
+        The directed graph of the linkages between the phases of a trajectory.
+    phase_names : list of str
+        The names of the phases to be ordered, in the order in which they were added.
+
+    Returns
+    -------
+    list of list of str
+        The names of the phases in each generation.  If the linkages form a cycle, each phase is
+        its own generation.
+    """
+    graph = nx.DiGraph(phase_graph)
+    graph.add_nodes_from(phase_names)
+
+    try:
+        generations = list(nx.topological_generations(graph))
+    except nx.NetworkXUnfeasible:
+        return [[name] for name in phase_names]
+
+    generations = [[name for name in phase_names if name in generation] for generation in generations]
+    return [generation for generation in generations if generation]
+
+
+class _ConcurrentPhaseRunOnce(om.NonlinearRunOnce):
+    """
+    Solver that runs the phases of a simulation trajectory once, concurrently in a pool of processes.
+
+    The phases are run by NonlinearRunOnce in generations ordered by the linkages of the trajectory being
+    simulated, so that linked phases are never run at the same time.  Each phase of a generation with more
+    than one phase is submitted to a forked worker process when it is reached, and the input, output, and
+    residual vectors of every phase of the generation are returned to this process before the next
+    generation is run.  When only a single worker is requested, fork is unavailable, or the phases are
+    distributed under MPI, the phases are run serially.
+
+    The pool of worker processes is started the first time the phases are run concurrently and is reused
+    by every subsequent run of the simulation problem, since the vectors of each phase are sent to the
+    workers with each run.
+
+    Parameters
+    ----------
+    **kwargs : dict
+        Options dictionary.
+    """
+
+    SOLVER = 'NL: RUNONCE (concurrent)'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._executor = None
+        self._pending = {}
+        self._pending_generation = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+        self.options.declare('num_workers', types=int, default=1, lower=1,
+                             desc='The maximum number of processes in which phases are simulated concurrently.')
+        self.options.declare('phase_generations', types=list, default=None, allow_none=True,
+                             desc='The names of the phases in each generation, as returned by '
+                                  '_phase_generations. The phases must be added to the system in the order of '
+                                  'their generations. If None, all phases are run concurrently.')
+
+    def _get_generations(self):
+        """
+        Return the names of the phases in each generation.
+
+        Returns
+        -------
+        list of list of str
+            The names of the phases in each generation.
+        """
+        generations = self.options['phase_generations']
+        if generations is None:
+            generations = [[phs.name for phs in self._system().system_iter(recurse=False)]]
+        return generations
+
+    def _get_executor(self):
+        """
+        Return the pool of worker processes in which the phases are run.
+
+        Returns
+        -------
+        ProcessPoolExecutor or None
+            The pool of worker processes, or None if the phases are to be run serially.
+        """
+        system = self._system()
+        num_workers = self.options['num_workers']
+        generations = self._get_generations()
+
+        if num_workers <= 1 or system.comm.size > 1 or 'fork' not in multiprocessing.get_all_start_methods() \
+                or all(len(generation) <= 1 for generation in generations):
+            return None
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=min(num_workers, max(map(len, generations))),
+                                                 mp_context=multiprocessing.get_context('fork'),
+                                                 initializer=_init_phase_worker, initargs=(system,))
+            weakref.finalize(self, self._executor.shutdown, wait=False)
+        return self._executor
+
+    def _shutdown_executor(self):
+        """
+        Shut down the pool of worker processes, if one has been started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _submit_phase(self, phase):
+        """
+        Submit the given phase to a worker process if it is run concurrently with other phases.
+
+        This is called by the SimulationPhase when it is reached by NonlinearRunOnce, after its inputs have
+        been transferred.  The phases of the previous generation are first completed, and the phases of this
+        generation are completed once the last of them has been submitted.
+
+        Parameters
+        ----------
+        phase : SimulationPhase
+            The phase being run.
+
+        Returns
+        -------
+        bool
+            True if the phase was submitted to a worker, or False if it is to be run in this process.
+        """
+        generations = self._get_generations()
+        gen_idx = next(i for i, gen in enumerate(generations) if phase.name in gen)
+
+        if gen_idx != self._pending_generation:
+            self._collect_phases()
+
+        if len(generations[gen_idx]) <= 1:
+            return False
+
+        self._pending[phase.name] = self._executor.submit(_solve_phase_in_worker, phase.name,
+                                                          phase._inputs.asarray().copy(),
+                                                          phase._outputs.asarray().copy())
+        self._pending_generation = gen_idx
+
+        # Once every phase of the generation has been submitted, wait for them so that the vectors are current
+        # before the next generation is transferred or the iteration is recorded.
+        if len(self._pending) == len(generations[gen_idx]):
+            self._collect_phases()
+        return True
+
+    def _collect_phases(self):
+        """
+        Wait for the phases submitted to the workers and copy their vectors back into this process.
+        """
+        system = self._system()
+        pending = self._pending
+        self._pending = {}
+        self._pending_generation = None
+
+        for phase_name, future in pending.items():
+            inputs, outputs, residuals = future.result()
+            phase = system._get_subsystem(phase_name)
+            phase._inputs.set_val(inputs)
+            phase._outputs.set_val(outputs)
+            phase._residuals.set_val(residuals)
+
+    def solve(self):
+        """
+        Run the solver.
+        """
+        if self._get_executor() is None:
+            super().solve()
+            return
+
+        phases = list(self._system().system_iter(recurse=False))
+
+        for phase in phases:
+            phase._concurrent_solver = self
+        try:
+            super().solve()
+            self._collect_phases()
+        finally:
+            for phase in phases:
+                phase._concurrent_solver = None
+            for future in self._pending.values():
+                future.cancel()
+            self._pending = {}
+            self._pending_generation = None
+
+
 class Trajectory(om.Group):
     """
     Class definition for a Trajectory group.
@@ -44,6 +290,9 @@ class Trajectory(om.Group):
     sim_prob : Problem or None
         The OpenMDAO problem used for trajectory simulation.
         This is None unless the simulate method has been called.
+    _sim_prob_key : tuple or None
+        The arguments and phase simulation options with which sim_prob was setup. The simulation problem is
+        reused by subsequent calls to simulate with the same key until this Trajectory is setup again.
 
     _linkages : OrderedDict
         A dictionary containing phase linkage information for the Trajectory.
@@ -60,6 +309,7 @@ class Trajectory(om.Group):
         self._phase_graph = nx.DiGraph()
         self._has_connected_phases = False
         self.sim_prob = None
+        self._sim_prob_key = None
 
         self.phases = om.ParallelGroup() if self.options['parallel_phases'] else om.Group()
 
@@ -415,6 +665,9 @@ class Trajectory(om.Group):
         """
         super(Trajectory, self).setup()
 
+        # Any existing simulation problem may no longer reflect the grid or ODE of the phases.
+        self._sim_prob_key = None
+
         if self.parameter_options:
             self._setup_parameters()
 
@@ -1308,14 +1561,15 @@ class Trajectory(om.Group):
                                             scaler=scaler, adder=adder, ref0=ref0, ref=ref,
                                             linear=linear)
 
-    def simulate(self, times_per_seg=_unspecified, method=_unspecified, atol=_unspecified, rtol=_unspecified,
-                 first_step=_unspecified, max_step=_unspecified, record_file=None, case_prefix=None,
-                 reset_iter_counts=True, reports=False, interpolant='cubic'):
+    def _setup_simulation_problem(self, traj_name, times_per_seg, method, atol, rtol, first_step, max_step,
+                                  record_file, reports, interpolant, num_workers):
         """
-        Simulate the Trajectory using scipy.integrate.solve_ivp.
+        Create and setup the Problem in which the simulation of the Trajectory is performed.
 
         Parameters
         ----------
+        traj_name : str
+            The name of the simulation trajectory within the simulation problem.
         times_per_seg : int or None
             Number of equally spaced times per segment at which output is requested.  If None,
             output will be provided at all Nodes.
@@ -1332,43 +1586,50 @@ class Trajectory(om.Group):
         record_file : str or None
             If a string, the file to which the result of the simulation will be saved.
             If None, no record of the simulation will be saved.
-        case_prefix : str or None
-            Prefix to prepend to coordinates when recording.
-        reset_iter_counts : bool
-            If True and model has been run previously, reset all iteration counters.
         reports : bool or None or str or Sequence
             Reports setting for the subproblems run under simualate.
         interpolant : str
             The interpolation method to be used for the controls in the simulation phase.
+        num_workers : int
+            The maximum number of processes in which the phases are simulated concurrently.
 
         Returns
         -------
-        problem
-            An OpenMDAO Problem in which the simulation is implemented.  This Problem interface
-            can be interrogated to obtain timeseries outputs in the same manner as other Phases
-            to obtain results at the requested times.
+        sim_prob : Problem
+            The setup simulation problem.
+        sim_traj : Trajectory
+            The simulation trajectory within sim_prob.
         """
         sim_traj = Trajectory(sim_mode=True)
 
-        for name, phs in self._phases.items():
-            if phs.simulate_options is None:
-                continue
-            sim_phs = phs.get_simulation_phase(times_per_seg=times_per_seg, method=method,
-                                               atol=atol, rtol=rtol, first_step=first_step,
-                                               max_step=max_step, reports=reports,
-                                               interpolant=interpolant)
-            sim_traj.add_phase(name, sim_phs)
+        sim_phase_names = [name for name, phs in self._phases.items() if phs.simulate_options is not None]
 
-        if not sim_traj._phases:
+        if not sim_phase_names:
             raise RuntimeError(f'Trajectory `{self.pathname}` has no phases that support simulation.')
 
+        if num_workers > 1:
+            # The phases are added in the order of their generations, so that NonlinearRunOnce reaches every
+            # phase of one generation before any phase of the next.
+            generations = _phase_generations(self._phase_graph, sim_phase_names)
+            sim_phase_names = list(itertools.chain.from_iterable(generations))
+
+        for name in sim_phase_names:
+            sim_phs = self._phases[name].get_simulation_phase(times_per_seg=times_per_seg, method=method,
+                                                              atol=atol, rtol=rtol, first_step=first_step,
+                                                              max_step=max_step, reports=reports,
+                                                              interpolant=interpolant)
+            sim_traj.add_phase(name, sim_phs)
+
         sim_traj.parameter_options.update(self.parameter_options)
 
-        self.sim_prob = sim_prob = create_subprob(base_name=f'{self.name}_simulation',
-                                                  comm=self.comm,
-                                                  reports=reports)
+        if num_workers > 1:
+            sim_traj.phases.nonlinear_solver = _ConcurrentPhaseRunOnce(num_workers=num_workers,
+                                                                       phase_generations=generations)
+
+        sim_prob = create_subprob(base_name=f'{self.name}_simulation',
+                                  comm=self.comm,
+                                  reports=reports)
 
-        traj_name = self.name if self.name else 'sim_traj'
         sim_prob.model.add_subsystem(traj_name, sim_traj)
 
         if record_file is not None:
@@ -1389,6 +1650,86 @@ class Trajectory(om.Group):
             sim_prob.setup(check=False, parent=self)
             sim_prob.final_setup()
 
+        return sim_prob, sim_traj
+
+    def simulate(self, times_per_seg=_unspecified, method=_unspecified, atol=_unspecified, rtol=_unspecified,
+                 first_step=_unspecified, max_step=_unspecified, record_file=None, case_prefix=None,
+                 reset_iter_counts=True, reports=False, interpolant='cubic', num_workers=1):
+        """
+        Simulate the Trajectory using scipy.integrate.solve_ivp.
+
+        Parameters
+        ----------
+        times_per_seg : int or None
+            Number of equally spaced times per segment at which output is requested.  If None,
+            output will be provided at all Nodes.
+        method : str
+            The scipy.integrate.solve_ivp integration method.
+        atol : float
+            Absolute convergence tolerance for scipy.integrate.solve_ivp.
+        rtol : float
+            Relative convergence tolerance for scipy.integrate.solve_ivp.
+        first_step : float
+            Initial step size for the integration.
+        max_step : float
+            Maximum step size for the integration.
+        record_file : str or None
+            If a string, the file to which the result of the simulation will be saved.
+            If None, no record of the simulation will be saved.
+        case_prefix : str or None
+            Prefix to prepend to coordinates when recording.
+        reset_iter_counts : bool
+            If True and model has been run previously, reset all iteration counters.
+        reports : bool or None or str or Sequence
+            Reports setting for the subproblems run under simualate.
+        interpolant : str
+            The interpolation method to be used for the controls in the simulation phase.
+        num_workers : int
+            The maximum number of processes in which the phases are simulated concurrently.  The phases are
+            run in the order given by the linkages of the trajectory, and only phases which are not linked to
+            one another, such as the branches of a trajectory, are run at the same time.  If 1, or if the
+            phases are distributed across processors under MPI, the phases of the simulation are run within
+            this process.
+
+        Returns
+        -------
+        problem
+            An OpenMDAO Problem in which the simulation is implemented.  This Problem interface
+            can be interrogated to obtain timeseries outputs in the same manner as other Phases
+            to obtain results at the requested times.
+        """
+        traj_name = self.name if self.name else 'sim_traj'
+
+        sim_prob_key = (times_per_seg, method, atol, rtol, first_step, max_step, repr(reports), interpolant,
+                        num_workers,
+                        tuple((name, repr(None if phs.simulate_options is None else dict(phs.simulate_options.items())))
+                              for name, phs in self._phases.items()))
+
+        if self.sim_prob is not None and sim_prob_key == self._sim_prob_key:
+            # The simulation problem from a previous call is still valid, so only its values need to be updated.
+            sim_prob = self.sim_prob
+            sim_traj = sim_prob.model._get_subsystem(traj_name)
+
+            if record_file is not None:
+                # The recorder is started when run_model calls final_setup.
+                sim_prob.add_recorder(om.SqliteRecorder(record_file))
+                sim_prob.recording_options['record_outputs'] = True
+        else:
+            if self.sim_prob is not None:
+                # Shut down the worker processes of the simulation problem being replaced.
+                prev_solver = self.sim_prob.model._get_subsystem(traj_name).phases.nonlinear_solver
+                if isinstance(prev_solver, _ConcurrentPhaseRunOnce):
+                    prev_solver._shutdown_executor()
+
+            sim_prob, sim_traj = self._setup_simulation_problem(traj_name, times_per_seg=times_per_seg,
+                                                                method=method, atol=atol, rtol=rtol,
+                                                                first_step=first_step, max_step=max_step,
+                                                                record_file=record_file, reports=reports,
+                                                                interpolant=interpolant,
+                                                                num_workers=num_workers)
+            self.sim_prob = sim_prob
+            self._sim_prob_key = sim_prob_key
+
         # Assign trajectory parameter values
         for name in self.parameter_options:
             sim_traj.set_val(f'parameters:{name}', self.get_val(f'parameters:{name}'))
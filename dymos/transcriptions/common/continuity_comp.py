@@ -6,6 +6,38 @@ from ...utils.misc import get_rate_units
 from ..._options import options as dymos_options
 
 
+def continuity_jac_pattern(num_segments, size):
+    """
+    Return the sparse jacobian of the continuity defects of a variable wrt its values at the segment ends.
+
+    Each defect is the value at the start of a segment minus the value at the end of the previous segment.
+    The pattern is built directly rather than from a dense template, so its cost is linear in the number
+    of segments.
+
+    Parameters
+    ----------
+    num_segments : int
+        The number of segments in the grid.
+    size : int
+        The size of the variable at each node.
+
+    Returns
+    -------
+    rows : ndarray
+        The row indices of the nonzero jacobian elements.
+    cols : ndarray
+        The column indices of the nonzero jacobian elements.
+    vals : ndarray
+        The values of the nonzero jacobian elements.
+    """
+    num_defects = (num_segments - 1) * size
+    rows = np.repeat(np.arange(num_defects, dtype=int), 2)
+    iseg, idx = np.divmod(rows, size)
+    cols = (2 * iseg + np.tile([1, 2], num_defects)) * size + idx
+    vals = np.tile([-1.0, 1.0], num_defects)
+    return rows, cols, vals
+
+
 class ContinuityCompBase(om.ExplicitComponent):
     """
     ContinuityComp defines constraints to ensure continuity between adjacent segments.
@@ -18,6 +50,7 @@ class ContinuityCompBase(om.ExplicitComponent):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._no_check_partials = not dymos_options['include_check_partials']
+        self._rate_continuity_partials = []
 
     def initialize(self):
         """
@@ -65,17 +98,7 @@ class ContinuityCompBase(om.ExplicitComponent):
                 desc=f'Consistency constraint values for state {state_name}',
                 units=units)
 
-            rs_size1 = np.repeat(np.arange(num_segments - 1, dtype=int), 2)
-            cs_size1 = np.arange(1, num_segend_nodes - 1, dtype=int)
-
-            template = np.zeros((num_segments - 1, num_segend_nodes))
-            template[rs_size1, cs_size1] = 1.0
-            template = np.kron(template, np.eye(size))
-            rs, cs = template.nonzero()
-
-            vals = np.zeros(len(rs), dtype=float)
-            vals[0::2] = -1.0
-            vals[1::2] = 1.0
+            rs, cs, vals = continuity_jac_pattern(num_segments, size)
 
             self.declare_partials(f'defect_states:{state_name}', f'states:{state_name}',
                                   val=vals, rows=rs, cols=cs)
@@ -101,17 +124,7 @@ class ContinuityCompBase(om.ExplicitComponent):
             rate2_units = get_rate_units(units, time_units, deriv=2)
 
             # Define the sparsity pattern for rate and rate2 continuity
-            rs_size1 = np.repeat(np.arange(num_segments - 1, dtype=int), 2)
-            cs_size1 = np.arange(1, num_segend_nodes - 1, dtype=int)
-
-            template = np.zeros((num_segments - 1, num_segend_nodes))
-            template[rs_size1, cs_size1] = 1.0
-            template = np.kron(template, np.eye(size))
-            rs, cs = template.nonzero()
-
-            vals = np.zeros(len(rs), dtype=float)
-            vals[0::2] = -1.0
-            vals[1::2] = 1.0
+            rs, cs, vals = continuity_jac_pattern(num_segments, size)
             self.rate_jac_templates[control_name] = vals
 
             #
@@ -242,6 +255,22 @@ class ContinuityCompBase(om.ExplicitComponent):
 
         self._configure_state_continuity()
         self._configure_control_continuity()
+        self._configure_rate_continuity_partials()
+
+    def _configure_rate_continuity_partials(self):
+        """
+        Record the control rate continuity defects, the only defects whose partials are not constant.
+
+        The partials of all other defects are declared with constant values at configure time.  If there
+        are no rate continuity defects, compute_partials has nothing to do.
+        """
+        self._rate_continuity_partials = []
+
+        for control_name, name_map in self.name_maps.items():
+            if 'rate_names' in name_map:
+                self._rate_continuity_partials.append((control_name, *name_map['rate_names'], 1))
+            if 'rate2_names' in name_map:
+                self._rate_continuity_partials.append((control_name, *name_map['rate2_names'], 2))
 
     def _compute_state_continuity(self, inputs, outputs):
         state_options = self.options['state_options']
@@ -307,32 +336,21 @@ class ContinuityCompBase(om.ExplicitComponent):
         partials : Jacobian
             Subjac components written to partials[output_name, input_name].
         """
-        control_options = self.options['control_options']
-
-        if not any([options['rate_continuity'] or options['rate2_continuity'] for options in control_options.values()]):
+        if not self._rate_continuity_partials:
             return
 
         dt_dptau = 0.5 * inputs['t_duration']
 
-        for control_name, options in control_options.items():
-            if options['rate_continuity']:
-                input_name, output_name = self.name_maps[control_name]['rate_names']
-                val = self.rate_jac_templates[control_name]
-                partials[output_name, input_name] = val * dt_dptau
-
-                end_vals = inputs[input_name][1:-1:2, ...]
-                start_vals = inputs[input_name][2:-1:2, ...]
+        for control_name, input_name, output_name, deriv in self._rate_continuity_partials:
+            val = self.rate_jac_templates[control_name]
+            end_vals = inputs[input_name][1:-1:2, ...]
+            start_vals = inputs[input_name][2:-1:2, ...]
 
+            if deriv == 1:
+                partials[output_name, input_name] = val * dt_dptau
                 partials[output_name, 't_duration'] = 0.5 * (start_vals - end_vals)
-
-            if options['rate2_continuity']:
-                input_name, output_name = self.name_maps[control_name]['rate2_names']
-                val = self.rate_jac_templates[control_name]
+            else:
                 partials[output_name, input_name] = val * dt_dptau**2
-
-                end_vals = inputs[input_name][1:-1:2, ...]
-                start_vals = inputs[input_name][2:-1:2, ...]
-
                 partials[output_name, 't_duration'] = (start_vals - end_vals) * dt_dptau
 
 
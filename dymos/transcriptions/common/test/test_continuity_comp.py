@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 import itertools
 
 import numpy as np
@@ -174,6 +175,58 @@ class TestContinuityComp(unittest.TestCase):
                 cpd = self.p.check_partials(method='cs', out_stream=None)
                 assert_check_partials(cpd)
 
+    def test_constant_partials_not_recomputed(self):
+        self.addCleanup(dm.options.__setitem__, 'include_check_partials', dm.options['include_check_partials'])
+        dm.options['include_check_partials'] = True
+        num_seg = 100
+
+        gd = GridData(num_segments=num_seg, transcription_order=3, segment_ends=np.linspace(0, 10, num_seg + 1),
+                      transcription='radau-ps', compressed=False)
+        nn = gd.subset_num_nodes['all']
+        segment_end_idxs = gd.subset_node_indices['segment_ends']
+
+        state_options = {'x': StateOptionsDictionary()}
+        state_options['x']['units'] = 'm'
+        state_options['x']['shape'] = (2,)
+
+        control_options = {'u': ControlOptionsDictionary()}
+        control_options['u']['units'] = 'deg'
+        control_options['u']['shape'] = (1,)
+        control_options['u']['continuity'] = True
+        control_options['u']['rate_continuity'] = False
+
+        p = om.Problem(model=om.Group())
+        ivc = p.model.add_subsystem('ivc', subsys=om.IndepVarComp(), promotes_outputs=['*'])
+        ivc.add_output('x', val=np.random.rand(nn, 2), units='m')
+        ivc.add_output('u', val=np.random.rand(nn, 1), units='deg')
+
+        cnty_comp = p.model.add_subsystem('cnty_comp',
+                                          RadauPSContinuityComp(grid_data=gd, time_units='s',
+                                                                state_options=state_options,
+                                                                control_options=control_options))
+        p.model.connect('x', 'cnty_comp.states:x', src_indices=om.slicer[segment_end_idxs, ...])
+        p.model.connect('u', 'cnty_comp.controls:u', src_indices=om.slicer[segment_end_idxs, ...])
+
+        p.setup(force_alloc_complex=True)
+
+        # Record the partials written by compute_partials during linearization.
+        written = []
+
+        def record_partials(inputs, partials):
+            recorded = {}
+            RadauPSContinuityComp.compute_partials(cnty_comp, inputs, recorded)
+            written.append(recorded)
+
+        with mock.patch.object(cnty_comp, 'compute_partials', side_effect=record_partials) as compute_partials:
+            p.run_model()
+            cpd = p.check_partials(method='cs', out_stream=None)
+
+        # The partials declared with constant values are never recomputed.
+        self.assertGreater(compute_partials.call_count, 0)
+        self.assertEqual(written, [{}] * compute_partials.call_count)
+
+        assert_check_partials(cpd)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
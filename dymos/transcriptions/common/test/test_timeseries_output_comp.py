@@ -0,0 +1,97 @@
+import unittest
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal, assert_check_totals
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.transcriptions.common.timeseries_output_comp import _DIAGONAL_PARTIALS
+
+
+@use_tempdirs
+class TestTimeseriesOutputComp(unittest.TestCase):
+
+    def test_matrices_shared_across_phases(self):
+        p = om.Problem(model=om.Group())
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+
+        for i in range(3):
+            phase = dm.Phase(ode_class=BrachistochroneODE, transcription=dm.Radau(num_segments=4, order=3))
+            traj.add_phase(f'phase{i}', phase)
+            phase.set_time_options(fix_initial=True, fix_duration=True)
+            phase.add_state('x')
+            phase.add_state('y')
+            phase.add_state('v')
+            phase.add_control('theta', units='deg')
+            phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+            phase.add_timeseries('lgl_timeseries', transcription=dm.GaussLobatto(num_segments=4, order=5))
+            phase.add_timeseries_output(['x', 'y'], timeseries='lgl_timeseries')
+
+        p.setup()
+
+        for i in range(3):
+            phase = traj.phases._get_subsystem(f'phase{i}')
+            phase.set_time_val(initial=i, duration=1.0)
+            phase.set_state_val('x', [0, 10])
+            phase.set_state_val('y', [10, 5])
+
+        p.run_model()
+
+        ts_comps = [traj.phases._get_subsystem(f'phase{i}.lgl_timeseries') for i in range(3)]
+
+        # Each timeseries on the same grids uses the same read-only interpolation matrix.
+        L = ts_comps[0].interpolation_matrix
+        for ts_comp in ts_comps[1:]:
+            self.assertIs(ts_comp.interpolation_matrix, L)
+        self.assertFalse(L.data.flags.writeable)
+
+        # The shared matrix still interpolates each phase correctly.
+        lgl_gd = dm.GaussLobatto(num_segments=4, order=5).grid_data
+        for i in range(3):
+            t = p.get_val(f'traj.phase{i}.lgl_timeseries.time')
+            assert_near_equal(t.ravel(), i + 0.5 * (lgl_gd.node_ptau + 1), tolerance=1.0E-12)
+            assert_near_equal(p.get_val(f'traj.phase{i}.lgl_timeseries.x').ravel(), 10 * (t.ravel() - i),
+                              tolerance=1.0E-12)
+
+    @unittest.skipUnless(_DIAGONAL_PARTIALS, 'Requires a version of OpenMDAO which supports diagonal partials')
+    def test_pass_through_partials(self):
+        p = om.Problem(model=om.Group())
+        phase = p.model.add_subsystem('phase0', dm.Phase(ode_class=BrachistochroneODE,
+                                                         transcription=dm.Radau(num_segments=5, order=3)))
+        phase.set_time_options(fix_initial=True, fix_duration=True)
+        phase.add_state('x')
+        phase.add_state('y')
+        phase.add_state('v')
+        phase.add_control('theta', units='deg')
+        phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+        phase.add_timeseries_output('check')
+
+        p.model.add_design_var('phase0.states:x')
+        p.model.add_constraint('phase0.timeseries.x', lower=0)
+
+        p.setup(force_alloc_complex=True)
+
+        phase.set_time_val(initial=0.0, duration=2.0)
+        phase.set_state_val('x', [0, 10])
+        phase.set_state_val('y', [10, 5])
+        phase.set_state_val('v', [0, 9.9])
+        phase.set_control_val('theta', [5, 100])
+
+        p.run_model()
+
+        # Outputs which simply pass through the values at all nodes have a diagonal jacobian, which
+        # stores no row or column indices.
+        ts = phase._get_subsystem('timeseries')
+        for output_name, (input_name, _, _, _) in ts._vars.items():
+            meta = ts._subjacs_info[f'{ts.pathname}.{output_name}', f'{ts.pathname}.{input_name}']
+            self.assertIsNone(meta['rows'], msg=output_name)
+
+        assert_near_equal(p.get_val('phase0.timeseries.check').ravel(), p.get_val('phase0.rhs_all.check'))
+
+        cpd = p.check_totals(method='cs', out_stream=None)
+        assert_check_totals(cpd)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -1,12 +1,101 @@
+import inspect
+
 import numpy as np
 import openmdao.api as om
 from scipy import sparse as sp
 
 from ...transcriptions.grid_data import GridData
 from ..._options import options as dymos_options
+from ...utils.cache import array_lru_cache
 from ...utils.lagrange import lagrange_matrices
 
 
+# Versions of OpenMDAO which support diagonal subjacs store only their values, with no row and column indices.
+_DIAGONAL_PARTIALS = 'diagonal' in inspect.signature(om.ExplicitComponent.declare_partials).parameters
+
+
+@array_lru_cache(maxsize=256)
+def _timeseries_matrices(segment_indices, input_node_ptau, input_node_stau, segment_ends, output_nodes_ptau,
+                         same_nodes, compute_L=True, compute_D=True):
+    """
+    Build the interpolation and differentiation matrices which map values from an input grid to the output nodes.
+
+    Results are cached on the layout of the grids, so timeseries on identical grids share the same
+    matrices.  The returned matrices must therefore be treated as read-only.
+
+    Parameters
+    ----------
+    segment_indices : ndarray
+        The indices of the first and last node of each segment of the input grid.
+    input_node_ptau : ndarray
+        The phase tau location of each node of the input grid.
+    input_node_stau : ndarray
+        The segment tau location of each node of the input grid.
+    segment_ends : ndarray
+        The phase tau location of the segment boundaries of the input grid.
+    output_nodes_ptau : ndarray
+        The phase tau location of each output node.
+    same_nodes : bool
+        If True, the output nodes are the nodes of the input grid.
+    compute_L : bool, optional
+        If True, compute the interpolation matrix. Otherwise return None in its place. Default is True.
+    compute_D : bool, optional
+        If True, compute the differentiation matrix. Otherwise return None in its place. Default is True.
+
+    Returns
+    -------
+    L : csr_matrix or None
+        The interpolation matrix.
+    D : csr_matrix or None
+        The differentiation matrix.
+    """
+    # Rather than a single phase-wide interpolating polynomial, map each segment.
+    # To do this, find the nodes in the output grid which fall in each segment of the input
+    # grid.  Then build a Lagrange interpolating polynomial for that segment
+    L_blocks = []
+    D_blocks = []
+    num_segments = len(segment_indices)
+
+    for iseg in range(num_segments):
+        i1, i2 = segment_indices[iseg]
+        iptau_segi = input_node_ptau[i1:i2]
+        istau_segi = input_node_stau[i1:i2]
+
+        # The indices of the output grid that fall within this segment of the input grid
+        if same_nodes:
+            optau_segi = iptau_segi
+        else:
+            ptau_hi = segment_ends[iseg+1]
+            if iseg < num_segments - 1:
+                optau_segi = output_nodes_ptau[output_nodes_ptau <= ptau_hi]
+            else:
+                optau_segi = output_nodes_ptau
+
+            # Remove the captured nodes so we don't accidentally include them again
+            output_nodes_ptau = output_nodes_ptau[len(optau_segi):]
+
+        # # Now get the output nodes which fall in iseg in iseg's segment tau space.
+        ostau_segi = 2.0 * (optau_segi - iptau_segi[0]) / (iptau_segi[-1] - iptau_segi[0]) - 1
+
+        # Create the interpolation matrix and add it to the blocks
+        L, D = lagrange_matrices(istau_segi, ostau_segi,
+                                 compute_interp_matrix=compute_L,
+                                 compute_diff_matrix=compute_D)
+        L_blocks.append(L)
+        D_blocks.append(D)
+
+    L = sp.block_diag(L_blocks, format='csr') if compute_L else None
+    D = sp.block_diag(D_blocks, format='csr') if compute_D else None
+
+    for mat in (L, D):
+        if mat is not None:
+            mat.data.flags.writeable = False
+            mat.indices.flags.writeable = False
+            mat.indptr.flags.writeable = False
+
+    return L, D
+
+
 class TimeseriesOutputComp(om.ExplicitComponent):
     """
     Class definition of the TimeseriesOutputComp.
@@ -39,6 +128,11 @@ class TimeseriesOutputComp(om.ExplicitComponent):
         # Flag to set if no multiplication by the interpolation matrix is necessary
         self._no_interp = False
 
+        # _rate_jacs maps the name of each rate output to a tuple of (input_name, jac_val, jac_node_idxs).
+        # These are the only outputs whose partials are not constant.  Without them, the component is
+        # linear and compute_partials has nothing to do.
+        self._rate_jacs = {}
+
     def initialize(self):
         """
         Declare component options.
@@ -118,6 +212,12 @@ class TimeseriesOutputComp(om.ExplicitComponent):
         if not rate and self._no_interp:
             # Case 1: No outputs just echo inputs.
             # Jacobian values are just the scale factor
+            if _DIAGONAL_PARTIALS:
+                # The identity jacobian is declared as diagonal so that it carries no row or
+                # column indices, which would otherwise take twice the memory of the output itself.
+                self.declare_partials(of=output_name, wrt=input_name, val=1.0, diagonal=True)
+                return added_source
+
             jac_rows = jac_cols = np.arange(input_num_nodes * size, dtype=int)
             jac_val = 1.0
         else:
@@ -132,38 +232,25 @@ class TimeseriesOutputComp(om.ExplicitComponent):
                 # This is subject to noise with large numbers of nodes.
                 mat = self.interpolation_matrix
 
-            # Preallocate lists to hold data for jac
-            jac_data = []
-            jac_indices = []
-            jac_indptr = [0]
-
-            # Iterate over the dense dimension 'size'
-            for s in range(size):
-                # Extend the data and indices using the CSR attributes of mat
-                jac_data.extend(mat.data)
-                jac_indices.extend(mat.indices + s * input_num_nodes)
-
-                # For every non-zero row in mat, update jac's indptr
-                new_indptr = mat.indptr[1:] + s * len(mat.data)
-                jac_indptr.extend(new_indptr)
-
-            # Correct the last entry of jac_indptr
-            jac_indptr[-1] = len(jac_data)
-
-            # Construct the sparse jac matrix in CSR format
-            jac = sp.csr_matrix((jac_data, jac_indices, jac_indptr),
-                                shape=(output_num_nodes * size, input_num_nodes * size))
+            # The values at each node are flattened in row-major order, so each element of the
+            # matrix becomes a size x size identity block of the jacobian.
+            jac = sp.kron(mat, sp.eye(size), format='csr')
+            jac_rows, jac_cols, jac_val = sp.find(jac)
 
-            # Now, if you want to get the row and column indices of the non-zero entries in the jac matrix:
-            jac_rows, jac_cols = jac.nonzero()
+        if rate:
+            # The rate is divided by dt_dstau, so its partials are computed in compute_partials.
+            self._rate_jacs[output_name] = (input_name, jac_val, jac_rows // size)
 
-            # There's a chance that the input for this output was pulled from another variable with
-            # different units, so account for that with a conversion.
-            jac_val = np.squeeze(np.array(jac[jac_rows, jac_cols]))
+            self.declare_partials(of=output_name, wrt=input_name,
+                                  rows=jac_rows, cols=jac_cols)
 
-        self.declare_partials(of=output_name, wrt=input_name,
-                              rows=jac_rows, cols=jac_cols,
-                              val=jac_val)
+            self.declare_partials(of=output_name, wrt='dt_dstau',
+                                  rows=np.arange(output_num_nodes * size, dtype=int),
+                                  cols=np.repeat(np.arange(output_num_nodes, dtype=int), size))
+        else:
+            self.declare_partials(of=output_name, wrt=input_name,
+                                  rows=jac_rows, cols=jac_cols,
+                                  val=jac_val)
 
         return added_source
 
@@ -191,45 +278,16 @@ class TimeseriesOutputComp(om.ExplicitComponent):
         self.add_input('dt_dstau', shape=(self.input_num_nodes,), units=self.options['time_units'])
 
         # Build the interpolation matrix which maps from the input grid to the output grid.
-        # Rather than a single phase-wide interpolating polynomial, map each segment.
-        # To do this, find the nodes in the output grid which fall in each segment of the input
-        # grid.  Then build a Lagrange interpolating polynomial for that segment
-        L_blocks = []
-        D_blocks = []
-        output_nodes_ptau = ogd.node_ptau[ogd.subset_node_indices[output_subset]]
-
-        for iseg in range(igd.num_segments):
-            i1, i2 = igd.segment_indices[iseg]
-            iptau_segi = igd.node_ptau[i1:i2]
-            istau_segi = igd.node_stau[i1:i2]
-
-            # The indices of the output grid that fall within this segment of the input grid
-            if ogd is igd and output_subset == 'all':
-                optau_segi = iptau_segi
-            else:
-                ptau_hi = igd.segment_ends[iseg+1]
-                if iseg < igd.num_segments - 1:
-                    optau_segi = output_nodes_ptau[output_nodes_ptau <= ptau_hi]
-                else:
-                    optau_segi = output_nodes_ptau
-
-                # Remove the captured nodes so we don't accidentally include them again
-                output_nodes_ptau = output_nodes_ptau[len(optau_segi):]
-
-            # # Now get the output nodes which fall in iseg in iseg's segment tau space.
-            ostau_segi = 2.0 * (optau_segi - iptau_segi[0]) / (iptau_segi[-1] - iptau_segi[0]) - 1
-
-            # Create the interpolation matrix and add it to the blocks
-            L, D = lagrange_matrices(istau_segi, ostau_segi,
-                                     compute_interp_matrix=compute_L,
-                                     compute_diff_matrix=compute_D)
-            L_blocks.append(L)
-            D_blocks.append(D)
+        # The matrices are shared by all timeseries on identical grids.
+        L, D = _timeseries_matrices(igd.segment_indices, igd.node_ptau, igd.node_stau, igd.segment_ends,
+                                    ogd.node_ptau[ogd.subset_node_indices[output_subset]],
+                                    ogd is igd and output_subset == 'all',
+                                    compute_L=compute_L, compute_D=compute_D)
 
         if compute_L:
-            self.interpolation_matrix = sp.block_diag(L_blocks, format='csr')
+            self.interpolation_matrix = L
         if compute_D:
-            self.differentiation_matrix = sp.block_diag(D_blocks, format='csr')
+            self.differentiation_matrix = D
 
     def _configure_io(self, timeseries_options):
         """
@@ -313,3 +371,26 @@ class TimeseriesOutputComp(om.ExplicitComponent):
                 interp_vals = self.differentiation_matrix.dot(interp_vals) / dt_dstau
 
             outputs[output_name] = interp_vals
+
+    def compute_partials(self, inputs, partials):
+        """
+        Compute sub-jacobian parts of the rate outputs. The model is assumed to be in an unscaled state.
+
+        Parameters
+        ----------
+        inputs : Vector
+            Unscaled, dimensional input variables read via inputs[key].
+        partials : Jacobian
+            Subjac components written to partials[output_name, input_name].
+        """
+        if not self._rate_jacs:
+            return
+
+        dt_dstau = inputs['dt_dstau']
+
+        for output_name, (input_name, jac_val, jac_node_idxs) in self._rate_jacs.items():
+            partials[output_name, input_name] = jac_val / dt_dstau[jac_node_idxs]
+
+            inp = np.reshape(inputs[input_name], (self.input_num_nodes, -1))
+            rate = self.differentiation_matrix.dot(inp) / dt_dstau[:, np.newaxis]
+            partials[output_name, 'dt_dstau'] = (-rate / dt_dstau[:, np.newaxis]).ravel()
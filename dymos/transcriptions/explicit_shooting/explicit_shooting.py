@@ -8,6 +8,7 @@ from openmdao.utils.om_warnings import warn_deprecation
 from .explicit_shooting_continuity_comp import ExplicitShootingContinuityComp
 from ..transcription_base import TranscriptionBase
 from ..grid_data import BirkhoffGrid, GaussLobattoGrid, RadauGrid, UniformGrid, ChebyshevGaussLobattoGrid
+from .fixed_step_methods import fixed_step_methods
 from .ode_integration_comp import ODEIntegrationComp
 from ...utils.misc import get_rate_units, CoerceDesvar, reshape_val
 from ...utils.indexing import get_src_indices_by_row
@@ -35,6 +36,10 @@ class ExplicitShooting(TranscriptionBase):
     of parameters that impact the ODE ($\theta$). For Dymos, $\theta$ may include the phase parameters, or the node values
     that govern the shape of the controls.
 
+    With option `multiple_shooting`, the initial state of each segment after the first is an additional
+    design variable, and the continuity of the states between segments is enforced by nonlinear constraints.
+    The segments are then independent of one another and may be integrated concurrently (see option `num_workers`).
+
     Parameters
     ----------
     **kwargs : dict
@@ -49,7 +54,9 @@ class ExplicitShooting(TranscriptionBase):
         Declare transcription options.
         """
         self.options.declare('method', types=str, default='DOP853',
-                             desc='The integration method used.')
+                             desc='The integration method used. This is either a method of scipy.integrate.solve_ivp '
+                                  'or one of the fixed-step methods ' +
+                                  ', '.join([f"'{m}'" for m in fixed_step_methods]) + '.')
         self.options.declare('atol', types=float, default=1.0E-6)
         self.options.declare('rtol', types=float, default=1.0E-9)
         self.options.declare('first_step', types=float, allow_none=True, default=None)
@@ -59,6 +66,13 @@ class ExplicitShooting(TranscriptionBase):
                                   'the integration parameters. If False, only propagate the primal states. If only '
                                   'using this transcription to propagate an ODE and derivatives are nof needed, '
                                   'setting this option to False should result in faster execution.')
+        self.options.declare('sensitivity_mode', values=['forward', 'adjoint', 'auto'], default='forward',
+                             desc='The method used to compute the derivatives of the integrated states. In forward '
+                                  'mode the sensitivities of the states wrt the inputs of the integration are '
+                                  'propagated alongside the states. In adjoint mode the adjoints of the states at '
+                                  'each output node are propagated backward, which is less expensive when there '
+                                  'are fewer outputs than inputs. Option auto chooses between the two based on the '
+                                  'number of outputs and inputs.')
         self.options.declare('subprob_reports', default=False,
                              desc='Controls the reports made when running the subproblems for ExplicitShooting')
         self.options.declare('grid', types=(GaussLobattoGrid, ChebyshevGaussLobattoGrid,
@@ -74,10 +88,19 @@ class ExplicitShooting(TranscriptionBase):
                                   'dynamics being smoothed over in the outputs. When used for validation through '
                                   'simulation, it is generally wise to choose an output grid that is more dense '
                                   'than the input grid to capture this nonlinearity.')
-        self.options.declare('num_steps_per_segment', types=int, allow_none=True,
-                             default=None, desc='Number of integration steps in each segment',
-                             deprecation='Option `num_steps_per_segment is deprecated. ExplicitShooting now uses '
-                                         'adaptive-step methods.')
+        self.options.declare('num_steps_per_segment', types=int, lower=1, allow_none=True, default=None,
+                             desc='The minimum number of integration steps taken in each segment when using one of '
+                                  'the fixed-step methods. If None, 10 steps are taken. This option is ignored by '
+                                  'the adaptive-step methods of scipy.integrate.solve_ivp.')
+        self.options.declare('multiple_shooting', types=bool, default=False,
+                             desc='If True, the initial state of each segment after the first is a design '
+                                  'variable of the phase and the continuity of the states between segments is '
+                                  'enforced by constraints. The segments are then integrated independently.')
+        self.options.declare('num_workers', types=int, lower=1, default=1,
+                             desc='The number of processes used to integrate the segments concurrently when '
+                                  'multiple_shooting is True. Workers are forked from the current process, so '
+                                  'segments are integrated serially on platforms which do not support fork and '
+                                  'when the phase is run under MPI on more than one process.')
         self.options.declare('control_interp', values=['vandermonde', 'barycentric', 'cubic'], default='vandermonde',
                              desc='Control interpolation algorithm, one of either "vandermonde", "barycentric",'
                              ' or "cubic". In general, Vandermonde is faster but Barycentric is necessary for the'
@@ -270,6 +293,8 @@ class ExplicitShooting(TranscriptionBase):
 
         for name, options in phase.state_options.items():
             phase.promotes('integrator', inputs=[(f'states:{name}', f'initial_states:{name}')])
+            if integ._multiple_shooting:
+                phase.promotes('integrator', inputs=[f'segment_initial_states:{name}'])
             for ts_name, ts_options in phase._timeseries.items():
                 if f'{state_prefix}{name}' not in ts_options['outputs']:
                     phase.add_timeseries_output(name, output_name=f'{state_prefix}{name}',
@@ -288,6 +313,14 @@ class ExplicitShooting(TranscriptionBase):
                                      adder=options['adder'],
                                      ref0=options['ref0'],
                                      ref=options['ref'])
+            if options['opt'] and integ._multiple_shooting:
+                phase.add_design_var(name=f'segment_initial_states:{state_name}',
+                                     lower=options['lower'],
+                                     upper=options['upper'],
+                                     scaler=options['scaler'],
+                                     adder=options['adder'],
+                                     ref0=options['ref0'],
+                                     ref=options['ref'])
 
     def setup_ode(self, phase):
         """
@@ -298,17 +331,25 @@ class ExplicitShooting(TranscriptionBase):
         phase : dymos.Phase
             The phase object to which this transcription instance applies.
         """
+        num_steps_per_segment = self.options['num_steps_per_segment']
+        if num_steps_per_segment is None:
+            num_steps_per_segment = 10
+
         integ = ODEIntegrationComp(ode_class=phase.options['ode_class'],
                                    time_options=phase.time_options,
                                    state_options=phase.state_options,
                                    parameter_options=phase.parameter_options,
                                    control_options=phase.control_options,
                                    method=self.options['method'],
+                                   num_steps_per_segment=num_steps_per_segment,
+                                   multiple_shooting=self.options['multiple_shooting'],
+                                   num_workers=self.options['num_workers'],
                                    atol=self.options['atol'],
                                    rtol=self.options['rtol'],
                                    first_step=self.options['first_step'],
                                    max_step=self.options['max_step'],
                                    propagate_derivs=self.options['propagate_derivs'],
+                                   sensitivity_mode=self.options['sensitivity_mode'],
                                    input_grid_data=self.grid_data,
                                    output_grid_data=self._output_grid_data,
                                    ode_init_kwargs=phase.options['ode_init_kwargs'],
@@ -490,7 +531,7 @@ class ExplicitShooting(TranscriptionBase):
 
     def configure_defects(self, phase):
         """
-        Not used in ExplicitShooting.
+        Connect the continuity_comp to the values at the segment ends.
 
         Parameters
         ----------
@@ -523,10 +564,22 @@ class ExplicitShooting(TranscriptionBase):
                               f'continuity_comp.control_rates:{control_name}_rate2',
                               src_indices=src_idxs)
 
-        if any((controls_to_enforce, control_rates_to_enforce, control_rates2_to_enforce)):
+        states_to_enforce = set()
+
+        if any_state_cnty:
+            state_src_idxs = om.slicer[ogd.subset_node_indices['segment_ends'], ...]
+            for state_name, options in phase.state_options.items():
+                if options['continuity']:
+                    states_to_enforce.add(state_name)
+                    phase.connect(f'integrator.states_out:{state_name}',
+                                  f'continuity_comp.states:{state_name}',
+                                  src_indices=state_src_idxs)
+
+        if any((controls_to_enforce, control_rates_to_enforce, control_rates2_to_enforce, states_to_enforce)):
             phase.continuity_comp.configure_io(controls_to_enforce=controls_to_enforce,
                                                control_rates_to_enforce=control_rates_to_enforce,
-                                               control_rates2_to_enforce=control_rates2_to_enforce)
+                                               control_rates2_to_enforce=control_rates2_to_enforce,
+                                               states_to_enforce=states_to_enforce)
 
     def setup_timeseries_outputs(self, phase):
         """
@@ -722,7 +775,8 @@ class ExplicitShooting(TranscriptionBase):
         compressed = self.options['grid'].compressed
         transcription = self.options['grid'].transcription
 
-        state_continuity = False
+        state_continuity = self.options['multiple_shooting'] and num_seg > 1 and \
+            any([opts['continuity'] for opts in phase.state_options.values()])
         any_control_continuity = any([opts['continuity'] for opts in phase.control_options.values()])
         any_control_continuity = any_control_continuity and num_seg > 1 and not (compressed or transcription == 'radau-ps')
         any_rate_continuity = any([opts['rate_continuity'] or opts['rate2_continuity']
@@ -862,4 +916,12 @@ class ExplicitShooting(TranscriptionBase):
             val = vals[0]
         input_data = {f'initial_states:{name}': val}
 
+        if self.options['multiple_shooting'] and self.grid_data.num_segments > 1:
+            if np.isscalar(vals):
+                interp_vals = vals
+            else:
+                interp_vals = phase.interp(name, ys=vals, xs=time_vals, nodes='segment_ends',
+                                           kind=interpolation_kind or 'linear')[2::2, ...]
+            input_data[f'segment_initial_states:{name}'] = interp_vals
+
         return input_data
@@ -3,7 +3,7 @@ import numpy as np
 from ..grid_data import GaussLobattoGrid
 from ...utils.misc import get_rate_units
 
-from ..common.continuity_comp import ContinuityCompBase
+from ..common.continuity_comp import ContinuityCompBase, continuity_jac_pattern
 
 
 class ExplicitShootingContinuityComp(ContinuityCompBase):
@@ -20,28 +20,60 @@ class ExplicitShootingContinuityComp(ContinuityCompBase):
         self._controls_to_enforce = set()
         self._control_rates_to_enforce = set()
         self._control_rates2_to_enforce = set()
+        self._states_to_enforce = set()
 
         self.rate_jac_templates = {}
         self.name_maps = {}
 
-    def _configure_state_continuity(self):
-        # TODO This method will be used when multiple shooting is implemented.
-        pass
-
-        # state_options = self.options['state_options']
-        # num_segments = self.options['grid_data'].num_segments
-        # compressed = self.options['grid_data'].compressed
-        #
-        # if num_segments <= 1:
-        #     return
-        #
-        # super(ExplicitShootingContinuityComp, self)._configure_state_continuity()
-        #
-        # for state_name, options in state_options.items():
-        #     if options['continuity'] and not compressed:
-        #         # State continuity is nonlinear in (TBD) explicit multiple shooting phases
-        #         self.add_constraint(name=f'defect_states:{state_name}',
-        #                             equals=0.0, scaler=1.0, linear=False)
+    def _configure_state_continuity(self, states_to_enforce=None):
+        """
+        Configures state continuity for multiple shooting.
+
+        Parameters
+        ----------
+        states_to_enforce : set or Sequence of str or None
+            The names of the states whose values are to be enforced at segment boundaries.
+        """
+        state_options = self.options['state_options']
+        num_segend_nodes = self.options['grid_data'].subset_num_nodes['segment_ends']
+        num_segments = self.options['grid_data'].num_segments
+
+        self._states_to_enforce = set() if states_to_enforce is None else states_to_enforce
+
+        if num_segments <= 1:
+            return
+
+        for state_name in self._states_to_enforce:
+            options = state_options[state_name]
+            shape = options['shape']
+            size = np.prod(shape)
+            units = options['units']
+
+            self.name_maps[state_name] = {}
+            self.name_maps[state_name]['value_names'] = \
+                (f'states:{state_name}', f'defect_states:{state_name}')
+
+            self.add_input(name=f'states:{state_name}',
+                           shape=(num_segend_nodes,) + shape,
+                           desc=f'Values of state {state_name} at segment endpoint nodes',
+                           units=units)
+
+            self.add_output(name=f'defect_states:{state_name}',
+                            shape=(num_segments - 1,) + shape,
+                            desc=f'Consistency constraint values for state {state_name}',
+                            units=units)
+
+            rs, cs, vals = continuity_jac_pattern(num_segments, size)
+
+            self.declare_partials(f'defect_states:{state_name}', f'states:{state_name}',
+                                  val=vals, rows=rs, cols=cs)
+
+            # State continuity is nonlinear in multiple shooting since the state at the end of each segment is
+            # the result of the integration.
+            self.add_constraint(name=f'defect_states:{state_name}',
+                                scaler=options['continuity_scaler'],
+                                ref=options['continuity_ref'],
+                                equals=0.0, linear=False)
 
     def _configure_control_continuity(self, controls_to_enforce=None, control_rates_to_enforce=None,
                                       control_rates2_to_enforce=None):
@@ -83,17 +115,7 @@ class ExplicitShootingContinuityComp(ContinuityCompBase):
             rate2_units = get_rate_units(units, time_units, deriv=2)
 
             # Define the sparsity pattern for rate and rate2 continuity
-            rs_size1 = np.repeat(np.arange(num_segments - 1, dtype=int), 2)
-            cs_size1 = np.arange(1, num_segend_nodes - 1, dtype=int)
-
-            template = np.zeros((num_segments - 1, num_segend_nodes))
-            template[rs_size1, cs_size1] = 1.0
-            template = np.kron(template, np.eye(size))
-            rs, cs = template.nonzero()
-
-            vals = np.zeros(len(rs), dtype=float)
-            vals[0::2] = -1.0
-            vals[1::2] = 1.0
+            rs, cs, vals = continuity_jac_pattern(num_segments, size)
             self.rate_jac_templates[control_name] = vals
 
             #
@@ -202,9 +224,9 @@ class ExplicitShootingContinuityComp(ContinuityCompBase):
             self.add_input('t_duration', units=time_units, val=1.0, desc='time duration of the phase')
 
     def configure_io(self, controls_to_enforce=None, control_rates_to_enforce=None,
-                     control_rates2_to_enforce=None):
+                     control_rates2_to_enforce=None, states_to_enforce=None):
         """
-        Configures control continuity.
+        Configures state and control continuity.
 
         Each argument contains the names of those variables which require continuity.
 
@@ -216,6 +238,8 @@ class ExplicitShootingContinuityComp(ContinuityCompBase):
             The names of controls whose rates are to be enforced at segment boundaries.
         control_rates2_to_enforce : set or Sequence of str or None
             The names of controls whose second derivatives are to be enforced at the segment boundaries.
+        states_to_enforce : set or Sequence of str or None
+            The names of the states whose values are to be enforced at segment boundaries.
         """
         self.rate_jac_templates = {}
         self.name_maps = {}
@@ -223,10 +247,15 @@ class ExplicitShootingContinuityComp(ContinuityCompBase):
         self._configure_control_continuity(controls_to_enforce=controls_to_enforce,
                                            control_rates_to_enforce=control_rates_to_enforce,
                                            control_rates2_to_enforce=control_rates2_to_enforce)
-        self._configure_state_continuity()
+        self._configure_state_continuity(states_to_enforce=states_to_enforce)
+        self._configure_rate_continuity_partials()
 
     def _compute_state_continuity(self, inputs, outputs):
-        pass
+        for name in self._states_to_enforce:
+            input_name, output_name = self.name_maps[name]['value_names']
+            end_vals = inputs[input_name][1:-1:2, ...]
+            start_vals = inputs[input_name][2:-1:2, ...]
+            outputs[output_name] = start_vals - end_vals
 
     def _compute_control_continuity(self, inputs, outputs):
         control_options = self.options['control_options']
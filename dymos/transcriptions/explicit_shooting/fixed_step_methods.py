@@ -0,0 +1,52 @@
+"""
+Butcher tableaus of the fixed-step Runge-Kutta methods available to ODEIntegrationComp.
+
+Each method is defined by a dict with keys 'A' (the stage coefficient matrix), 'b' (the
+weights of each stage in the update), 'c' (the location of each stage within the step, as a
+fraction of the step size), and 'implicit' (True if any stage depends on itself or on a later
+stage, in which case the stages are solved for simultaneously).
+"""
+import numpy as np
+
+
+_sqrt3 = np.sqrt(3.0)
+_sqrt15 = np.sqrt(15.0)
+
+
+fixed_step_methods = {
+    # The classical fourth-order Runge-Kutta method.
+    'RK4': {'A': np.array([[0.0, 0.0, 0.0, 0.0],
+                           [0.5, 0.0, 0.0, 0.0],
+                           [0.0, 0.5, 0.0, 0.0],
+                           [0.0, 0.0, 1.0, 0.0]]),
+            'b': np.array([1 / 6, 1 / 3, 1 / 3, 1 / 6]),
+            'c': np.array([0.0, 0.5, 0.5, 1.0]),
+            'implicit': False},
+
+    # The fifth-order solution of the Dormand-Prince 5(4) pair (the method underlying scipy's RK45),
+    # used here without step size adaptation.
+    'DOPRI5': {'A': np.array([[0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+                              [1 / 5, 0.0, 0.0, 0.0, 0.0, 0.0],
+                              [3 / 40, 9 / 40, 0.0, 0.0, 0.0, 0.0],
+                              [44 / 45, -56 / 15, 32 / 9, 0.0, 0.0, 0.0],
+                              [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0.0, 0.0],
+                              [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656, 0.0]]),
+               'b': np.array([35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84]),
+               'c': np.array([0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0]),
+               'implicit': False},
+
+    # The two-stage, fourth-order Gauss-Legendre method.
+    'GL4': {'A': np.array([[1 / 4, 1 / 4 - _sqrt3 / 6],
+                           [1 / 4 + _sqrt3 / 6, 1 / 4]]),
+            'b': np.array([1 / 2, 1 / 2]),
+            'c': np.array([1 / 2 - _sqrt3 / 6, 1 / 2 + _sqrt3 / 6]),
+            'implicit': True},
+
+    # The three-stage, sixth-order Gauss-Legendre method.
+    'GL6': {'A': np.array([[5 / 36, 2 / 9 - _sqrt15 / 15, 5 / 36 - _sqrt15 / 30],
+                           [5 / 36 + _sqrt15 / 24, 2 / 9, 5 / 36 - _sqrt15 / 24],
+                           [5 / 36 + _sqrt15 / 30, 2 / 9 + _sqrt15 / 15, 5 / 36]]),
+            'b': np.array([5 / 18, 4 / 9, 5 / 18]),
+            'c': np.array([1 / 2 - _sqrt15 / 10, 1 / 2, 1 / 2 + _sqrt15 / 10]),
+            'implicit': True},
+}
@@ -113,6 +113,10 @@ class ODEEvaluationGroup(om.Group):
 
             # Add control interpolant
             if self._control_interp == 'barycentric':
+                if self._vec_size > 1:
+                    raise ValueError('ODEEvaluationGroup: Barycentric control interpolation only supports '
+                                     'evaluation at a single point (vec_size=1). Use \'vandermonde\' or '
+                                     '\'cubic\' control interpolation to evaluate the ODE at multiple points.')
                 self._control_comp = self.add_subsystem('control_interp',
                                                         BarycentricControlInterpComp(grid_data=igd,
                                                                                      control_options=c_options,
@@ -124,14 +128,16 @@ class ODEEvaluationGroup(om.Group):
                                                         VandermondeControlInterpComp(grid_data=igd,
                                                                                      control_options=c_options,
                                                                                      time_units=t_units,
-                                                                                     compute_derivs=self._compute_derivs),
+                                                                                     compute_derivs=self._compute_derivs,
+                                                                                     vec_size=self._vec_size),
                                                         promotes_inputs=['ptau', 'stau', 't_duration', 'dstau_dt'])
             else:
                 self._control_comp = self.add_subsystem('control_interp',
                                                         CubicSplineControlInterpComp(grid_data=igd,
                                                                                      control_options=c_options,
                                                                                      time_units=t_units,
-                                                                                     compute_derivs=self._compute_derivs),
+                                                                                     compute_derivs=self._compute_derivs,
+                                                                                     vec_size=self._vec_size),
                                                         promotes_inputs=['ptau', 'stau', 'dstau_dt', 't_duration'])
 
         ode = _make_ode_system(ode_class=self._ode_class,
@@ -193,13 +199,13 @@ class ODEEvaluationGroup(om.Group):
         self.add_design_var('t_initial')
         self.add_design_var('t_duration')
 
-        for tgts, var in [(targets, t_name), (t_phase_targets, f'{t_name}_phase'),
-                          (t_initial_targets, 't_initial'), (t_duration_targets, 't_duration')]:
+        for tgts, var, size in [(targets, t_name, vec_size), (t_phase_targets, f'{t_name}_phase', vec_size),
+                                (t_initial_targets, 't_initial', 1), (t_duration_targets, 't_duration', 1)]:
             for t in tgts:
                 self.promotes('ode', inputs=[(t, var)])
             if tgts:
                 self.set_input_defaults(name=var,
-                                        val=np.ones((1,)),
+                                        val=np.ones((size,)),
                                         units=units)
 
     def _configure_states(self):
@@ -220,7 +226,7 @@ class ODEEvaluationGroup(om.Group):
                 self.promotes('ode', inputs=[(tgt, var_name)])
             if targets:
                 self.set_input_defaults(name=var_name,
-                                        val=np.ones(shape),
+                                        val=np.ones((vec_size,) + shape),
                                         units=options['units'])
 
             self.connect(rate_path, f'state_rate_collector.state_rates_in:{name}_rate')
@@ -253,9 +259,15 @@ class ODEEvaluationGroup(om.Group):
             # Promote targets from the ODE
             for tgt in targets:
                 if tgt in options['static_targets']:
-                    shape = None
-                self.promotes('ode', inputs=[(tgt, var_name)],
-                              src_shape=shape)
+                    self.promotes('ode', inputs=[(tgt, var_name)])
+                elif self._vec_size > 1:
+                    # Broadcast the parameter value to each point at which the ODE is evaluated.
+                    self.promotes('ode', inputs=[(tgt, var_name)],
+                                  src_indices=om.slicer[np.zeros(self._vec_size, dtype=int), ...],
+                                  src_shape=shape)
+                else:
+                    self.promotes('ode', inputs=[(tgt, var_name)],
+                                  src_shape=shape)
             if targets:
                 self.set_input_defaults(name=var_name,
                                         val=1.0,
@@ -264,6 +276,7 @@ class ODEEvaluationGroup(om.Group):
     def _configure_controls(self):
         configure_controls_introspection(self._control_options, self.ode)
         time_units = self._time_options['units']
+        vec_size = self._vec_size
 
         if self._control_options:
             igd = self._input_grid_data
@@ -307,7 +320,7 @@ class ODEEvaluationGroup(om.Group):
                     self.promotes('ode', inputs=[(tgt, u_name)])
                 if targets:
                     self.set_input_defaults(name=u_name,
-                                            val=np.ones(shape),
+                                            val=np.ones((vec_size,) + shape),
                                             units=options['units'])
 
                 # Promote rate targets from the ODE
@@ -315,7 +328,7 @@ class ODEEvaluationGroup(om.Group):
                     self.promotes('ode', inputs=[(tgt, u_rate_name)])
                 if rate_targets:
                     self.set_input_defaults(name=u_rate_name,
-                                            val=np.ones(shape),
+                                            val=np.ones((vec_size,) + shape),
                                             units=rate_units)
 
                 # Promote rate2 targets from the ODE
@@ -323,7 +336,7 @@ class ODEEvaluationGroup(om.Group):
                     self.promotes('ode', inputs=[(tgt, u_rate2_name)])
                 if rate2_targets:
                     self.set_input_defaults(name=u_rate2_name,
-                                            val=np.ones(shape),
+                                            val=np.ones((vec_size,) + shape),
                                             units=rate2_units)
 
     def _get_rate_source_path(self, state_var):
@@ -1,14 +1,205 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from scipy.integrate import solve_ivp
 
 import openmdao.api as om
+from openmdao.utils.units import unit_conversion
 
 from ..._options import options as dymos_options
 
+from .fixed_step_methods import fixed_step_methods
 from .ode_evaluation_group import ODEEvaluationGroup
 from dymos.utils.misc import create_subprob
 
 
+# The ODEIntegrationComp whose segments are being integrated by a worker process. Workers are forked from the
+# integrating process and therefore inherit the component (along with its setup subproblems) rather than
+# unpickling it.
+_worker_integration_comp = None
+
+
+def _init_integration_worker(integration_comp):
+    """
+    Set the ODEIntegrationComp whose segments are integrated by this worker process.
+
+    Parameters
+    ----------
+    integration_comp : ODEIntegrationComp
+        The component inherited from the process which forked this worker.
+    """
+    global _worker_integration_comp
+    _worker_integration_comp = integration_comp
+
+
+def _integrate_segment_in_worker(args):
+    """
+    Integrate a single segment of the ODEIntegrationComp in a worker process.
+
+    Parameters
+    ----------
+    args : tuple
+        The arguments of ODEIntegrationComp._integrate_segment.
+
+    Returns
+    -------
+    np.array
+        The compressed state vector at each output node of the segment.
+    """
+    return _worker_integration_comp._integrate_segment(*args)
+
+
+class _SubprobIO(object):
+    """
+    Set the inputs of an ODE evaluation subproblem, evaluate it, and retrieve the state rates and their totals.
+
+    Resolving the absolute name and unit conversion of each variable through set_val and get_val on every
+    evaluation can cost more than the ODE itself. When fast is True they are resolved once, the inputs are written
+    directly into the outputs of their sources, the state rates are read directly from the output vector of the
+    subproblem, and a single total jacobian is reused for every derivative evaluation. This relies upon OpenMDAO
+    internals, so if any of them is unavailable the public set_val, get_val, run_model, and compute_totals methods
+    of the subproblem are used instead.
+
+    Parameters
+    ----------
+    subprob : Problem
+        The setup subproblem which evaluates the ODE.
+    input_units : dict
+        The units in which each input is set, keyed by its promoted name in the subproblem. A value of None
+        indicates that the input is set in the units of its source.
+    state_rate_names : dict
+        The promoted name of the rate of each state in the subproblem, keyed by the state name.
+    wrt : list of str
+        The promoted names of the inputs with respect to which the totals of the state rates are computed.
+    fast : bool
+        If True, access the vectors and total jacobian of the subproblem directly when they are available.
+    """
+    def __init__(self, subprob, input_units, state_rate_names, wrt, fast=True):
+        self._subprob = subprob
+        self._input_units = input_units
+        self._state_rate_names = state_rate_names
+        self._wrt = wrt
+        self._input_views = None
+        self._state_rate_views = None
+        self._run = subprob.run_model
+        self._total_jac = None
+
+        if fast:
+            self._bind_views()
+
+    @property
+    def fast(self):
+        """
+        Return True if the vectors of the subproblem are accessed directly.
+
+        Returns
+        -------
+        bool
+            True if the vectors of the subproblem are accessed directly.
+        """
+        return self._input_views is not None
+
+    def _bind_views(self):
+        """
+        Resolve the views of the source of each input and of each state rate in the subproblem vectors.
+        """
+        model = self._subprob.model
+        try:
+            abs2meta = model._var_allprocs_abs2meta['output']
+            input_views = {}
+            for name, units in self._input_units.items():
+                src = model.get_source(name)
+                src_units = abs2meta[src]['units']
+                if units is None or src_units is None or units == src_units:
+                    scale, offset = 1.0, 0.0
+                else:
+                    scale, offset = unit_conversion(units, src_units)
+                input_views[name] = (model._outputs._abs_get_val(src), scale, offset)
+
+            state_rate_views = {}
+            for state_name, rate_name in self._state_rate_names.items():
+                state_rate_views[state_name] = model._outputs._abs_get_val(model.get_source(rate_name))
+
+            run = model.run_solve_nonlinear
+        except (AttributeError, KeyError):
+            return
+
+        self._input_views = input_views
+        self._state_rate_views = state_rate_views
+        self._run = run
+
+    def set_input(self, name, val):
+        """
+        Set the value of an input of the subproblem.
+
+        Parameters
+        ----------
+        name : str
+            The promoted name of the input.
+        val : float or np.array
+            The value of the input in the units given for it in input_units.
+        """
+        if self._input_views is None:
+            self._subprob.set_val(name, val, units=self._input_units[name])
+            return
+
+        view, scale, offset = self._input_views[name]
+        if offset == 0.0:
+            view[:] = np.ravel(val) * scale
+        else:
+            view[:] = (np.ravel(val) + offset) * scale
+
+    def run(self):
+        """
+        Evaluate the subproblem with the current input values.
+        """
+        self._run()
+
+    def get_state_rate(self, state_name):
+        """
+        Return the flattened value of the rate of the given state.
+
+        Parameters
+        ----------
+        state_name : str
+            The name of the state.
+
+        Returns
+        -------
+        np.array
+            The flattened value of the state rate.
+        """
+        if self._state_rate_views is None:
+            return self._subprob.get_val(self._state_rate_names[state_name]).ravel()
+        return self._state_rate_views[state_name]
+
+    def compute_totals(self):
+        """
+        Compute the totals of the state rates with respect to the wrt inputs.
+
+        Returns
+        -------
+        dict
+            The totals of the state rates in flat_dict format, keyed by the promoted names.
+        """
+        of = list(self._state_rate_names.values())
+
+        if self.fast and self._total_jac is None:
+            try:
+                from openmdao.core.total_jac import _TotalJacInfo
+                self._total_jac = _TotalJacInfo(self._subprob, of, self._wrt, 'flat_dict',
+                                                approx=self._subprob.model._owns_approx_jac,
+                                                driver_scaling=False)
+            except (ImportError, AttributeError, TypeError):
+                self._total_jac = False
+
+        if self._total_jac:
+            return self._total_jac.compute_totals()
+
+        return self._subprob.compute_totals(of=of, wrt=self._wrt)
+
+
 class ODEIntegrationComp(om.ExplicitComponent):
     """
     A component to perform explicit integration with a generic ODE integrator/IVP solver.
@@ -56,6 +247,11 @@ class ODEIntegrationComp(om.ExplicitComponent):
         self.parameter_options = parameter_options or {}
         self.control_options = control_options or {}
         self._eval_subprob = None
+        self._batch_subprobs = {}
+        self._subprob_io = {}
+        self._fast_subprob_io = True
+        self._executor = None
+        self._segment_idx = None
         self._input_grid_data = input_grid_data
         self._output_grid_data = output_grid_data if output_grid_data is not None else input_grid_data
         self._reports = reports
@@ -70,6 +266,10 @@ class ODEIntegrationComp(om.ExplicitComponent):
         self.theta_size = 0
         self.z_size = 0
 
+        self._state_input_names = {}
+        self._param_input_names = {}
+        self._control_input_names = {}
+
         self._state_rate_of_names = []
         self._totals_of_names = []
         self._totals_wrt_names = []
@@ -84,7 +284,25 @@ class ODEIntegrationComp(om.ExplicitComponent):
         Declare options for the ODEIntegrationComp.
         """
         self.options.declare('ode_class', desc='System defining the ODE', recordable=False)
-        self.options.declare('method', default='DOP853', desc='The integration method used.')
+        self.options.declare('method', default='DOP853',
+                             desc='The integration method used. This is either a method of scipy.integrate.solve_ivp '
+                                  'or one of the fixed-step methods ' +
+                                  ', '.join([f"'{m}'" for m in fixed_step_methods]) + '.')
+        self.options.declare('num_steps_per_segment', types=int, lower=1, default=10,
+                             desc='The minimum number of integration steps taken in each segment when using one of '
+                                  'the fixed-step methods. Steps are sized such that each output node is at a step '
+                                  'boundary.')
+        self.options.declare('multiple_shooting', types=bool, default=False,
+                             desc='If True, the initial state of each segment after the first is provided by the '
+                                  'input segment_initial_states rather than by the final state of the previous '
+                                  'segment. The segments are then independent of one another and may be '
+                                  'integrated concurrently.')
+        self.options.declare('num_workers', types=int, lower=1, default=1,
+                             desc='The number of processes used to integrate the segments concurrently when '
+                                  'multiple_shooting is True. Workers are forked from the current process the first '
+                                  'time the segments are integrated and are reused until the component is setup '
+                                  'again or cleaned up. Segments are integrated serially on platforms which do not '
+                                  'support fork and when the component is run under MPI on more than one process.')
         self.options.declare('atol', types=float, default=1.0E-6)
         self.options.declare('rtol', types=float, default=1.0E-9)
         self.options.declare('first_step', types=float, allow_none=True, default=None)
@@ -92,16 +310,39 @@ class ODEIntegrationComp(om.ExplicitComponent):
         self.options.declare('propagate_derivs', types=bool, default=True,
                              desc='If True, propagate the state and derivatives of the state and time with respect to '
                                   'the integration parameters. If False, only propagate the primal states.')
+        self.options.declare('sensitivity_mode', values=['forward', 'adjoint', 'auto'], default='forward',
+                             desc='The method used to compute the derivatives of the states at the output nodes '
+                                  'when propagate_derivs is True. In forward mode the sensitivities of the '
+                                  'states are propagated alongside the states. In adjoint mode the states are '
+                                  'propagated forward and the adjoints of the outputs are propagated backward, '
+                                  'which requires one adjoint per output rather than one sensitivity per input. '
+                                  'Option auto uses adjoint mode when there are fewer outputs than inputs. Adjoint '
+                                  'mode is not available for the fixed-step methods.')
         self.options.declare('ode_init_kwargs', types=dict, allow_none=True, default=None)
         self.options.declare('control_interp', values=['vandermonde', 'barycentric', 'cubic'], default='vandermonde',
                              desc='Control interpolation algorithm, one of either "vandermonde" or "barycentric". In '
                              'general, Vandermonde is faster but Barycentric is necessary for the Birkhoff '
                              'transcription where the number of nodes per segment can exceed 20 to 30.')
 
-    def _setup_subprob(self):
-        self._eval_subprob = p = create_subprob(base_name=f'{self.pathname}_subprob',
-                                                comm=self.comm,
-                                                reports=self._reports)
+    def _create_eval_subprob(self, base_name, vec_size=1, compute_derivs=True):
+        """
+        Create and setup a subproblem which evaluates the ODE at vec_size points simultaneously.
+
+        Parameters
+        ----------
+        base_name : str
+            The base name of the subproblem.
+        vec_size : int
+            The number of points at which the ODE is evaluated in a single call to run_model.
+        compute_derivs : bool
+            If True, the subproblem is setup such that the derivatives of the state rates can be computed.
+
+        Returns
+        -------
+        Problem
+            The setup subproblem.
+        """
+        p = create_subprob(base_name=base_name, comm=self.comm, reports=self._reports)
 
         p.model.add_subsystem('ode_eval',
                               ODEEvaluationGroup(ode_class=self.options['ode_class'],
@@ -111,7 +352,8 @@ class ODEIntegrationComp(om.ExplicitComponent):
                                                  control_options=self.control_options,
                                                  ode_init_kwargs=self.options['ode_init_kwargs'],
                                                  input_grid_data=self._input_grid_data,
-                                                 compute_derivs=self.options['propagate_derivs'],
+                                                 compute_derivs=compute_derivs,
+                                                 vec_size=vec_size,
                                                  control_interp=self.options['control_interp'],
                                                  calc_exprs=self._calc_exprs),
                               promotes_inputs=['*'],
@@ -123,11 +365,84 @@ class ODEIntegrationComp(om.ExplicitComponent):
         p.setup(check=None, parent=self)
         p.final_setup()
 
-    def _set_segment_index(self, idx):
+        return p
+
+    def _setup_subprob(self):
+        # Any existing workers were forked with the previous subproblems.
+        self._shutdown_executor()
+        self._eval_subprob = self._create_eval_subprob(base_name=f'{self.pathname}_subprob',
+                                                       compute_derivs=self.options['propagate_derivs'])
+        self._batch_subprobs = {}
+        self._subprob_io = {}
+
+    def _get_subprob_io(self, subprob):
+        """
+        Return the object through which the inputs and state rates of the given subproblem are accessed.
+
+        Parameters
+        ----------
+        subprob : Problem
+            The subproblem which evaluates the ODE.
+
+        Returns
+        -------
+        _SubprobIO
+            The object which sets the inputs of the subproblem, evaluates it, and retrieves its state rates.
+        """
+        if subprob in self._subprob_io:
+            return self._subprob_io[subprob]
+
+        t_units = self.time_options['units']
+
+        input_units = {self.time_options['name']: t_units, 't_initial': t_units, 't_duration': t_units}
+        input_units.update({name: None for name in self._state_input_names.values()})
+        input_units.update({name: None for name in self._param_input_names.values()})
+        input_units.update({name: None for name in self._control_input_names.values()})
+
+        state_rate_names = {name: f'state_rate_collector.state_rates:{name}_rate' for name in self.state_options}
+
+        io = _SubprobIO(subprob, input_units, state_rate_names, self._totals_wrt_names,
+                        fast=self._fast_subprob_io)
+        self._subprob_io[subprob] = io
+        return io
+
+    def _get_batch_subprob(self, batch_size):
+        """
+        Return the subproblem used to evaluate the ODE for batch_size trajectories simultaneously.
+
+        The batch subproblems only compute the state rates (not their derivatives) and are created the first time a
+        given batch size is requested.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of trajectories evaluated in each call to the ODE.
+
+        Returns
+        -------
+        Problem
+            The subproblem which evaluates the ODE at batch_size points.
+        """
+        if batch_size not in self._batch_subprobs:
+            p = self._create_eval_subprob(base_name=f'{self.pathname}_batch_{batch_size}_subprob',
+                                          vec_size=batch_size, compute_derivs=False)
+            if self._segment_idx is not None:
+                p.model._get_subsystem('ode_eval').set_segment_index(self._segment_idx)
+            self._batch_subprobs[batch_size] = p
+        return self._batch_subprobs[batch_size]
+
+    def _set_segment_index(self, idx, subprob=None):
         """
         Set the index of the segment being integrated.
+
+        If subprob is None, the index is set on the single-point evaluation subproblem and the batch subproblems.
         """
-        self._eval_subprob.model._get_subsystem('ode_eval').set_segment_index(idx)
+        if subprob is None:
+            self._segment_idx = idx
+            for p in [self._eval_subprob] + list(self._batch_subprobs.values()):
+                p.model._get_subsystem('ode_eval').set_segment_index(idx)
+        else:
+            subprob.model._get_subsystem('ode_eval').set_segment_index(idx)
 
     def _setup_time(self):
         if self._standalone_mode:
@@ -167,6 +482,8 @@ class ODEIntegrationComp(om.ExplicitComponent):
         configure time in the parent ExplicitShooting transcription object.
         """
         num_output_rows = self._num_output_rows
+        ogd = self._output_grid_data
+        num_seg = ogd.num_segments
 
         # The total size of the entire state vector
         self.x_size = 0
@@ -174,6 +491,19 @@ class ODEIntegrationComp(om.ExplicitComponent):
 
         self._state_input_names = {}
         self._state_output_names = {}
+        self._segment_state_input_names = {}
+
+        # The output nodes whose states depend on each state input, and the row of that input which sets the
+        # initial state of the node's segment, when using multiple shooting.
+        self._multiple_shooting = self.options['multiple_shooting'] and num_seg > 1
+        self._state_input_node_idxs = {}
+        if self._multiple_shooting:
+            node_seg_idxs = np.repeat(np.arange(num_seg, dtype=int), ogd.subset_num_nodes_per_segment['all'])
+            first_seg_nodes = np.where(node_seg_idxs == 0)[0]
+            other_seg_nodes = np.where(node_seg_idxs > 0)[0]
+            self._state_input_node_idxs['states'] = (first_seg_nodes, np.zeros_like(first_seg_nodes))
+            self._state_input_node_idxs['segment_initial_states'] = (other_seg_nodes,
+                                                                     node_seg_idxs[other_seg_nodes] - 1)
 
         # The indices of each state in x
         self.state_idxs = {}
@@ -199,6 +529,13 @@ class ODEIntegrationComp(om.ExplicitComponent):
                             units=options['units'],
                             desc=f'final value of state {state_name}')
 
+            if self._multiple_shooting:
+                self._segment_state_input_names[state_name] = f'segment_initial_states:{state_name}'
+                self.add_input(self._segment_state_input_names[state_name],
+                               shape=(num_seg - 1,) + options['shape'],
+                               units=options['units'],
+                               desc=f'initial value of state {state_name} in each segment after the first')
+
             self.state_sizes[state_name] = state_size = np.prod(options['shape'], dtype=int)
 
             # The indices of the state in x
@@ -211,9 +548,18 @@ class ODEIntegrationComp(om.ExplicitComponent):
             self.declare_partials(of=self._state_output_names[state_name],
                                   wrt='t_duration')
 
-            for state_name_wrt in self.state_options:
-                self.declare_partials(of=self._state_output_names[state_name],
-                                      wrt=f'states:{state_name_wrt}')
+            for state_name_wrt, options_wrt in self.state_options.items():
+                if self._multiple_shooting:
+                    # The states in each segment only depend on the initial state of that segment.
+                    wrt_size = np.prod(options_wrt['shape'], dtype=int)
+                    for prefix in ('states', 'segment_initial_states'):
+                        rows, cols = self._get_state_input_jac_pattern(prefix, state_size, wrt_size)
+                        self.declare_partials(of=self._state_output_names[state_name],
+                                              wrt=f'{prefix}:{state_name_wrt}',
+                                              rows=rows, cols=cols)
+                else:
+                    self.declare_partials(of=self._state_output_names[state_name],
+                                          wrt=f'states:{state_name_wrt}')
 
             for param_name_wrt in self.parameter_options:
                 self.declare_partials(of=self._state_output_names[state_name],
@@ -223,6 +569,32 @@ class ODEIntegrationComp(om.ExplicitComponent):
                 self.declare_partials(of=self._state_output_names[state_name],
                                       wrt=f'controls:{control_name_wrt}')
 
+    def _get_state_input_jac_pattern(self, prefix, of_size, wrt_size):
+        """
+        Return the sparsity pattern of the partials of a state output wrt a state input when using multiple shooting.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix of the state input, either 'states' or 'segment_initial_states'.
+        of_size : int
+            The size of the output state at a single node.
+        wrt_size : int
+            The size of the input state at a single node.
+
+        Returns
+        -------
+        rows : np.array
+            The row indices of the nonzero partials.
+        cols : np.array
+            The column indices of the nonzero partials.
+        """
+        node_idxs, input_idxs = self._state_input_node_idxs[prefix]
+        shape = (len(node_idxs), of_size, wrt_size)
+        rows = node_idxs[:, np.newaxis, np.newaxis] * of_size + np.arange(of_size)[np.newaxis, :, np.newaxis]
+        cols = input_idxs[:, np.newaxis, np.newaxis] * wrt_size + np.arange(wrt_size)[np.newaxis, np.newaxis, :]
+        return np.broadcast_to(rows, shape).ravel(), np.broadcast_to(cols, shape).ravel()
+
     def _setup_parameters(self):
         if self._standalone_mode:
             self._configure_parameters()
@@ -416,8 +788,60 @@ class ODEIntegrationComp(om.ExplicitComponent):
         self._dt_dz_0 = np.zeros((1, self.z_size))
         self._dt_dz_0[0, self.x_size] = 1.
 
-        self._dtheta_dz = np.zeros((self.theta_size, self.z_size))
-        self._dtheta_dz[:, -self.theta_size:] = np.eye(self.theta_size)
+        self._configure_sensitivity_idxs()
+
+        num_outputs = self.x_size * nn
+        if self.options['sensitivity_mode'] == 'auto':
+            self._use_adjoint = num_outputs < self.z_size and self.options['method'] not in fixed_step_methods
+        else:
+            self._use_adjoint = self.options['sensitivity_mode'] == 'adjoint'
+
+    def _configure_sensitivity_idxs(self):
+        """
+        Determine which columns of the sensitivities are nonzero in each segment.
+
+        The ODE in a given segment depends on time, the parameters, the polynomial controls, and only those
+        control input nodes which lie within the segment (unless the controls are interpolated with a cubic
+        spline which spans the entire phase). The sensitivities wrt the control input nodes of later segments
+        are zero, so they are not propagated.
+        """
+        igd = self._input_grid_data
+        num_seg = igd.num_segments
+        n_x = self.x_size
+
+        seg_theta_idxs = [[np.arange(2 + self.p_size, dtype=int)] for i in range(num_seg)]
+
+        for control_name, options in self.control_options.items():
+            theta_idxs = np.arange(self.theta_size, dtype=int)[self._control_idxs_in_theta[control_name]]
+            if options['control_type'] == 'polynomial' or self.options['control_interp'] == 'cubic':
+                for i in range(num_seg):
+                    seg_theta_idxs[i].append(theta_idxs)
+            else:
+                size = np.prod(options['shape'], dtype=int)
+                theta_idxs = theta_idxs.reshape((-1, size))
+                disc_seg_idxs = igd.subset_segment_indices['control_disc']
+                for i in range(num_seg):
+                    disc_idxs_in_seg = np.arange(disc_seg_idxs[i, 0], disc_seg_idxs[i, 1], dtype=int)
+                    input_idxs_in_seg = igd.input_maps['dynamic_control_input_to_disc'][disc_idxs_in_seg]
+                    seg_theta_idxs[i].append(theta_idxs[input_idxs_in_seg, ...].ravel())
+
+        self._seg_sens_idxs = []
+        active_z = np.arange(n_x + 2, dtype=int)
+
+        for i in range(num_seg):
+            seg_z = n_x + np.concatenate(seg_theta_idxs[i])
+            if self._multiple_shooting:
+                # Each segment is only sensitive to its own initial state and inputs.
+                active_z = np.union1d(np.arange(n_x + 2, dtype=int), seg_z)
+            else:
+                # The sensitivities wrt the inputs of earlier segments carry through to later segments.
+                active_z = np.union1d(active_z, seg_z)
+            theta_pos = np.where(active_z >= n_x)[0]
+            self._seg_sens_idxs.append({'z': active_z,
+                                        'theta_pos': theta_pos,
+                                        'theta': active_z[theta_pos] - n_x,
+                                        't0_pos': np.searchsorted(active_z, n_x),
+                                        'td_pos': np.searchsorted(active_z, n_x + 1)})
 
     def setup(self):
         """
@@ -432,6 +856,11 @@ class ODEIntegrationComp(om.ExplicitComponent):
                                f'\n{self._input_grid_data.segment_ends}\n and the output grid segment ends are \n'
                                f'{self._output_grid_data.segment_ends}.')
 
+        if self.options['sensitivity_mode'] == 'adjoint' and self.options['method'] in fixed_step_methods:
+            raise ValueError(f'{self.pathname}: Option sensitivity_mode=\'adjoint\' requires an integration method '
+                             f'of scipy.integrate.solve_ivp but the fixed-step method '
+                             f'\'{self.options["method"]}\' is being used.')
+
         self._num_output_rows = ogd.subset_num_nodes['all']
 
         self._totals_of_names = []
@@ -444,51 +873,48 @@ class ODEIntegrationComp(om.ExplicitComponent):
         self._setup_states()
         self._setup_storage()
 
-    def _subprob_run_model(self, x, t, theta, linearize=True):
+    def _subprob_run_model(self, x, t, theta, linearize=True, subprob=None):
         """
         Set inputs to the model given x, t, and theta, evaluate the model, and linearize if requested.
 
         Parameters
         ----------
         x : np.ndarray
-            A flattened, contiguous vector of the state values.
+            The state values with one row for each point at which the ODE is evaluated.
         t : float
             The current time of the integration.
         theta : np.ndarray
             A flattened, contiguous vector of the ODE parameter values.
         linearize : bool
             If True, linearize the model after calling run_model.
-
-        Returns
-        -------
-
+        subprob : Problem or None
+            The subproblem to be evaluated, or None to use the single-point evaluation subproblem.
         """
-        subprob = self._eval_subprob
-        t_units = self.time_options['units']
+        subprob = self._eval_subprob if subprob is None else subprob
         t_name = self.time_options['name']
+        vec_size = x.shape[0]
+
+        io = self._get_subprob_io(subprob)
 
         # transcribe time
-        subprob.set_val(t_name, t, units=t_units)
-        subprob.set_val('t_initial', theta[0], units=t_units)
-        subprob.set_val('t_duration', theta[1], units=t_units)
+        io.set_input(t_name, t)
+        io.set_input('t_initial', theta[0])
+        io.set_input('t_duration', theta[1])
 
         # transcribe states
         for name in self.state_options:
-            input_name = self._state_input_names[name]
-            subprob.set_val(input_name, x[0, self.state_idxs[name]])
+            io.set_input(self._state_input_names[name], x[:, self.state_idxs[name]].reshape((vec_size, -1)))
 
         # transcribe parameters
         for name in self.parameter_options:
-            input_name = self._param_input_names[name]
-            subprob.set_val(input_name, theta[self._parameter_idxs_in_theta[name]])
+            io.set_input(self._param_input_names[name], theta[self._parameter_idxs_in_theta[name]])
 
         # transcribe controls
         for name in self.control_options:
-            input_name = self._control_input_names[name]
-            subprob.set_val(input_name, theta[self._control_idxs_in_theta[name]])
+            io.set_input(self._control_input_names[name], theta[self._control_idxs_in_theta[name]])
 
         # Re-run in case the inputs have changed.
-        subprob.run_model()
+        io.run()
 
         if linearize:
             subprob.model._linearize(None)
@@ -537,9 +963,9 @@ class ODEIntegrationComp(om.ExplicitComponent):
         # pack the resulting array
         if eval_solution:
             f = np.zeros((self.x_size, 1))
+            io = self._get_subprob_io(self._eval_subprob)
             for name in self.state_options:
-                state_rate = self._eval_subprob.get_val(f'state_rate_collector.state_rates:{name}_rate')
-                f[self.state_idxs[name]] = state_rate.reshape((self.state_sizes[name], 1))
+                f[self.state_idxs[name], 0] = io.get_state_rate(name)
         else:
             f = None
 
@@ -548,9 +974,7 @@ class ODEIntegrationComp(om.ExplicitComponent):
             f_x = np.zeros((self.x_size, self.x_size))
             f_theta = np.zeros((self.x_size, self.theta_size))
 
-            totals = self._eval_subprob.compute_totals(of=self._state_rate_of_names,
-                                                       wrt=self._totals_wrt_names,
-                                                       use_abs_names=False)
+            totals = self._get_subprob_io(self._eval_subprob).compute_totals()
 
             for state_name in self.state_options:
                 of_name = f'state_rate_collector.state_rates:{state_name}_rate'
@@ -581,10 +1005,50 @@ class ODEIntegrationComp(om.ExplicitComponent):
 
         return f, f_x, f_t, f_theta
 
-    def _f_augmented(self, t, y, theta, dtheta_dz):
+    def _tangent_rates(self, x_dot, f_x, f_t, f_theta, dx_dz, dt_dz, td, sens_idxs):
         """
-        The ODE-callable function where y is the augmented state vector, theta are the ODE parameters, and dtheta_dz
-        are the sensitivities of the ODE parameters to the integration parameters.
+        Compute the rates of the sensitivities of the states in the nonzero columns of the sensitivities.
+
+        Since the ODE parameters are the integration parameters with the first num_x columns removed, the product
+        of f_theta and the sensitivities of theta wrt z is formed by placing the columns of f_theta rather than by
+        a matrix multiplication.
+
+        Parameters
+        ----------
+        x_dot : np.array
+            The state rates.
+        f_x : np.array
+            The derivatives of the state rates wrt the states.
+        f_t : np.array
+            The derivatives of the state rates wrt time.
+        f_theta : np.array
+            The derivatives of the state rates wrt the ODE parameters.
+        dx_dz : np.array or None
+            The nonzero columns of the sensitivities of the states, or None if they are not to be included.
+        dt_dz : np.array
+            The nonzero columns of the sensitivities of time.
+        td : float
+            The duration of the phase.
+        sens_idxs : dict
+            The indices of the nonzero columns of the sensitivities in the current segment.
+
+        Returns
+        -------
+        np.array
+            The rates of the nonzero columns of the sensitivities of the states.
+        """
+        rates = f_t @ dt_dz
+        if dx_dz is not None:
+            rates += f_x @ dx_dz
+        rates[:, sens_idxs['theta_pos']] += f_theta[:, sens_idxs['theta']]
+        rates[:, sens_idxs['td_pos']] += np.ravel(x_dot) / td
+        return rates
+
+    def _f_augmented(self, t, y, theta, sens_idxs):
+        """
+        The ODE-callable function where y is the augmented state vector and theta are the ODE parameters.
+
+        Only the columns of the sensitivities that can be nonzero in the current segment are included in y.
 
         Parameters
         ----------
@@ -594,10 +1058,8 @@ class ODEIntegrationComp(om.ExplicitComponent):
             The augmented state vector.
         theta : np.array
             The ODE parameter vector. The first two elements are t_initial and t_duration.
-        dtheta_dz : np.array
-            The sensitivities of the ODE parameters wrt the integration parameters. Since the ODE parameters are
-            just the integration parameters with the first num_x columns removed, this is a matrix of shape
-            (num_dtheta, num_z - num_x).
+        sens_idxs : dict
+            The indices of the nonzero columns of the sensitivities in the current segment.
 
         Returns
         -------
@@ -605,80 +1067,94 @@ class ODEIntegrationComp(om.ExplicitComponent):
             The rates associated with each state in the augmented state vector (primal and tangent states).
         """
         n_x = self.x_size
-        n_theta = self.theta_size
-        n_z = n_x + n_theta
+        n_c = len(sens_idxs['z'])
 
         x = y[:n_x].reshape((1, n_x))
         td = theta[1]
 
-        dx_dz = y[n_x:n_x + n_x * n_z].reshape((n_x, n_z))
-        dt_dz = y[-n_z:].reshape((1, n_z))
+        dx_dz = y[n_x:n_x + n_x * n_c].reshape((n_x, n_c))
+        dt_dz = y[-n_c:].reshape((1, n_c))
 
         x_dot, f_x, f_t, f_theta = self.eval_ode(x, t, theta, eval_solution=True, eval_derivs=True)
 
-        dh_dz = np.zeros((1, n_z))
-        dh_dz[0, n_x + 1] = 1. / td
-        dt_dz_dot = dh_dz
+        dt_dz_dot = np.zeros((n_c,))
+        dt_dz_dot[sens_idxs['td_pos']] = 1. / td
 
-        dx_dz_dot = f_x @ dx_dz + f_t @ dt_dz + f_theta @ dtheta_dz + x_dot @ dt_dz_dot
+        dx_dz_dot = self._tangent_rates(x_dot, f_x, f_t, f_theta, dx_dz, dt_dz, td, sens_idxs)
 
         y_dot = np.concatenate((x_dot.ravel(),
                                 dx_dz_dot.ravel(),
-                                dt_dz_dot.ravel()))
+                                dt_dz_dot))
 
         return y_dot
 
-    def _f_primal(self, t, x, theta):
+    def _f_adjoint(self, t, y, theta, num_adj, x_interp, sens_idxs):
         """
-        The ODE-callable function where y is the augmented state vector, theta are the ODE parameters, and dtheta_dz
-        are the sensitivities of the ODE parameters to the integration parameters.
+        The ODE-callable function for the backward propagation of the adjoints of the outputs.
+
+        The state vector y contains the adjoints of num_adj outputs, lambda, followed by the integral of the
+        adjoints times the explicit dependence of the state rates on the integration parameters, G, in the nonzero
+        columns of the sensitivities.
 
         Parameters
         ----------
         t : float
             The current value of the integration variable.
-        x : np.array
-            The primal state vector.
+        y : np.array
+            The adjoint state vector.
         theta : np.array
             The ODE parameter vector. The first two elements are t_initial and t_duration.
+        num_adj : int
+            The number of adjoints being propagated.
+        x_interp : callable
+            The dense output of the primal states from the forward propagation of the current segment.
+        sens_idxs : dict
+            The indices of the nonzero columns of the sensitivities in the current segment.
 
         Returns
         -------
         y_dot : np.array
-            The rates associated with each state in the augmented state vector (primal and tangent states).
+            The rates associated with each state in the adjoint state vector.
         """
         n_x = self.x_size
-        _x = x.reshape((1, n_x))
+        n_c = len(sens_idxs['z'])
 
-        x_dot, _, _, _ = self.eval_ode(_x, t, theta, eval_solution=True, eval_derivs=False)
+        x = x_interp(t).reshape((1, n_x))
+        lam = y[:n_x * num_adj].reshape((n_x, num_adj))
 
-        return x_dot.ravel()
+        x_dot, f_x, f_t, f_theta = self.eval_ode(x, t, theta, eval_solution=True, eval_derivs=True)
 
-    def _propagate(self, inputs, propagate_derivs=None, x_out=None, t_out=None, dx_dz_out=None,
-                   dt_dz_out=None):
+        dt_dz = np.zeros((1, n_c))
+        dt_dz[0, sens_idxs['t0_pos']] = 1.
+        dt_dz[0, sens_idxs['td_pos']] = (t - theta[0]) / theta[1]
+
+        g = self._tangent_rates(x_dot, f_x, f_t, f_theta, None, dt_dz, theta[1], sens_idxs)
+
+        lam_dot = -f_x.T @ lam
+        G_dot = -lam.T @ g
+
+        return np.concatenate((lam_dot.ravel(), G_dot.ravel()))
+
+    def _propagate_adjoint(self, inputs, x_out, t_out, dx_dz_out, dt_dz_out):
         """
-        Propagate the augmented state, y = [x, dx_dz, dt_dz].
+        Propagate the primal states forward and then the adjoints of the states at each output node backward.
+
+        The adjoints of the outputs at each node are introduced as the backward propagation passes that node, so
+        each interval between output nodes is integrated once. In single shooting the adjoints are carried
+        backward across the segment boundaries to the start of the phase.
 
         Parameters
         ----------
         inputs : Vector
-            The inputs of the integration. This is an OpenMDAO vector including the initial state values, t_initial
-            and t_duration, the ODE parameters, the control values, and the polynomial control values.
-        propagate_derivs : bool or None
-            If True, propagate the derivatives of the states and of time w.r.t. the integration parameters vector, z.
-            If None, use the value of option `propagate_derivs` to determine if derivatives should be computed.
-        x_out : np.array or None.
-            Pre-allocated storage for the results of the state propagation. If None, this storage will be allocated
-            on each call to _propagate.
-        t_out : np.array or None.
-            Pre-allocated storage for the time at the requested nodes. If None, this storage will be allocated
-            on each call to _propagate.
-        dx_dz_out : np.array or None.
-            Pre-allocated storage for the results of the propagation of derivatives of the states with respect to the
-            integration parameters. If None, this storage will be allocated on each call to _propagate.
-        dt_dz_out : np.array or None.
-            Pre-allocated storage derivatives of the time at the requested nodes with respect to the integration
-            parameters. If None, this storage will be allocated on each call to _propagate.
+            The inputs of the integration.
+        x_out : np.array
+            Storage for the integrated states at each node.
+        t_out : np.array
+            Storage for the time at each node.
+        dx_dz_out : np.array
+            Storage for the derivatives of the states at each node wrt the integration parameters.
+        dt_dz_out : np.array
+            Storage for the derivatives of time at each node wrt the integration parameters.
 
         Returns
         -------
@@ -697,86 +1173,807 @@ class ODEIntegrationComp(om.ExplicitComponent):
         atol = self.options['atol']
         rtol = self.options['rtol']
         ogd = self._output_grid_data
+        nnps = self._nnps
+        n_x = self.x_size
+        n_z = self.z_size
+        num_seg = ogd.num_segments
 
-        nn = sum(self._nnps)
-        if x_out is None:
-            x_out = np.zeros((nn, self.x_size))
-        if t_out is None:
-            t_out = np.zeros((nn, 1))
+        x0, theta = self._unpack_inputs(inputs)
 
-        if propagate_derivs is None:
-            _propagate_derivs = self.options['propagate_derivs']
-        else:
-            _propagate_derivs = propagate_derivs
+        # Propagate the primal states forward, keeping the dense output of each segment.
+        x_interps = []
+        seg_t_eval = []
+        row_seg_i = 0
 
-        n_x = self.x_size
-        n_theta = self.theta_size
-        n_z = n_x + n_theta
-        nnps = self._nnps
+        for i in range(num_seg):
+            self._set_segment_index(i)
 
-        # Extract the input values
-        x0 = np.zeros((self.x_size,))
-        theta = np.zeros((self.theta_size,))
+            eval_nodes_ptau = ogd.node_ptau[ogd.segment_indices[i, 0]: ogd.segment_indices[i, 1]]
+            t_eval_seg = theta[0] + 0.5 * (eval_nodes_ptau + 1) * theta[1]
 
-        for state_name in self.state_options:
-            state_initial_val = inputs[self._state_input_names[state_name]]
-            x0[self.state_idxs[state_name]] = state_initial_val.ravel()
+            if self._multiple_shooting and i > 0:
+                x0 = self._get_segment_initial_y(i, inputs, theta, propagate_derivs=False)
 
-        theta[0] = t_initial = inputs['t_initial'].ravel()[0]
-        theta[1] = t_duration = inputs['t_duration'].ravel()[0]
+            sol = solve_ivp(self._f_primal, t_span=(t_eval_seg[0], t_eval_seg[-1]), t_eval=t_eval_seg, y0=x0,
+                            args=(theta,), method=method, first_step=first_step, max_step=max_step, atol=atol,
+                            rtol=rtol, dense_output=True)
 
-        for param_name in self.parameter_options:
-            param_val = inputs[self._param_input_names[param_name]]
-            theta[self._parameter_idxs_in_theta[param_name]] = param_val.ravel()
+            if not sol.success:
+                raise om.AnalysisError(f'solve_ivp failed: {sol.message}')
 
-        for control_name in self.control_options:
-            control_vals = inputs[self._control_input_names[control_name]]
-            theta[self._control_idxs_in_theta[control_name]] = control_vals.ravel()
+            x_out[row_seg_i:row_seg_i + nnps[i], :] = sol.y.T
+            t_out[row_seg_i:row_seg_i + nnps[i], 0] = t_eval_seg
+            dt_dz_out[row_seg_i:row_seg_i + nnps[i], :] = 0.0
+            dt_dz_out[row_seg_i:row_seg_i + nnps[i], n_x] = 1.0
+            dt_dz_out[row_seg_i:row_seg_i + nnps[i], n_x + 1] = 0.5 * (eval_nodes_ptau + 1)
 
-        if _propagate_derivs:
-            if dx_dz_out is None:
-                dx_dz_out = np.zeros((nn, self.x_size * self.z_size))
-            if dt_dz_out is None:
-                dt_dz_out = np.zeros((nn, self.z_size))
+            x_interps.append(sol.sol)
+            seg_t_eval.append(t_eval_seg)
+            x0 = sol.y[:, -1]
+            row_seg_i += nnps[i]
 
-            y0 = np.concatenate((x0.ravel(), self._dx_dz_0.ravel(), self._dt_dz_0.ravel()))
-        else:
-            dx_dz_out = None
-            dt_dz_out = None
-            y0 = x0.ravel()
+        # Propagate the adjoints backward.
+        dx_dz = dx_dz_out.reshape((-1, n_x, n_z))
+        seg_start_rows = np.cumsum(nnps) - nnps
 
-        row_seg_i = 0
+        for i in reversed(range(num_seg)):
+            if self._multiple_shooting or i == num_seg - 1:
+                lam = np.zeros((n_x, 0))
+                G = np.zeros((0, n_z))
+                out_rows = []
 
-        for i in range(ogd.num_segments):
             self._set_segment_index(i)
+            sens_idxs = self._seg_sens_idxs[i]
+            z_idxs = sens_idxs['z']
+            t_eval_seg = seg_t_eval[i]
 
-            eval_nodes_ptau = ogd.node_ptau[ogd.segment_indices[i, 0]: ogd.segment_indices[i, 1]]
+            for k in reversed(range(nnps[i])):
+                # Introduce the adjoints of the states at this output node.
+                lam = np.hstack((lam, np.eye(n_x)))
+                G = np.vstack((G, np.zeros((n_x, n_z))))
+                out_rows.append(seg_start_rows[i] + k)
 
-            t_eval_seg = t_initial + 0.5 * (eval_nodes_ptau + 1) * t_duration
-            t_span_seg = (t_eval_seg[0], t_eval_seg[-1])
+                if k == 0 or t_eval_seg[k] == t_eval_seg[k - 1]:
+                    continue
 
-            if _propagate_derivs:
-                # The augmented initial state vector
-                sol = solve_ivp(self._f_augmented, t_span=t_span_seg, t_eval=t_eval_seg, y0=y0,
-                                args=(theta, self._dtheta_dz), method=method, first_step=first_step, max_step=max_step,
-                                atol=atol, rtol=rtol)
-                dx_dz_out[row_seg_i:row_seg_i + nnps[i], :] = sol.y.T[:, n_x:n_x + n_x * n_z]
-                dt_dz_out[row_seg_i:row_seg_i + nnps[i], :] = sol.y.T[:, -n_z:]
-            else:
-                sol = solve_ivp(self._f_primal, t_span=t_span_seg, t_eval=t_eval_seg, y0=y0, args=(theta,),
-                                method=method, first_step=first_step, max_step=max_step, atol=atol, rtol=rtol)
+                num_adj = lam.shape[1]
+                y0 = np.concatenate((lam.ravel(), G[:, z_idxs].ravel()))
+                sol = solve_ivp(self._f_adjoint, t_span=(t_eval_seg[k], t_eval_seg[k - 1]), y0=y0,
+                                args=(theta, num_adj, x_interps[i], sens_idxs), method=method,
+                                first_step=first_step, max_step=max_step, atol=atol, rtol=rtol)
 
-            if not sol.success:
-                raise om.AnalysisError(f'solve_ivp failed: {sol.message}')
+                if not sol.success:
+                    raise om.AnalysisError(f'solve_ivp failed: {sol.message}')
 
-            x_out[row_seg_i:row_seg_i + nnps[i], :] = sol.y.T[:, :n_x]  # Save solution to the output nodes
-            t_out[row_seg_i:row_seg_i + nnps[i], 0] = sol.t
-            y0 = sol.y.T[-1, :]  # Set initial y for the next segment
-            row_seg_i += nnps[i]  # Increment node associated with the start of the next segment
+                lam = sol.y[:n_x * num_adj, -1].reshape((n_x, num_adj))
+                G[:, z_idxs] = sol.y[n_x * num_adj:, -1].reshape((num_adj, len(z_idxs)))
+
+            if self._multiple_shooting or i == 0:
+                # The states at the start of the segment are its initial state inputs.
+                G[:, :n_x] += lam.T
+                for j, row in enumerate(out_rows):
+                    dx_dz[row, ...] = G[j * n_x: (j + 1) * n_x, :]
 
         return x_out, t_out, dx_dz_out, dt_dz_out
 
-    def compute(self, inputs, outputs):
+    def _compress_augmented_state(self, y, z_idxs):
+        """
+        Return the augmented state vector with only the given columns of the sensitivities.
+
+        Parameters
+        ----------
+        y : np.array
+            The augmented state vector including every column of the sensitivities.
+        z_idxs : np.array
+            The indices of the columns of the sensitivities to be kept.
+
+        Returns
+        -------
+        np.array
+            The compressed augmented state vector.
+        """
+        n_x = self.x_size
+        n_z = self.z_size
+        dx_dz = y[n_x:n_x + n_x * n_z].reshape((n_x, n_z))
+        return np.concatenate((y[:n_x], dx_dz[:, z_idxs].ravel(), y[-n_z:][z_idxs]))
+
+    def _expand_augmented_state(self, y, z_idxs):
+        """
+        Return the augmented state vectors including every column of the sensitivities.
+
+        Parameters
+        ----------
+        y : np.array
+            The compressed augmented state vector at each node, with one row per node.
+        z_idxs : np.array
+            The indices of the columns of the sensitivities which are included in y.
+
+        Returns
+        -------
+        np.array
+            The augmented state vector at each node, with one row per node.
+        """
+        n_x = self.x_size
+        n_z = self.z_size
+        n_c = len(z_idxs)
+        num_rows = y.shape[0]
+
+        y_full = np.zeros((num_rows, n_x + n_x * n_z + n_z))
+        y_full[:, :n_x] = y[:, :n_x]
+        y_full[:, n_x:n_x + n_x * n_z].reshape((num_rows, n_x, n_z))[:, :, z_idxs] = \
+            y[:, n_x:n_x + n_x * n_c].reshape((num_rows, n_x, n_c))
+        y_full[:, -n_z:][:, z_idxs] = y[:, -n_c:]
+        return y_full
+
+    def _f_primal(self, t, x, theta):
+        """
+        The ODE-callable function where y is the augmented state vector, theta are the ODE parameters, and dtheta_dz
+        are the sensitivities of the ODE parameters to the integration parameters.
+
+        Parameters
+        ----------
+        t : float
+            The current value of the integration variable.
+        x : np.array
+            The primal state vector.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+
+        Returns
+        -------
+        y_dot : np.array
+            The rates associated with each state in the augmented state vector (primal and tangent states).
+        """
+        n_x = self.x_size
+        _x = x.reshape((1, n_x))
+
+        x_dot, _, _, _ = self.eval_ode(_x, t, theta, eval_solution=True, eval_derivs=False)
+
+        return x_dot.ravel()
+
+    def _f_primal_batch(self, t, y, theta, subprob):
+        """
+        The ODE-callable function for a batch of trajectories which are propagated simultaneously.
+
+        Parameters
+        ----------
+        t : float or np.array
+            The current value of the integration variable, or its value for each trajectory in the batch.
+        y : np.array
+            The concatenated primal state vectors of each trajectory in the batch.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        subprob : Problem
+            The subproblem which evaluates the ODE for every trajectory in the batch.
+
+        Returns
+        -------
+        y_dot : np.array
+            The concatenated state rates of each trajectory in the batch.
+        """
+        x = y.reshape((-1, self.x_size))
+        batch_size = x.shape[0]
+
+        self._subprob_run_model(x, t, theta, linearize=False, subprob=subprob)
+
+        x_dot = np.zeros_like(x)
+        io = self._get_subprob_io(subprob)
+        for name in self.state_options:
+            x_dot[:, self.state_idxs[name]] = io.get_state_rate(name).reshape((batch_size, self.state_sizes[name]))
+
+        return x_dot.ravel()
+
+    def _solve_implicit_stages(self, t, x, h, theta, tableau):
+        """
+        Solve for the stage rates of an implicit fixed-step method by fixed-point iteration.
+
+        Each iteration evaluates the ODE at every stage point of the step in a single call to a
+        subproblem with num_nodes equal to the number of stages.
+
+        Parameters
+        ----------
+        t : float
+            The value of the integration variable at the start of the step.
+        x : np.array
+            The primal state vector at the start of the step.
+        h : float
+            The step size.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        tableau : dict
+            The Butcher tableau of the method.
+
+        Returns
+        -------
+        K : np.array
+            The state rates at each stage, with shape (num_stages, x_size).
+        """
+        A = tableau['A']
+        t_stages = t + tableau['c'] * h
+        num_stages = len(t_stages)
+        atol = self.options['atol']
+        rtol = self.options['rtol']
+
+        if self.options['control_interp'] == 'barycentric':
+            # The barycentric interpolant only evaluates a single point at a time.
+            def f_stages(X):
+                return np.array([self._f_primal(t_stages[i], X[i, :], theta) for i in range(num_stages)])
+        else:
+            subprob = self._get_batch_subprob(num_stages)
+
+            def f_stages(X):
+                return self._f_primal_batch(t_stages, X.ravel(), theta, subprob).reshape((num_stages, -1))
+
+        K = f_stages(np.tile(x, (num_stages, 1)))
+        for _ in range(100):
+            K_new = f_stages(x + h * A @ K)
+            converged = np.all(np.abs(h * (K_new - K)) <= atol + rtol * np.abs(x))
+            K = K_new
+            if converged:
+                return K
+
+        raise om.AnalysisError(f'{self.pathname}: Failed to converge the stages of fixed-step method '
+                               f'{self.options["method"]} at t={t}.')
+
+    def _fixed_step(self, t, y, h, theta, tableau, propagate_derivs, sens_idxs=None):
+        """
+        Take a single step of a fixed-step Runge-Kutta method.
+
+        When propagating derivatives, the tangent states are advanced by differentiating the Runge-Kutta update
+        itself, so the resulting sensitivities are the exact derivatives of the discrete solution. The stage
+        tangents are obtained from a single block linear solve.
+
+        Parameters
+        ----------
+        t : float
+            The value of the integration variable at the start of the step.
+        y : np.array
+            The state vector at the start of the step. This is the augmented state vector if propagate_derivs
+            is True, otherwise it is the primal state vector.
+        h : float
+            The step size.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        tableau : dict
+            The Butcher tableau of the method.
+        propagate_derivs : bool
+            If True, y is the augmented state vector and the tangent states are propagated with the primal states.
+        sens_idxs : dict or None
+            The indices of the nonzero columns of the sensitivities in the current segment. Required if
+            propagate_derivs is True.
+
+        Returns
+        -------
+        np.array
+            The state vector at the end of the step.
+        """
+        A = tableau['A']
+        b = tableau['b']
+        c = tableau['c']
+        num_stages = len(b)
+        n_x = self.x_size
+        x = y[:n_x]
+
+        if tableau['implicit']:
+            K = self._solve_implicit_stages(t, x, h, theta, tableau)
+            X = x + h * A @ K
+            stage_derivs = [self.eval_ode(X[i:i + 1, :], t + c[i] * h, theta,
+                                          eval_solution=False, eval_derivs=True)[1:]
+                            for i in range(num_stages)] if propagate_derivs else None
+        else:
+            K = np.zeros((num_stages, n_x))
+            X = np.zeros((num_stages, n_x))
+            stage_derivs = []
+            for i in range(num_stages):
+                X[i, :] = x + h * A[i, :i] @ K[:i, :]
+                x_dot, f_x, f_t, f_theta = self.eval_ode(X[i:i + 1, :], t + c[i] * h, theta,
+                                                         eval_solution=True, eval_derivs=propagate_derivs)
+                K[i, :] = x_dot.ravel()
+                stage_derivs.append((f_x, f_t, f_theta))
+
+        x_new = x + h * b @ K
+
+        if not propagate_derivs:
+            return x_new
+
+        n_z = len(sens_idxs['z'])
+        dx_dz = y[n_x:n_x + n_x * n_z].reshape((n_x, n_z))
+        dt_dz = y[-n_z:].reshape((1, n_z))
+
+        dh_dz = np.zeros((1, n_z))
+        dh_dz[0, sens_idxs['td_pos']] = 1. / theta[1]
+
+        # Solve (I - h * blockdiag(f_x) @ kron(A, I)) @ dK_dz = R for the stage rate tangents.
+        M = np.eye(num_stages * n_x)
+        R = np.zeros((num_stages * n_x, n_z))
+        for i, (f_x, f_t, f_theta) in enumerate(stage_derivs):
+            rows = np.s_[i * n_x: (i + 1) * n_x]
+            dt_dz_i = dt_dz + c[i] * h * dh_dz
+            R[rows, :] = self._tangent_rates(K[i, :], f_x, f_t, f_theta, dx_dz, dt_dz_i, theta[1], sens_idxs)
+            M[rows, :] -= h * np.kron(A[i, :], f_x)
+
+        dK_dz = np.linalg.solve(M, R).reshape((num_stages, n_x, n_z))
+
+        dx_dz_new = dx_dz + h * np.tensordot(b, dK_dz, axes=1)
+        dt_dz_new = dt_dz + h * dh_dz
+
+        return np.concatenate((x_new, dx_dz_new.ravel(), dt_dz_new.ravel()))
+
+    def _integrate_fixed_step(self, t_eval, y0, theta, propagate_derivs, sens_idxs=None):
+        """
+        Integrate a segment with a fixed-step method, providing the solution at each point in t_eval.
+
+        Parameters
+        ----------
+        t_eval : np.array
+            The values of the integration variable at which the solution is requested, in increasing order.
+        y0 : np.array
+            The state vector at t_eval[0]. This is the augmented state vector if propagate_derivs is True,
+            otherwise it is the primal state vector.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        propagate_derivs : bool
+            If True, y0 is the augmented state vector and the tangent states are propagated with the primal states.
+        sens_idxs : dict or None
+            The indices of the nonzero columns of the sensitivities in the current segment. Required if
+            propagate_derivs is True.
+
+        Returns
+        -------
+        np.array
+            The state vector at each point in t_eval, with shape (len(t_eval), len(y0)).
+        """
+        tableau = fixed_step_methods[self.options['method']]
+        num_steps = self.options['num_steps_per_segment']
+        seg_span = t_eval[-1] - t_eval[0]
+
+        y = np.zeros((len(t_eval), len(y0)))
+        y[0, :] = y0
+
+        for k in range(len(t_eval) - 1):
+            y[k + 1, :] = y[k, :]
+            dt = t_eval[k + 1] - t_eval[k]
+            if dt == 0.0:
+                continue
+            # Subdivide the interval between output nodes so that the segment takes at least num_steps steps.
+            n = max(1, int(np.ceil(num_steps * dt / seg_span - 1.0E-9)))
+            h = dt / n
+            for j in range(n):
+                y[k + 1, :] = self._fixed_step(t_eval[k] + j * h, y[k + 1, :], h, theta, tableau, propagate_derivs,
+                                               sens_idxs=sens_idxs)
+
+        return y
+
+    def _unpack_inputs(self, inputs):
+        """
+        Extract the initial state vector and the ODE parameter vector from the inputs.
+
+        Parameters
+        ----------
+        inputs : Vector or dict
+            The inputs of the integration, keyed by the input names of this component.
+
+        Returns
+        -------
+        x0 : np.array
+            The flattened, contiguous vector of initial state values.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        """
+        x0 = np.zeros((self.x_size,))
+        theta = np.zeros((self.theta_size,))
+
+        for state_name in self.state_options:
+            state_initial_val = inputs[self._state_input_names[state_name]]
+            x0[self.state_idxs[state_name]] = np.ravel(state_initial_val)
+
+        theta[0] = np.ravel(inputs['t_initial'])[0]
+        theta[1] = np.ravel(inputs['t_duration'])[0]
+
+        for param_name in self.parameter_options:
+            param_val = inputs[self._param_input_names[param_name]]
+            theta[self._parameter_idxs_in_theta[param_name]] = np.ravel(param_val)
+
+        for control_name in self.control_options:
+            control_vals = inputs[self._control_input_names[control_name]]
+            theta[self._control_idxs_in_theta[control_name]] = np.ravel(control_vals)
+
+        return x0, theta
+
+    def propagate_batch(self, initial_states, inputs=None):
+        """
+        Propagate a batch of trajectories which differ only in their initial state values.
+
+        All trajectories in the batch are advanced together by a single integration, and each evaluation of the
+        ODE computes the state rates of every trajectory in one call to run_model of a subproblem that was setup
+        with num_nodes equal to the number of trajectories. This amortizes the framework overhead of each ODE
+        evaluation across the batch, such as when simulating Monte Carlo dispersions of the initial state.
+        Only the primal states are propagated.
+
+        Parameters
+        ----------
+        initial_states : dict of {str: ArrayLike}
+            The initial values of the states for each trajectory, keyed by state name. Each value has shape
+            (batch_size,) + state shape. States which are not given take their value from the inputs.
+        inputs : Vector or dict or None
+            The remaining inputs of the integration (t_initial, t_duration, parameters, and controls) keyed by the
+            input names of this component. If None, the current inputs of this component are used.
+
+        Returns
+        -------
+        x_out : np.array
+            The integrated states at each output node, with shape (batch_size, num_nodes, x_size).
+        t_out : np.array
+            The time (or integration variable) value at each output node.
+        """
+        if not initial_states:
+            raise ValueError(f'{self.pathname}: propagate_batch requires the initial value of at least one state.')
+
+        for name in initial_states:
+            if name not in self.state_options:
+                raise ValueError(f'{self.pathname}: \'{name}\' is not a state of the integrated ODE.')
+
+        method = self.options['method']
+        first_step = self.options['first_step']
+        max_step = self.options['max_step']
+        atol = self.options['atol']
+        rtol = self.options['rtol']
+        ogd = self._output_grid_data
+        nnps = self._nnps
+        n_x = self.x_size
+
+        if method in fixed_step_methods:
+            raise ValueError(f'{self.pathname}: propagate_batch requires an integration method of '
+                             f'scipy.integrate.solve_ivp but the fixed-step method \'{method}\' is being used.')
+
+        if inputs is None:
+            if self._inputs is None:
+                raise RuntimeError(f'{self.pathname}: The inputs of the integration are not available until '
+                                   f'final_setup has been called.')
+            inputs = self._inputs
+
+        x0, theta = self._unpack_inputs(inputs)
+        t_initial = theta[0]
+        t_duration = theta[1]
+
+        batch_size = len(next(iter(initial_states.values())))
+        x0_batch = np.tile(x0, (batch_size, 1))
+        for name, val in initial_states.items():
+            x0_batch[:, self.state_idxs[name]] = np.reshape(val, (batch_size, self.state_sizes[name]))
+
+        subprob = self._get_batch_subprob(batch_size)
+
+        x_out = np.zeros((batch_size, sum(nnps), n_x))
+        t_out = np.zeros((sum(nnps), 1))
+
+        y0 = x0_batch.ravel()
+        row_seg_i = 0
+
+        for i in range(ogd.num_segments):
+            self._set_segment_index(i, subprob=subprob)
+
+            eval_nodes_ptau = ogd.node_ptau[ogd.segment_indices[i, 0]: ogd.segment_indices[i, 1]]
+
+            t_eval_seg = t_initial + 0.5 * (eval_nodes_ptau + 1) * t_duration
+            t_span_seg = (t_eval_seg[0], t_eval_seg[-1])
+
+            sol = solve_ivp(self._f_primal_batch, t_span=t_span_seg, t_eval=t_eval_seg, y0=y0,
+                            args=(theta, subprob), method=method, first_step=first_step, max_step=max_step,
+                            atol=atol, rtol=rtol)
+
+            if not sol.success:
+                raise om.AnalysisError(f'solve_ivp failed: {sol.message}')
+
+            x_out[:, row_seg_i:row_seg_i + nnps[i], :] = \
+                sol.y.reshape((batch_size, n_x, nnps[i])).transpose((0, 2, 1))
+            t_out[row_seg_i:row_seg_i + nnps[i], 0] = sol.t
+            y0 = sol.y[:, -1]
+            row_seg_i += nnps[i]
+
+        return x_out, t_out
+
+    def _integrate_segment(self, i, y0, theta, propagate_derivs):
+        """
+        Integrate the state vector across a single segment.
+
+        When propagate_derivs is True, only the columns of the sensitivities which may be nonzero in the segment
+        are propagated and returned.
+
+        Parameters
+        ----------
+        i : int
+            The index of the segment.
+        y0 : np.array
+            The state vector at the start of the segment. This is the augmented state vector if propagate_derivs
+            is True, otherwise it is the primal state vector.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        propagate_derivs : bool
+            If True, y0 is the augmented state vector and the tangent states are propagated with the primal states.
+
+        Returns
+        -------
+        np.array
+            The state vector at each output node of the segment, with one row per node. If propagate_derivs is
+            True, this is the augmented state vector compressed to the columns of the sensitivities of the segment.
+        """
+        method = self.options['method']
+        first_step = self.options['first_step']
+        max_step = self.options['max_step']
+        atol = self.options['atol']
+        rtol = self.options['rtol']
+        ogd = self._output_grid_data
+
+        self._set_segment_index(i)
+
+        eval_nodes_ptau = ogd.node_ptau[ogd.segment_indices[i, 0]: ogd.segment_indices[i, 1]]
+
+        t_eval_seg = theta[0] + 0.5 * (eval_nodes_ptau + 1) * theta[1]
+        t_span_seg = (t_eval_seg[0], t_eval_seg[-1])
+
+        if propagate_derivs:
+            # Only propagate the columns of the sensitivities which may be nonzero in this segment.
+            sens_idxs = self._seg_sens_idxs[i]
+            y0 = self._compress_augmented_state(y0, sens_idxs['z'])
+
+        if method in fixed_step_methods:
+            y_seg = self._integrate_fixed_step(t_eval_seg, y0, theta, propagate_derivs=propagate_derivs,
+                                               sens_idxs=sens_idxs if propagate_derivs else None)
+        else:
+            if propagate_derivs:
+                # The augmented initial state vector
+                sol = solve_ivp(self._f_augmented, t_span=t_span_seg, t_eval=t_eval_seg, y0=y0,
+                                args=(theta, sens_idxs), method=method, first_step=first_step, max_step=max_step,
+                                atol=atol, rtol=rtol)
+            else:
+                sol = solve_ivp(self._f_primal, t_span=t_span_seg, t_eval=t_eval_seg, y0=y0, args=(theta,),
+                                method=method, first_step=first_step, max_step=max_step, atol=atol, rtol=rtol)
+
+            if not sol.success:
+                raise om.AnalysisError(f'solve_ivp failed: {sol.message}')
+
+            y_seg = sol.y.T
+
+        return y_seg
+
+    def _propagate_segment(self, i, y0, theta, propagate_derivs):
+        """
+        Propagate the state vector across a single segment.
+
+        Parameters
+        ----------
+        i : int
+            The index of the segment.
+        y0 : np.array
+            The state vector at the start of the segment. This is the augmented state vector if propagate_derivs
+            is True, otherwise it is the primal state vector.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        propagate_derivs : bool
+            If True, y0 is the augmented state vector and the tangent states are propagated with the primal states.
+
+        Returns
+        -------
+        np.array
+            The state vector at each output node of the segment, with shape (num_nodes_in_segment, len(y0)).
+        """
+        y_seg = self._integrate_segment(i, y0, theta, propagate_derivs)
+
+        if propagate_derivs:
+            y_seg = self._expand_augmented_state(y_seg, self._seg_sens_idxs[i]['z'])
+
+        return y_seg
+
+    def _get_segment_initial_y(self, i, inputs, theta, propagate_derivs):
+        """
+        Return the state vector at the start of a segment after the first when using multiple shooting.
+
+        Parameters
+        ----------
+        i : int
+            The index of the segment, which is at least 1.
+        inputs : Vector or dict
+            The inputs of the integration, keyed by the input names of this component.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        propagate_derivs : bool
+            If True, return the augmented state vector, otherwise return the primal state vector.
+
+        Returns
+        -------
+        np.array
+            The state vector at the start of segment i.
+        """
+        ogd = self._output_grid_data
+
+        x0 = np.zeros((self.x_size,))
+        for state_name in self.state_options:
+            x0[self.state_idxs[state_name]] = np.ravel(inputs[self._segment_state_input_names[state_name]][i - 1])
+
+        if not propagate_derivs:
+            return x0
+
+        # The sensitivities of the segment are taken wrt its own initial state, while time at the start of the
+        # segment depends upon t_initial and t_duration.
+        ptau0 = ogd.node_ptau[ogd.segment_indices[i, 0]]
+        dt_dz_0 = np.zeros((1, self.z_size))
+        dt_dz_0[0, self.x_size] = 1.0
+        dt_dz_0[0, self.x_size + 1] = 0.5 * (ptau0 + 1)
+
+        return np.concatenate((x0, self._dx_dz_0.ravel(), dt_dz_0.ravel()))
+
+    def _get_executor(self):
+        """
+        Return the pool of worker processes which integrate the segments concurrently.
+
+        Returns
+        -------
+        ProcessPoolExecutor or None
+            The pool of worker processes, or None if the segments are to be integrated serially.
+        """
+        num_workers = min(self.options['num_workers'], self._output_grid_data.num_segments)
+
+        if num_workers <= 1 or self.comm.size > 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            return None
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=num_workers,
+                                                 mp_context=multiprocessing.get_context('fork'),
+                                                 initializer=_init_integration_worker, initargs=(self,))
+        return self._executor
+
+    def _shutdown_executor(self):
+        """
+        Shut down the pool of worker processes, if one has been started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def cleanup(self):
+        """
+        Clean up resources prior to exit.
+        """
+        super().cleanup()
+        self._shutdown_executor()
+
+    def _propagate_segments(self, seg_y0, theta, propagate_derivs):
+        """
+        Propagate independent segments, concurrently if more than one worker process is requested.
+
+        Parameters
+        ----------
+        seg_y0 : list of np.array
+            The state vector at the start of each segment.
+        theta : np.array
+            The ODE parameter vector. The first two elements are t_initial and t_duration.
+        propagate_derivs : bool
+            If True, the state vectors are augmented and the tangent states are propagated with the primal states.
+
+        Returns
+        -------
+        list of np.array
+            The state vector at each output node of each segment.
+        """
+        executor = self._get_executor()
+
+        if executor is None:
+            return [self._propagate_segment(i, y0, theta, propagate_derivs) for i, y0 in enumerate(seg_y0)]
+
+        # The workers return only the columns of the sensitivities which may be nonzero in each segment.
+        y_segs = list(executor.map(_integrate_segment_in_worker,
+                                   [(i, y0, theta, propagate_derivs) for i, y0 in enumerate(seg_y0)]))
+
+        if propagate_derivs:
+            y_segs = [self._expand_augmented_state(y_seg, self._seg_sens_idxs[i]['z'])
+                      for i, y_seg in enumerate(y_segs)]
+
+        return y_segs
+
+    def _propagate(self, inputs, propagate_derivs=None, x_out=None, t_out=None, dx_dz_out=None,
+                   dt_dz_out=None):
+        """
+        Propagate the augmented state, y = [x, dx_dz, dt_dz].
+
+        Parameters
+        ----------
+        inputs : Vector
+            The inputs of the integration. This is an OpenMDAO vector including the initial state values, t_initial
+            and t_duration, the ODE parameters, the control values, and the polynomial control values.
+        propagate_derivs : bool or None
+            If True, propagate the derivatives of the states and of time w.r.t. the integration parameters vector, z.
+            If None, use the value of option `propagate_derivs` to determine if derivatives should be computed.
+        x_out : np.array or None.
+            Pre-allocated storage for the results of the state propagation. If None, this storage will be allocated
+            on each call to _propagate.
+        t_out : np.array or None.
+            Pre-allocated storage for the time at the requested nodes. If None, this storage will be allocated
+            on each call to _propagate.
+        dx_dz_out : np.array or None.
+            Pre-allocated storage for the results of the propagation of derivatives of the states with respect to the
+            integration parameters. If None, this storage will be allocated on each call to _propagate.
+        dt_dz_out : np.array or None.
+            Pre-allocated storage derivatives of the time at the requested nodes with respect to the integration
+            parameters. If None, this storage will be allocated on each call to _propagate.
+
+        Returns
+        -------
+        x_out : np.array
+            The integrated states at each node.
+        t_out : np.array
+            The time (or integration variable) value at each node.
+        dx_dz_out : np.array
+            The derivative of each state at each node with respect to the initial integration parameters.
+        dt_dz_out : np.array
+            The derivative of time at each node with respect to the initial integration parameters.
+        """
+        ogd = self._output_grid_data
+
+        nn = sum(self._nnps)
+        if x_out is None:
+            x_out = np.zeros((nn, self.x_size))
+        if t_out is None:
+            t_out = np.zeros((nn, 1))
+
+        if propagate_derivs is None:
+            _propagate_derivs = self.options['propagate_derivs']
+        else:
+            _propagate_derivs = propagate_derivs
+
+        n_x = self.x_size
+        n_theta = self.theta_size
+        n_z = n_x + n_theta
+        nnps = self._nnps
+
+        # Extract the input values
+        x0, theta = self._unpack_inputs(inputs)
+        t_initial = theta[0]
+        t_duration = theta[1]
+
+        if _propagate_derivs:
+            if dx_dz_out is None:
+                dx_dz_out = np.zeros((nn, self.x_size * self.z_size))
+            if dt_dz_out is None:
+                dt_dz_out = np.zeros((nn, self.z_size))
+
+            y0 = np.concatenate((x0.ravel(), self._dx_dz_0.ravel(), self._dt_dz_0.ravel()))
+        else:
+            dx_dz_out = None
+            dt_dz_out = None
+            y0 = x0.ravel()
+
+        if _propagate_derivs and self._use_adjoint:
+            return self._propagate_adjoint(inputs, x_out, t_out, dx_dz_out, dt_dz_out)
+
+        if self._multiple_shooting:
+            # Each segment after the first starts from its own initial state input, so the segments are independent.
+            seg_y0 = [y0] + [self._get_segment_initial_y(i, inputs, theta, _propagate_derivs)
+                             for i in range(1, ogd.num_segments)]
+            y_segs = self._propagate_segments(seg_y0, theta, _propagate_derivs)
+
+        row_seg_i = 0
+
+        for i in range(ogd.num_segments):
+            eval_nodes_ptau = ogd.node_ptau[ogd.segment_indices[i, 0]: ogd.segment_indices[i, 1]]
+            t_eval_seg = t_initial + 0.5 * (eval_nodes_ptau + 1) * t_duration
+
+            if self._multiple_shooting:
+                y_seg = y_segs[i]
+            else:
+                y_seg = self._propagate_segment(i, y0, theta, _propagate_derivs)
+
+            if _propagate_derivs:
+                dx_dz_out[row_seg_i:row_seg_i + nnps[i], :] = y_seg[:, n_x:n_x + n_x * n_z]
+                dt_dz_out[row_seg_i:row_seg_i + nnps[i], :] = y_seg[:, -n_z:]
+
+            x_out[row_seg_i:row_seg_i + nnps[i], :] = y_seg[:, :n_x]  # Save solution to the output nodes
+            t_out[row_seg_i:row_seg_i + nnps[i], 0] = t_eval_seg
+            y0 = y_seg[-1, :]  # Set initial y for the next segment
+            row_seg_i += nnps[i]  # Increment node associated with the start of the next segment
+
+        return x_out, t_out, dx_dz_out, dt_dz_out
+
+    def compute(self, inputs, outputs):
         """
         Compute propagated state values.
 
@@ -831,6 +2028,7 @@ class ODEIntegrationComp(om.ExplicitComponent):
 
         dt_dz = self._dt_dz_out
         dx_dz = self._dx_dz_out
+        dx_dz_3d = dx_dz.reshape((-1, self.x_size, self.z_size))
 
         partials[t_name, 't_duration'] = dt_dz[:, self.x_size + 1]
         partials[f'{t_name}_phase', 't_duration'] = dt_dz[:, self.x_size + 1]
@@ -840,7 +2038,14 @@ class ODEIntegrationComp(om.ExplicitComponent):
 
             for wrt_state_name in self.state_options:
                 wrt = self._state_input_names[wrt_state_name]
-                partials[of, wrt] = dx_dz[self._partial_dx_dz_idxs[of, wrt]]
+                if self._multiple_shooting:
+                    wrt_z_idxs = self._state_idxs_in_z[wrt_state_name]
+                    for prefix, wrt in (('states', wrt),
+                                        ('segment_initial_states', self._segment_state_input_names[wrt_state_name])):
+                        node_idxs, _ = self._state_input_node_idxs[prefix]
+                        partials[of, wrt] = dx_dz_3d[node_idxs, self.state_idxs[state_name], wrt_z_idxs].ravel()
+                else:
+                    partials[of, wrt] = dx_dz[self._partial_dx_dz_idxs[of, wrt]]
 
             partials[of, 't_initial'] = dx_dz[self._partial_dx_dz_idxs[of, 't_initial']]
             partials[of, 't_duration'] = dx_dz[self._partial_dx_dz_idxs[of, 't_duration']]
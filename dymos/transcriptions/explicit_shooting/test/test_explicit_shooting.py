@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 import warnings
 
 import numpy as np
@@ -11,6 +12,7 @@ from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
 from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.transcriptions.explicit_shooting import ode_integration_comp
 
 
 class Simple2StateODE(om.ExplicitComponent):
@@ -162,6 +164,88 @@ class TestExplicitShooting(unittest.TestCase):
 
         dymos_options['include_check_partials'] = False
 
+    def test_2_states_run_model_fixed_step(self):
+
+        dymos_options['include_check_partials'] = True
+
+        for method in ('RK4', 'DOPRI5', 'GL4', 'GL6'):
+            with self.subTest(method=method):
+                prob = om.Problem()
+
+                tx = dm.ExplicitShooting(grid=dm.GaussLobattoGrid(num_segments=2, nodes_per_seg=3, compressed=True),
+                                         method=method, num_steps_per_segment=20)
+
+                phase = dm.Phase(ode_class=Simple2StateODE, transcription=tx)
+
+                phase.set_time_options(targets=['t'], units='s')
+
+                # automatically discover states
+                phase.set_state_options('x', targets=['x'], rate_source='x_dot')
+                phase.set_state_options('y', targets=['y'], rate_source='y_dot')
+
+                phase.add_parameter('p', targets=['p'])
+
+                prob.model.add_subsystem('phase0', phase)
+
+                prob.setup()
+
+                prob.set_val('phase0.t_initial', 0.0)
+                prob.set_val('phase0.t_duration', 1.0)
+                prob.set_val('phase0.initial_states:x', 0.5)
+                prob.set_val('phase0.initial_states:y', 1.0)
+                prob.set_val('phase0.parameters:p', 1)
+
+                prob.run_model()
+
+                t_f = prob.get_val('phase0.integrator.t_final')
+                x_f = prob.get_val('phase0.integrator.states_out:x')
+                y_f = prob.get_val('phase0.integrator.states_out:y')
+
+                assert_near_equal(t_f, 1.0)
+                assert_near_equal(x_f[-1, ...], 2.64085909, tolerance=1.0E-5)
+                assert_near_equal(y_f[-1, ...], 0.1691691, tolerance=1.0E-5)
+
+                with np.printoptions(linewidth=1024):
+                    cpd = prob.check_partials(compact_print=True, method='fd', out_stream=None)
+                    assert_check_partials(cpd, atol=1.0E-5, rtol=1.0E-5)
+
+        dymos_options['include_check_partials'] = False
+
+    def test_fixed_step_num_steps_per_segment_none(self):
+        x_f = {}
+
+        for num_steps_per_segment in (None, 10, 20):
+            prob = om.Problem()
+
+            tx = dm.ExplicitShooting(grid=dm.GaussLobattoGrid(num_segments=2, nodes_per_seg=3, compressed=True),
+                                     method='RK4', num_steps_per_segment=num_steps_per_segment)
+
+            phase = dm.Phase(ode_class=Simple2StateODE, transcription=tx)
+
+            phase.set_time_options(targets=['t'], units='s')
+            phase.set_state_options('x', targets=['x'], rate_source='x_dot')
+            phase.set_state_options('y', targets=['y'], rate_source='y_dot')
+            phase.add_parameter('p', targets=['p'])
+
+            prob.model.add_subsystem('phase0', phase)
+
+            prob.setup()
+
+            prob.set_val('phase0.t_initial', 0.0)
+            prob.set_val('phase0.t_duration', 1.0)
+            prob.set_val('phase0.initial_states:x', 0.5)
+            prob.set_val('phase0.initial_states:y', 1.0)
+            prob.set_val('phase0.parameters:p', 1)
+
+            prob.run_model()
+
+            x_f[num_steps_per_segment] = prob.get_val('phase0.integrator.states_out:x')[-1, ...]
+
+        # None takes the default number of steps.
+        assert_near_equal(x_f[None], 2.64085909, tolerance=1.0E-5)
+        assert_near_equal(x_f[None], x_f[10], tolerance=1.0E-15)
+        self.assertFalse(np.array_equal(x_f[None], x_f[20]))
+
     def test_brachistochrone_explicit_shooting(self):
 
         dymos_options['include_check_partials'] = True
@@ -238,6 +322,80 @@ class TestExplicitShooting(unittest.TestCase):
 
         dymos_options['include_check_partials'] = False
 
+    def test_brachistochrone_explicit_shooting_multiple_shooting(self):
+
+        dymos_options['include_check_partials'] = True
+
+        for num_workers in (1, 2):
+
+            with self.subTest(f'num_workers = {num_workers}'):
+                prob = om.Problem()
+
+                input_grid = dm.GaussLobattoGrid(num_segments=4, nodes_per_seg=3, compressed=True)
+
+                phase = dm.Phase(ode_class=BrachistochroneODE,
+                                 transcription=dm.ExplicitShooting(grid=input_grid, multiple_shooting=True,
+                                                                   num_workers=num_workers))
+
+                traj = prob.model.add_subsystem('traj0', dm.Trajectory())
+                traj.add_phase('phase0', phase)
+
+                prob.driver = om.ScipyOptimizeDriver()
+
+                phase.set_time_options(units='s', fix_initial=True, duration_bounds=(1.0, 10.0))
+
+                # automatically discover states
+                phase.set_state_options('x', fix_initial=True)
+                phase.set_state_options('y', fix_initial=True)
+                phase.set_state_options('v', fix_initial=True)
+
+                phase.add_parameter('g', val=9.80665, units='m/s**2', opt=False)
+                phase.add_control('theta', val=45.0, units='deg', opt=True, lower=1.0E-6, upper=179.9,
+                                  ref=90., rate_continuity=True, rate2_continuity=False)
+
+                phase.add_boundary_constraint('x', loc='final', equals=10.0)
+                phase.add_boundary_constraint('y', loc='final', equals=5.0)
+
+                phase.add_objective('time', loc='final')
+
+                prob.setup(force_alloc_complex=True)
+
+                phase.set_time_val(initial=0.0, duration=2.0)
+                phase.set_state_val('x', [0.0, 10.0])
+                phase.set_state_val('y', [10.0, 5.0])
+                phase.set_state_val('v', [0.1, 9.9])
+                phase.set_control_val('theta', [10.0, 100.0], units='deg')
+
+                with mock.patch.object(ode_integration_comp, 'ProcessPoolExecutor',
+                                       wraps=ode_integration_comp.ProcessPoolExecutor) as pool_cls:
+                    dm.run_problem(prob)
+
+                # A single pool of workers is used for every integration of the optimization and it is shut down
+                # when the problem is cleaned up.
+                self.assertEqual(pool_cls.call_count, 0 if num_workers == 1 else 1)
+                self.assertIsNone(prob.model._get_subsystem('traj0.phases.phase0.integrator')._executor)
+
+                x = prob.get_val('traj0.phase0.timeseries.x')
+                y = prob.get_val('traj0.phase0.timeseries.y')
+                t = prob.get_val('traj0.phase0.timeseries.time')
+
+                assert_near_equal(x[-1, ...], 10.0, tolerance=1.0E-3)
+                assert_near_equal(y[-1, ...], 5.0, tolerance=1.0E-3)
+                assert_near_equal(t[-1, ...], 1.8016, tolerance=1.0E-2)
+
+                # The states are continuous across the segment boundaries at the solution.
+                defect_x = prob.get_val('traj0.phase0.continuity_comp.defect_states:x')
+                assert_near_equal(defect_x, np.zeros_like(defect_x), tolerance=1.0E-6)
+
+                with np.printoptions(linewidth=1024):
+                    cpd = prob.check_partials(compact_print=True, method='fd',
+                                              includes=['traj0.phases.phase0.integrator',
+                                                        'traj0.phases.phase0.continuity_comp'],
+                                              out_stream=None)
+                    assert_check_partials(cpd, atol=1.0E-5, rtol=1.0E-5)
+
+        dymos_options['include_check_partials'] = False
+
     def test_brachistochrone_explicit_shooting_path_constraint(self):
 
         dymos_options['include_check_partials'] = True
@@ -164,6 +164,105 @@ class TestODEIntegrationComp(unittest.TestCase):
             cpd = p.check_partials(compact_print=False, method='fd')
             assert_check_partials(cpd, atol=1.0E-4, rtol=1.0E-4)
 
+    def test_integrate_with_controls_adjoint(self):
+
+        dymos_options['include_check_partials'] = True
+
+        gd = dm.GaussLobattoGrid(num_segments=5, nodes_per_seg=3, compressed=True)
+        ogd = dm.UniformGrid(num_segments=5, nodes_per_seg=2)
+
+        time_options = dm.phase.options.TimeOptionsDictionary()
+
+        time_options['units'] = 's'
+
+        state_options = {'x': dm.phase.options.StateOptionsDictionary(),
+                         'y': dm.phase.options.StateOptionsDictionary(),
+                         'v': dm.phase.options.StateOptionsDictionary()}
+
+        state_options['x']['shape'] = (1,)
+        state_options['x']['units'] = 'm'
+        state_options['x']['rate_source'] = 'xdot'
+        state_options['x']['targets'] = []
+
+        state_options['y']['shape'] = (1,)
+        state_options['y']['units'] = 'm'
+        state_options['y']['rate_source'] = 'ydot'
+        state_options['y']['targets'] = []
+
+        state_options['v']['shape'] = (1,)
+        state_options['v']['units'] = 'm/s'
+        state_options['v']['rate_source'] = 'vdot'
+        state_options['v']['targets'] = ['v']
+
+        param_options = {'g': dm.phase.options.ParameterOptionsDictionary()}
+
+        param_options['g']['shape'] = (1,)
+        param_options['g']['units'] = 'm/s**2'
+        param_options['g']['targets'] = ['g']
+
+        control_options = {'theta': dm.phase.options.ControlOptionsDictionary()}
+
+        control_options['theta']['shape'] = (1,)
+        control_options['theta']['units'] = 'rad'
+        control_options['theta']['targets'] = ['theta']
+
+        for multiple_shooting in (False, True):
+            with self.subTest(f'multiple_shooting = {multiple_shooting}'):
+                totals = {}
+
+                for mode in ('forward', 'adjoint'):
+                    p = om.Problem()
+
+                    p.model.add_subsystem('integrator',
+                                          ODEIntegrationComp(ode_class=BrachistochroneODE,
+                                                             time_options=time_options,
+                                                             state_options=state_options,
+                                                             parameter_options=param_options,
+                                                             control_options=control_options,
+                                                             input_grid_data=gd,
+                                                             output_grid_data=ogd,
+                                                             sensitivity_mode=mode,
+                                                             multiple_shooting=multiple_shooting,
+                                                             ode_init_kwargs=None))
+
+                    p.setup()
+
+                    p.set_val('integrator.states:x', 0.0)
+                    p.set_val('integrator.states:y', 10.0)
+                    p.set_val('integrator.states:v', 0.0)
+                    p.set_val('integrator.t_initial', 0.0)
+                    p.set_val('integrator.t_duration', 1.8016)
+                    p.set_val('integrator.parameters:g', 9.80665)
+
+                    p.set_val('integrator.controls:theta',
+                              np.linspace(0.01, 100.0, gd.subset_num_nodes['control_input']), units='deg')
+
+                    if multiple_shooting:
+                        p.set_val('integrator.segment_initial_states:x', np.linspace(1.0, 8.0, 4).reshape((-1, 1)))
+                        p.set_val('integrator.segment_initial_states:y', np.linspace(9.0, 6.0, 4).reshape((-1, 1)))
+                        p.set_val('integrator.segment_initial_states:v', np.linspace(2.0, 8.0, 4).reshape((-1, 1)))
+
+                    p.run_model()
+
+                    with np.printoptions(linewidth=1024):
+                        cpd = p.check_partials(compact_print=True, method='fd', out_stream=None)
+                        assert_check_partials(cpd, atol=1.0E-4, rtol=1.0E-4)
+
+                    of = [f'integrator.states_out:{name}' for name in state_options]
+                    wrt = [f'integrator.{name}'
+                           for name in ('t_initial', 't_duration', 'parameters:g', 'controls:theta')]
+                    wrt.extend([f'integrator.states:{name}' for name in state_options])
+                    if multiple_shooting:
+                        wrt.extend([f'integrator.segment_initial_states:{name}' for name in state_options])
+
+                    totals[mode] = p.compute_totals(of=of, wrt=wrt, return_format='array')
+
+                # The derivatives computed by the adjoint and forward modes are the same to within the integration
+                # tolerance.
+                assert_near_equal(totals['adjoint'], totals['forward'], tolerance=1.0E-6)
+
+        dymos_options['include_check_partials'] = False
+
     @unittest.skipIf(om_version()[0] >= (3, 36, 0) and om_version()[0] < (3, 37, 0),
                      reason='Test skipped due to an issue in OpenMDAO 3.36.x')
     def test_integrate_with_polynomial_controls(self):
@@ -250,6 +349,217 @@ class TestODEIntegrationComp(unittest.TestCase):
 
         dymos_options['include_check_partials'] = False
 
+    def test_integrate_batch(self):
+        input_grid_data = dm.GaussLobattoGrid(num_segments=2, nodes_per_seg=3)
+        output_grid_data = dm.UniformGrid(num_segments=2, nodes_per_seg=10)
+
+        time_options = TimeOptionsDictionary()
+
+        time_options['targets'] = 't'
+        time_options['units'] = 's'
+
+        state_options = {'x': StateOptionsDictionary()}
+
+        state_options['x']['shape'] = (1,)
+        state_options['x']['units'] = 's**2'
+        state_options['x']['rate_source'] = 'x_dot'
+        state_options['x']['targets'] = ['x']
+
+        param_options = {'p': ParameterOptionsDictionary()}
+
+        param_options['p']['shape'] = (1,)
+        param_options['p']['units'] = 's**2'
+        param_options['p']['targets'] = ['p']
+
+        prob = om.Problem()
+
+        prob.model.add_subsystem('integrator',
+                                 ODEIntegrationComp(input_grid_data=input_grid_data,
+                                                    output_grid_data=output_grid_data,
+                                                    time_options=time_options, state_options=state_options,
+                                                    parameter_options=param_options,
+                                                    propagate_derivs=False,
+                                                    ode_class=SimpleODE, ode_init_kwargs=None))
+        prob.setup()
+        prob.set_val('integrator.t_initial', 0.0)
+        prob.set_val('integrator.t_duration', 2.0)
+        prob.set_val('integrator.parameters:p', 1.0)
+
+        prob.final_setup()
+
+        x0 = np.array([0.5, 1.0, 1.5, 2.0])
+        x, t = prob.model.integrator.propagate_batch({'x': x0})
+
+        self.assertEqual(x.shape, (4, 20, 1))
+
+        for i in range(len(x0)):
+            expected = t**2 + 2 * t + 1.0 + (x0[i] - 1.0) * np.exp(t)
+            assert_near_equal(x[i, ...], expected, tolerance=1.0E-5)
+
+    def test_integrate_batch_with_controls(self):
+        gd = dm.GaussLobattoGrid(num_segments=5, nodes_per_seg=3, compressed=True)
+
+        time_options = dm.phase.options.TimeOptionsDictionary()
+
+        time_options['units'] = 's'
+
+        state_options = {'x': dm.phase.options.StateOptionsDictionary(),
+                         'y': dm.phase.options.StateOptionsDictionary(),
+                         'v': dm.phase.options.StateOptionsDictionary()}
+
+        state_options['x']['shape'] = (1,)
+        state_options['x']['units'] = 'm'
+        state_options['x']['rate_source'] = 'xdot'
+        state_options['x']['targets'] = []
+
+        state_options['y']['shape'] = (1,)
+        state_options['y']['units'] = 'm'
+        state_options['y']['rate_source'] = 'ydot'
+        state_options['y']['targets'] = []
+
+        state_options['v']['shape'] = (1,)
+        state_options['v']['units'] = 'm/s'
+        state_options['v']['rate_source'] = 'vdot'
+        state_options['v']['targets'] = ['v']
+
+        param_options = {'g': dm.phase.options.ParameterOptionsDictionary()}
+
+        param_options['g']['shape'] = (1,)
+        param_options['g']['units'] = 'm/s**2'
+        param_options['g']['targets'] = ['g']
+
+        control_options = {'theta': dm.phase.options.ControlOptionsDictionary()}
+
+        control_options['theta']['shape'] = (1,)
+        control_options['theta']['units'] = 'rad'
+        control_options['theta']['targets'] = ['theta']
+
+        for control_interp in ('vandermonde', 'cubic'):
+            with self.subTest(control_interp=control_interp):
+                p = om.Problem()
+
+                p.model.add_subsystem('integrator',
+                                      ODEIntegrationComp(ode_class=BrachistochroneODE,
+                                                         time_options=time_options,
+                                                         state_options=state_options,
+                                                         parameter_options=param_options,
+                                                         control_options=control_options,
+                                                         input_grid_data=gd,
+                                                         propagate_derivs=False,
+                                                         control_interp=control_interp,
+                                                         ode_init_kwargs=None))
+
+                p.setup()
+
+                p.set_val('integrator.states:x', 0.0)
+                p.set_val('integrator.states:y', 10.0)
+                p.set_val('integrator.states:v', 0.0)
+                p.set_val('integrator.t_initial', 0.0)
+                p.set_val('integrator.t_duration', 1.8016)
+                p.set_val('integrator.parameters:g', 9.80665)
+
+                p.set_val('integrator.controls:theta',
+                          np.linspace(0.01, 100.0, gd.subset_num_nodes['control_input']).reshape((-1, 1)),
+                          units='deg')
+
+                p.final_setup()
+
+                integrator = p.model._get_subsystem('integrator')
+                v0 = np.array([0.0, 0.5, 1.0])
+                y0 = np.array([10.0, 9.0, 8.0])
+                x_batch, t_batch = integrator.propagate_batch({'v': v0, 'y': y0})
+
+                for i in range(len(v0)):
+                    p.set_val('integrator.states:v', v0[i])
+                    p.set_val('integrator.states:y', y0[i])
+                    p.run_model()
+
+                    assert_near_equal(t_batch, p.get_val('integrator.time'))
+                    for name in ('x', 'y', 'v'):
+                        assert_near_equal(x_batch[i, :, integrator.state_idxs[name]],
+                                          p.get_val(f'integrator.states_out:{name}'),
+                                          tolerance=1.0E-6)
+
+    def test_subprob_io_fast_path_matches_public_api(self):
+        gd = dm.GaussLobattoGrid(num_segments=3, nodes_per_seg=3, compressed=True)
+
+        time_options = dm.phase.options.TimeOptionsDictionary()
+
+        # The ODE expects time in seconds, so the inputs of time are converted in the subproblem.
+        time_options['units'] = 'ms'
+
+        state_options = {'x': dm.phase.options.StateOptionsDictionary(),
+                         'y': dm.phase.options.StateOptionsDictionary(),
+                         'v': dm.phase.options.StateOptionsDictionary()}
+
+        for name, units, rate_source, targets in (('x', 'm', 'xdot', []), ('y', 'm', 'ydot', []),
+                                                  ('v', 'm/s', 'vdot', ['v'])):
+            state_options[name]['shape'] = (1,)
+            state_options[name]['units'] = units
+            state_options[name]['rate_source'] = rate_source
+            state_options[name]['targets'] = targets
+
+        param_options = {'g': dm.phase.options.ParameterOptionsDictionary()}
+
+        param_options['g']['shape'] = (1,)
+        param_options['g']['units'] = 'm/s**2'
+        param_options['g']['targets'] = ['g']
+
+        control_options = {'theta': dm.phase.options.ControlOptionsDictionary()}
+
+        control_options['theta']['shape'] = (1,)
+        control_options['theta']['units'] = 'rad'
+        control_options['theta']['targets'] = ['theta']
+
+        results = {}
+
+        for fast in (True, False):
+            p = om.Problem()
+
+            p.model.add_subsystem('integrator',
+                                  ODEIntegrationComp(ode_class=BrachistochroneODE,
+                                                     time_options=time_options,
+                                                     state_options=state_options,
+                                                     parameter_options=param_options,
+                                                     control_options=control_options,
+                                                     input_grid_data=gd,
+                                                     ode_init_kwargs=None))
+
+            p.setup()
+
+            integrator = p.model._get_subsystem('integrator')
+            integrator._fast_subprob_io = fast
+
+            p.set_val('integrator.states:x', 0.0)
+            p.set_val('integrator.states:y', 10.0)
+            p.set_val('integrator.states:v', 0.0)
+            p.set_val('integrator.t_initial', 0.0)
+            p.set_val('integrator.t_duration', 1.8016, units='s')
+            p.set_val('integrator.parameters:g', 9.80665)
+            p.set_val('integrator.controls:theta', np.linspace(0.01, 100.0, gd.subset_num_nodes['control_input']),
+                      units='deg')
+
+            p.run_model()
+
+            self.assertEqual(integrator._get_subprob_io(integrator._eval_subprob).fast, fast)
+
+            x_batch, _ = integrator.propagate_batch({'v': np.array([0.0, 0.5]), 'y': np.array([10.0, 9.0])})
+
+            results[fast] = {'outputs': {name: p.get_val(f'integrator.states_out:{name}')
+                                         for name in ('x', 'y', 'v')},
+                             'totals': p.compute_totals(of=['integrator.states_out:x', 'integrator.states_out:v'],
+                                                        wrt=['integrator.t_duration', 'integrator.controls:theta',
+                                                             'integrator.parameters:g']),
+                             'batch': x_batch}
+
+        for name, val in results[True]['outputs'].items():
+            assert_near_equal(val, results[False]['outputs'][name], tolerance=1.0E-12)
+
+        for key, val in results[True]['totals'].items():
+            assert_near_equal(val, results[False]['totals'][key], tolerance=1.0E-12)
+
+        assert_near_equal(results[True]['batch'], results[False]['batch'], tolerance=1.0E-12)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1,11 +1,16 @@
 import numpy as np
-import scipy.special as sp
 
+from .cache import array_lru_cache
 
+
+@array_lru_cache(maxsize=256)
 def birkhoff_matrix(tau, w, grid_type):
     """
     Returns the pseudospectral integration matrix for a Birkhoff polynomial at the given nodes.
 
+    Results are cached, keyed by the grid type and nodes, so that segments and phases sharing the
+    same nodes do not repeat the calculation.
+
     Parameters
     ----------
     tau : ndarray[:]
@@ -24,46 +29,76 @@ def birkhoff_matrix(tau, w, grid_type):
     N = tau.size - 1
     end_node = N if tau[-1] == 1 else N + 1
 
+    if grid_type[0] not in ('l', 'c'):
+        raise ValueError('invalid grid type')
+
+    # The values of the polynomials of degree 0 through N + 1 at each node.
+    P = _polynomial_values(tau, N + 1, kind=grid_type[0])
+
     alpha = np.zeros((N + 1, N + 1))
+    alpha[:end_node, :] = w * P[:end_node, :]
+    if grid_type == 'lgl':
+        alpha[N, :] = N * P[N, :] * w / (2 * N + 1)
+    elif grid_type == 'cgl':
+        alpha[N, :] = P[N, :] * w / 2
+
     S = np.zeros((N + 1, N + 1))
+    n = np.arange(1, N + 1)
 
+    # The first row is exactly zero.
     if grid_type[0] == 'l':
-        pol = sp.eval_legendre
+        # The integral of P_n from tau_0 is (P_{n+1} - P_{n-1}) / (2n + 1), and gamma_n = 2 / (2n + 1).
+        S[1:, 0] = (tau[1:] - tau[0]) / 2
+        S[1:, 1:] = ((P[n + 1, 1:] - P[n - 1, 1:]) / 2).T
+
     elif grid_type[0] == 'c':
-        pol = sp.eval_chebyt
-    else:
-        raise ValueError('invalid grid type')
+        gamma = np.pi / 2
+        # chebyshev polynomial of order 0: 1
+        S[1:, 0] = (tau[1:] - tau[0]) / np.pi
+        # chebyshev polynomial of order 1: x
+        S[1:, 1] = (tau[1:]**2 - tau[0]**2) / np.pi
 
-    for j in range(0, N + 1):
-        for n in range(0, end_node):
-            alpha[n, j] = w[j] * pol(n, tau[j])
-        if grid_type == 'lgl':
-            alpha[N, j] = N * pol(N, tau[j]) * w[j] / (2 * N + 1)
-        elif grid_type == 'cgl':
-            alpha[N, j] = pol(N, tau[j]) * w[j] / 2
+        if N >= 2:
+            n = n[1:]
+            int_p = P[n + 1, 1:] / (2 * n + 2)[:, np.newaxis] - P[n - 1, 1:] / (2 * n - 2)[:, np.newaxis] \
+                - ((-1.0)**n / (n**2 - 1))[:, np.newaxis]
+            S[1:, 2:] = int_p.T / gamma
 
-    if grid_type[0] == 'l':
-        for i in range(1, N + 1):  # The first row is exactly zero.
-            S[i, 0] = (tau[i] - tau[0]) / 2
+    B = S @ alpha
+
+    return B
 
-            for n in range(1, N+1):
-                gamma = 2 / (2 * n + 1)
-                int_p = (pol(n+1, tau[i]) - pol(n-1, tau[i])) / (2*n+1)
-                S[i, n] = int_p / gamma
 
-    elif grid_type[0] == 'c':
-        gamma = np.pi / 2
-        for i in range(1, N+1):  # The first row is exactly zero.
-            # chebyshev polynomial of order 0: 1
-            S[i, 0] = (tau[i] - tau[0]) / np.pi
+def _polynomial_values(x, n, kind):
+    """
+    Evaluate the Legendre or Chebyshev polynomials of degree 0 through n at the given points.
 
-            # chebyshev polynomial of order 1: x
-            S[i, 1] = (tau[i]**2 - tau[0]**2) / np.pi
+    The polynomials are evaluated using their three-term recurrence relations, for all points at once.
 
-            for n in range(2, N+1):
-                int_p = pol(n+1, tau[i]) / (2*n+2) - pol(n-1, tau[i]) / (2*n-2) - (-1)**n / (n**2 - 1)
-                S[i, n] = int_p / gamma
+    Parameters
+    ----------
+    x : ndarray[:]
+        The points at which the polynomials are evaluated.
+    n : int
+        The highest degree of polynomial to be evaluated.
+    kind : str
+        'l' for Legendre polynomials or 'c' for Chebyshev polynomials of the first kind.
 
-    B = S @ alpha
+    Returns
+    -------
+    ndarray[n + 1, x.size]
+        The value of the polynomial of degree k at x[j] in element [k, j].
+    """
+    P = np.empty((n + 1, x.size))
+    P[0, :] = 1.0
+    if n >= 1:
+        P[1, :] = x
 
-    return B
+    if kind == 'l':
+        for k in range(1, n):
+            P[k + 1, :] = ((2 * k + 1) * x * P[k, :] - k * P[k - 1, :]) / (k + 1)
+    else:
+        for k in range(1, n):
+            P[k + 1, :] = 2 * x * P[k, :] - P[k - 1, :]
+
+    return P
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+import functools
+
+import numpy as np
+
+
+def _hashable_arg(arg):
+    """
+    Convert an argument of a cached function into a hashable key.
+
+    Parameters
+    ----------
+    arg : object
+        The argument to be converted.  Numpy arrays are keyed by their shape, dtype, and data.
+
+    Returns
+    -------
+    object
+        A hashable representation of arg.
+    """
+    if isinstance(arg, np.ndarray):
+        return 'ndarray', arg.shape, arg.dtype.str, arg.tobytes()
+    elif isinstance(arg, (list, tuple)):
+        return type(arg).__name__, tuple(_hashable_arg(a) for a in arg)
+    return arg
+
+
+def _copy_result(result):
+    """
+    Copy any numpy arrays in the result of a cached function.
+
+    Parameters
+    ----------
+    result : object
+        A numpy array, a tuple of numpy arrays, or any other object.
+
+    Returns
+    -------
+    object
+        The result with each numpy array replaced by a copy so that callers cannot modify the cache.
+    """
+    if isinstance(result, np.ndarray):
+        return result.copy()
+    elif isinstance(result, tuple):
+        return tuple(_copy_result(r) for r in result)
+    return result
+
+
+def array_lru_cache(maxsize=128):
+    """
+    Decorate a function of numpy arrays and scalars with a size-bounded, least-recently-used cache.
+
+    Unlike functools.lru_cache, array arguments are keyed by their contents.  Array results are
+    copied on the way out of the cache, so callers are free to modify the returned values.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of results held by the cache of the decorated function.
+
+    Returns
+    -------
+    function
+        The decorator which applies the cache to a function.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = tuple(_hashable_arg(a) for a in args), \
+                tuple((k, _hashable_arg(v)) for k, v in sorted(kwargs.items()))
+            try:
+                result = cache[key]
+                cache.move_to_end(key)
+            except KeyError:
+                result = cache[key] = func(*args, **kwargs)
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return _copy_result(result)
+
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_size = lambda: len(cache)
+        return wrapper
+    return decorator
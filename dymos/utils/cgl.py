@@ -1,7 +1,6 @@
 import numpy as np
 
-_cgl_cache = {}
-""" Cache for the LGL nodes and weights, keyed by n. """
+from .cache import array_lru_cache
 
 
 def clenshaw_curtis(n):
@@ -73,6 +72,7 @@ def _cgl(n):
     return x, w
 
 
+@array_lru_cache(maxsize=256)
 def cgl(n):
     """
     Retrieve the cgl nodes and weights for n nodes.
@@ -89,6 +89,4 @@ def cgl(n):
     float
         Tuple with cgl nodes and weights.
     """
-    if n not in _cgl_cache:
-        _cgl_cache[n] = _cgl(n)
-    return _cgl_cache[n]
+    return _cgl(n)
@@ -1,11 +1,16 @@
 import numpy as np
 
+from .cache import array_lru_cache
 
+
+@array_lru_cache(maxsize=256)
 def hermite_matrices(x_given, x_eval):
     """
     Return matrices for a Hermite polynomial at the given nodes.
 
     This includes interpolation matrices (A_i and B_i) and differentiation matrices (A_d and B_d).
+    Results are cached, keyed by the given nodes, so that segments and phases sharing the
+    same nodes do not repeat the calculation.
 
     Parameters
     ----------
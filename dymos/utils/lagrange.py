@@ -1,6 +1,9 @@
 import numpy as np
 
+from .cache import array_lru_cache
 
+
+@array_lru_cache(maxsize=256)
 def lagrange_matrices(x_disc, x_interp, compute_interp_matrix=True, compute_diff_matrix=True):
     """
     Compute the lagrange matrices.
@@ -10,6 +13,9 @@ def lagrange_matrices(x_disc, x_interp, compute_interp_matrix=True, compute_diff
     returns interpolation and differentiation matrices which provide polynomial
     values and derivatives.
 
+    Results are cached, keyed by the given nodes, so that segments and phases sharing the
+    same nodes do not repeat the calculation.
+
     Parameters
     ----------
     x_disc : np.array
@@ -35,38 +41,96 @@ def lagrange_matrices(x_disc, x_interp, compute_interp_matrix=True, compute_diff
         at x_disc, returns the intepolated derivatives at x_interp. This is returned
         as None if compute_diff_matrix is None.
     """
+    x_disc = np.asarray(x_disc, dtype=float)
+    x_interp = np.asarray(x_interp, dtype=float)
     nd = len(x_disc)
     ni = len(x_interp)
 
-    if compute_interp_matrix or compute_diff_matrix:
-        temp = np.zeros((ni, nd))
-        # Barycentric Weights
-        diff = np.reshape(x_disc, (nd, 1)) - np.reshape(x_disc, (1, nd))
-        np.fill_diagonal(diff, 1.0)
-        wb = np.prod(1.0 / diff, axis=1)
-
-    # Compute Li
-    diff = np.reshape(x_interp, (ni, 1)) - np.reshape(x_disc, (1, nd))
-    if compute_interp_matrix:
-        Li = np.zeros((ni, nd))
-        for j in range(nd):
-            temp[:] = diff[:]
-            temp[:, j] = 1.0
-            Li[:, j] = wb[j] * np.prod(temp, axis=1)
-    else:
-        Li = None
+    if not (compute_interp_matrix or compute_diff_matrix):
+        return None, None
+
+    c = barycentric_weights(x_disc)
+
+    # diff[i, j] = x_interp[i] - x_disc[j], with exact coincidences of the interpolation and
+    # discretization nodes handled separately.
+    diff = x_interp[:, np.newaxis] - x_disc[np.newaxis, :]
+    coincident = diff == 0.0
+    off_node = ~np.any(coincident, axis=1)
+
+    # The second (true) barycentric formula, l_j(x) = (c_j / (x - x_j)) / sum_k(c_k / (x - x_k))
+    q = c / diff[off_node, :]
+    L = np.zeros((ni, nd))
+    L[off_node, :] = q / np.sum(q, axis=1, keepdims=True)
+    L[coincident] = 1.0
 
-    # Compute Di
     if compute_diff_matrix:
-        Di = np.zeros((ni, nd))
-        for j in range(nd):
-            for k in range(nd):
-                if k != j:
-                    temp[:] = diff[:]
-                    temp[:, j] = 1.0
-                    temp[:, k] = 1.0
-                    Di[:, j] += wb[j] * np.prod(temp, axis=1)
+        # The derivative of the interpolating polynomial is a polynomial of lower degree, so it is
+        # reproduced exactly by interpolating its values at the discretization nodes.  Unlike
+        # differentiating the barycentric formula directly, this remains accurate when an
+        # interpolation node lies within roundoff of a discretization node.
+        Di = L @ _differentiation_matrix(x_disc, c)
     else:
         Di = None
 
+    Li = L if compute_interp_matrix else None
+
     return Li, Di
+
+
+def _differentiation_matrix(x, c):
+    """
+    Compute the matrix which maps polynomial values at the nodes to derivatives at the nodes.
+
+    Parameters
+    ----------
+    x : np.array
+        The distinct nodes of the polynomial.
+    c : np.array
+        The barycentric weights of the nodes.
+
+    Returns
+    -------
+    np.array
+        The differentiation matrix, where element [i, j] is the derivative of the j-th Lagrange
+        basis polynomial at x[i].
+    """
+    n = len(x)
+    diff = x[:, np.newaxis] - x[np.newaxis, :]
+    np.fill_diagonal(diff, 1.0)
+
+    # D[i, j] = (c_j / c_i) / (x_i - x_j) for i != j, and each row sums to zero.
+    D = (c[np.newaxis, :] / c[:, np.newaxis]) / diff
+    D[np.diag_indices(n)] = 0.0
+    D[np.diag_indices(n)] = -np.sum(D, axis=1)
+
+    return D
+
+
+def barycentric_weights(x):
+    """
+    Compute the barycentric weights of the Lagrange polynomial through the given nodes.
+
+    The weights are scaled by the capacity of the interval spanned by the nodes and normalized
+    to a maximum magnitude of one, which avoids overflow and underflow for large numbers of nodes.
+    Since the barycentric formulas are ratios of weighted sums, this scaling does not affect them.
+
+    Parameters
+    ----------
+    x : np.array
+        The distinct nodes of the polynomial.
+
+    Returns
+    -------
+    np.array
+        The barycentric weight associated with each node.
+    """
+    n = len(x)
+    if n == 1:
+        return np.ones(1)
+
+    scale = 4.0 / (np.max(x) - np.min(x))
+    diff = scale * (x[:, np.newaxis] - x[np.newaxis, :])
+    np.fill_diagonal(diff, 1.0)
+    c = 1.0 / np.prod(diff, axis=1)
+
+    return c / np.max(np.abs(c))
@@ -1,7 +1,6 @@
 import numpy as np
 
-_lgl_cache = {}
-""" Cache for the LGL nodes and weights, keyed by n. """
+from .cache import array_lru_cache
 
 
 def _lgl(n, tol=np.finfo(float).eps):
@@ -84,6 +83,7 @@ def _lgl(n, tol=np.finfo(float).eps):
     return x, w
 
 
+@array_lru_cache(maxsize=256)
 def lgl(n):
     """
     Retrieve the lgl nodes and weights for n nodes.
@@ -100,6 +100,4 @@ def lgl(n):
     float
         Tuple with lgl nodes and weights.
     """
-    if n not in _lgl_cache:
-        _lgl_cache[n] = _lgl(n)
-    return _lgl_cache[n]
+    return _lgl(n)
@@ -1,10 +1,15 @@
 import numpy as np
 
+from .cache import array_lru_cache
 
+
+@array_lru_cache(maxsize=256)
 def lgr(n, include_endpoint=False, tol=1.0E-15):
     """
     Returns the Legendre-Gauss-Radau nodes and weights for a Jacobi Polynomial with n abscissae.
 
+    Results are cached to avoid repeated calculation of nodes and weights for a given n.
+
     Parameters
     ----------
     n : int
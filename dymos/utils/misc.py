@@ -352,6 +352,32 @@ def om_version():
     return tuple([int(s) for s in numeric.split('.')]), rel
 
 
+def _abs2prom(system, abs_name, iotype='output'):
+    """
+    Return the promoted name of the given variable in the given system.
+
+    Parameters
+    ----------
+    system : System
+        The system in which the variable is promoted, after setup.
+    abs_name : str
+        The absolute name of the variable.
+    iotype : str
+        Either 'input' or 'output'.
+
+    Returns
+    -------
+    str
+        The promoted name of the variable in the system.
+    """
+    try:
+        resolver = system._resolver
+    except AttributeError:
+        # Older versions of OpenMDAO store the promoted names of the variables in a dict.
+        return system._var_allprocs_abs2prom[iotype][abs_name]
+    return resolver.abs2prom(abs_name, iotype)
+
+
 def is_scalar_or_singleton(x):
     """
     Returns True if x is a scalar, is an instance of np.generic, or is an array of length 1.
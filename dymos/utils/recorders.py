@@ -0,0 +1,377 @@
+"""
+Case recorders for dymos.
+"""
+import queue
+import sqlite3
+import threading
+
+import openmdao.api as om
+
+
+# Stands in for the row id of the previous insert until the statements of a case are executed.
+_LAST_ROW_ID = object()
+
+
+class _BufferedConnection(object):
+    """
+    Stand-in for the sqlite3 connection of a recorder which collects the statements of one case.
+
+    The statements are collected, rather than executed, so that they can be handed off to the
+    writer thread of an AsyncSqliteRecorder.
+
+    Attributes
+    ----------
+    statements : list of tuple
+        The SQL and parameters of each statement executed.
+    """
+
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        """
+        Return this connection as the context of a transaction.
+
+        Returns
+        -------
+        _BufferedConnection
+            This connection.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        End the transaction without suppressing any exception.
+
+        Parameters
+        ----------
+        exc_type : type or None
+            The type of the exception raised in the transaction, if any.
+        exc_value : Exception or None
+            The exception raised in the transaction, if any.
+        traceback : traceback or None
+            The traceback of the exception raised in the transaction, if any.
+
+        Returns
+        -------
+        bool
+            False, so that exceptions are propagated.
+        """
+        return False
+
+    def cursor(self):
+        """
+        Return this connection as its own cursor.
+
+        Returns
+        -------
+        _BufferedConnection
+            This connection.
+        """
+        return self
+
+    def execute(self, sql, parameters=()):
+        """
+        Collect the given statement.
+
+        Parameters
+        ----------
+        sql : str
+            The SQL statement.
+        parameters : Sequence
+            The parameters of the statement.
+        """
+        self.statements.append((sql, parameters))
+
+    @property
+    def lastrowid(self):
+        """
+        Return a placeholder for the row id of the previous insert.
+
+        Returns
+        -------
+        object
+            A placeholder which is replaced by the actual row id when the statements are executed.
+        """
+        return _LAST_ROW_ID
+
+
+class AsyncSqliteRecorder(om.SqliteRecorder):
+    """
+    A SqliteRecorder which writes cases to its database in a background thread.
+
+    Each case is serialized when it is recorded, and the resulting SQL statements are handed to a
+    writer thread through a bounded queue.  The writer executes all of the cases waiting in the
+    queue in a single transaction, so that an optimizer does not wait on disk writes at each
+    iteration.  The queue is flushed when the recorder is shut down by the cleanup of the problem
+    or driver to which it is attached, or when flush is called.
+
+    Metadata is still written by the calling thread, after the queue is flushed, so that the two
+    connections to the database never write at the same time.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Path to the recorder file.
+    max_queued_cases : int
+        The maximum number of cases waiting to be written. Recording blocks while the queue is full.
+    **kwargs : dict
+        Arguments to be passed to SqliteRecorder.
+
+    Attributes
+    ----------
+    _queue : queue.Queue
+        The queue of lists of statements, one per case, waiting to be written.
+    _writer : threading.Thread or None
+        The thread which writes the cases in the queue to the database.
+    _writer_error : Exception or None
+        The exception raised by the writer thread, if any.
+    """
+
+    def __init__(self, filepath, max_queued_cases=64, **kwargs):
+        super().__init__(filepath, **kwargs)
+        self._queue = queue.Queue(maxsize=max_queued_cases)
+        self._writer = None
+        self._writer_error = None
+
+    def _write_cases(self, db_path):
+        """
+        Write the cases in the queue to the database until shut down.
+
+        Parameters
+        ----------
+        db_path : str
+            The path of the database file.
+        """
+        connection = sqlite3.connect(db_path)
+        try:
+            done = False
+            while not done:
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                if self._writer_error is None:
+                    try:
+                        with connection as c:
+                            c = c.cursor()
+                            for statements in batch:
+                                if statements is None:
+                                    continue
+                                for sql, parameters in statements:
+                                    c.execute(sql, tuple(c.lastrowid if p is _LAST_ROW_ID else p
+                                                         for p in parameters))
+                    except Exception as e:
+                        self._writer_error = e
+
+                done = batch[-1] is None
+                for _ in batch:
+                    self._queue.task_done()
+        finally:
+            connection.close()
+
+    def _check_writer_error(self):
+        """
+        Raise any exception that occurred in the writer thread.
+        """
+        if self._writer_error is not None:
+            err, self._writer_error = self._writer_error, None
+            raise RuntimeError(f"Error writing cases to '{self._filepath}': {err}") from err
+
+    def _submit(self, record_func, *args):
+        """
+        Serialize a case with the given recording method of SqliteRecorder and queue it for writing.
+
+        Parameters
+        ----------
+        record_func : callable
+            The unbound recording method of SqliteRecorder.
+        *args : list
+            The arguments of the recording method.
+        """
+        self._check_writer_error()
+
+        connection = self.connection
+        if not connection:
+            record_func(self, *args)
+            return
+
+        if self._writer is None:
+            db_path = connection.execute('PRAGMA database_list').fetchone()[2]
+            self._writer = threading.Thread(target=self._write_cases, args=(db_path,), daemon=True)
+            self._writer.start()
+
+        buffered = _BufferedConnection()
+        self.connection = buffered
+        try:
+            record_func(self, *args)
+        finally:
+            self.connection = connection
+
+        self._queue.put(buffered.statements)
+
+    def record_iteration_driver(self, driver, data, metadata):
+        """
+        Record data and metadata from a Driver.
+
+        Parameters
+        ----------
+        driver : Driver
+            Driver in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, constraints, responses, and System vars.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._submit(om.SqliteRecorder.record_iteration_driver, driver, data, metadata)
+
+    def record_iteration_problem(self, problem, data, metadata):
+        """
+        Record data and metadata from a Problem.
+
+        Parameters
+        ----------
+        problem : Problem
+            Problem in need of recording.
+        data : dict
+            Dictionary containing desvars, objectives, and constraints.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._submit(om.SqliteRecorder.record_iteration_problem, problem, data, metadata)
+
+    def record_iteration_system(self, system, data, metadata):
+        """
+        Record data and metadata from a System.
+
+        Parameters
+        ----------
+        system : System
+            System in need of recording.
+        data : dict
+            Dictionary containing inputs, outputs, and residuals.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._submit(om.SqliteRecorder.record_iteration_system, system, data, metadata)
+
+    def record_iteration_solver(self, solver, data, metadata):
+        """
+        Record data and metadata from a Solver.
+
+        Parameters
+        ----------
+        solver : Solver
+            Solver in need of recording.
+        data : dict
+            Dictionary containing outputs, residuals, and errors.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._submit(om.SqliteRecorder.record_iteration_solver, solver, data, metadata)
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        """
+        Record derivatives data from a Driver.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Driver in need of recording.
+        data : dict
+            Dictionary containing derivatives keyed by 'of,wrt' to be recorded.
+        metadata : dict
+            Dictionary containing execution metadata.
+        """
+        self._submit(om.SqliteRecorder.record_derivatives_driver, recording_requester, data, metadata)
+
+    def startup(self, recording_requester, comm=None):
+        """
+        Prepare for a new run and create/update the abs2prom and prom2abs variables.
+
+        Parameters
+        ----------
+        recording_requester : object
+            Object to which this recorder is attached.
+        comm : MPI.Comm or <FakeComm> or None
+            The MPI communicator for the recorder (should be the comm for the Problem).
+        """
+        self.flush()
+        super().startup(recording_requester, comm)
+
+    def record_viewer_data(self, model_viewer_data, key='Driver'):
+        """
+        Record model viewer data.
+
+        Parameters
+        ----------
+        model_viewer_data : dict
+            Data required to visualize the model.
+        key : str, optional
+            The unique ID to use for this data in the table.
+        """
+        self.flush()
+        super().record_viewer_data(model_viewer_data, key)
+
+    def record_metadata_system(self, system, run_number=None):
+        """
+        Record system metadata.
+
+        Parameters
+        ----------
+        system : System
+            The System for which to record metadata.
+        run_number : int or None
+            Number indicating which run the metadata is associated with.
+            None for the first run, 1 for the second, etc.
+        """
+        self.flush()
+        super().record_metadata_system(system, run_number)
+
+    def record_metadata_solver(self, solver, run_number=None):
+        """
+        Record solver metadata.
+
+        Parameters
+        ----------
+        solver : Solver
+            The Solver for which to record metadata.
+        run_number : int or None
+            Number indicating which run the metadata is associated with.
+            None for the first run, 1 for the second, etc.
+        """
+        self.flush()
+        super().record_metadata_solver(solver, run_number)
+
+    def delete_recordings(self):
+        """
+        Delete all the recordings.
+        """
+        self.flush()
+        super().delete_recordings()
+        if self.connection:
+            # SqliteRecorder leaves the deletions uncommitted, which would lock the writer thread
+            # out of the database.
+            self.connection.commit()
+
+    def flush(self):
+        """
+        Wait until every case recorded so far has been written to the database.
+        """
+        if self._writer is not None:
+            self._queue.join()
+        self._check_writer_error()
+
+    def shutdown(self):
+        """
+        Write any remaining cases and shut down the recorder.
+        """
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        super().shutdown()
+        self._check_writer_error()
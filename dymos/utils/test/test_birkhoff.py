@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 from numpy.testing import assert_almost_equal
 
 from dymos.utils.birkhoff import birkhoff_matrix
@@ -20,6 +21,16 @@ class TestBirkhoffMatrix(unittest.TestCase):
         _, wB = clenshaw_curtis(9)
         assert_almost_equal(B[-1, :], wB)
 
+    def test_birkhoff_matrix_integrates_polynomials(self):
+        # The Birkhoff matrix maps the derivative of a polynomial of order N at the nodes to the
+        # integral of that derivative from the first node.
+        for grid_type, nodes_and_weights in (('lgl', lgl), ('cgl', cgl)):
+            x, w = nodes_and_weights(21)
+            B = birkhoff_matrix(x, w, grid_type=grid_type)
+            f = np.polynomial.Polynomial(np.linspace(1.0, -1.0, 21))
+            with self.subTest(grid_type=grid_type):
+                assert_almost_equal(B @ f.deriv()(x), f(x) - f(x[0]), decimal=10)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal, assert_almost_equal
+
+from dymos.utils.cache import array_lru_cache
+from dymos.utils.lagrange import lagrange_matrices
+from dymos.utils.lgl import lgl
+
+
+class TestArrayLRUCache(unittest.TestCase):
+
+    def test_cache_hits_on_array_contents(self):
+        calls = []
+
+        @array_lru_cache(maxsize=2)
+        def f(x, scale=1.0):
+            calls.append(1)
+            return x * scale
+
+        x = np.linspace(0, 1, 5)
+
+        assert_array_equal(f(x), x)
+        assert_array_equal(f(x.copy()), x)
+        self.assertEqual(len(calls), 1)
+
+        assert_array_equal(f(x, scale=2.0), 2 * x)
+        self.assertEqual(len(calls), 2)
+
+        # Evict the least recently used entry (scale=1.0) and check that it is recomputed.
+        f(x + 1)
+        self.assertEqual(f.cache_size(), 2)
+        f(x)
+        self.assertEqual(len(calls), 4)
+
+    def test_cached_results_are_not_modified_by_callers(self):
+        x, _ = lgl(5)
+        x[:] = 0.0
+        assert_almost_equal(lgl(5)[0], [-1.0, -np.sqrt(21)/7, 0.0, np.sqrt(21)/7, 1.0], decimal=12)
+
+        nodes = lgl(4)[0]
+        L, D = lagrange_matrices(nodes, nodes)
+        L[...] = 0.0
+        assert_almost_equal(lagrange_matrices(nodes, nodes)[0], np.eye(4), decimal=12)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+from numpy.testing import assert_almost_equal
+
+from dymos.utils.lagrange import lagrange_matrices
+from dymos.utils.lgl import lgl
+from dymos.utils.lgr import lgr
+
+
+class TestLagrangeMatrices(unittest.TestCase):
+
+    def test_polynomial_reproduced(self):
+        x_disc, _ = lgr(6, include_endpoint=True)
+        x_interp = np.linspace(-1, 1, 15)
+
+        f = np.polynomial.Polynomial([0.5, -1.0, 2.0, 0.25, -3.0, 1.5])
+
+        L, D = lagrange_matrices(x_disc, x_interp)
+
+        assert_almost_equal(L @ f(x_disc), f(x_interp), decimal=12)
+        assert_almost_equal(D @ f(x_disc), f.deriv()(x_interp), decimal=11)
+
+    def test_at_nodes(self):
+        x_disc, _ = lgl(5)
+
+        L, D = lagrange_matrices(x_disc, x_disc)
+
+        assert_almost_equal(L, np.eye(5), decimal=14)
+        assert_almost_equal(D @ x_disc**3, 3 * x_disc**2, decimal=12)
+        assert_almost_equal(np.sum(D, axis=1), np.zeros(5), decimal=12)
+
+    def test_high_order(self):
+        # The barycentric formulas remain accurate for large numbers of nodes.
+        x_disc, _ = lgl(201)
+        x_interp = np.linspace(-1, 1, 501)
+
+        L, D = lagrange_matrices(x_disc, x_interp)
+
+        assert_almost_equal(L @ np.sin(4 * x_disc), np.sin(4 * x_interp), decimal=12)
+        assert_almost_equal(D @ np.sin(4 * x_disc), 4 * np.cos(4 * x_interp), decimal=8)
+
+    def test_optional_matrices(self):
+        x_disc, _ = lgl(4)
+        x_interp = np.linspace(-1, 1, 7)
+
+        L, D = lagrange_matrices(x_disc, x_interp, compute_diff_matrix=False)
+        self.assertIsNone(D)
+        self.assertEqual(L.shape, (7, 4))
+
+        L, D = lagrange_matrices(x_disc, x_interp, compute_interp_matrix=False)
+        self.assertIsNone(L)
+        self.assertEqual(D.shape, (7, 4))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -1,6 +1,9 @@
+import types
 import unittest
 
-from dymos.utils.misc import get_rate_units
+import openmdao.api as om
+
+from dymos.utils.misc import get_rate_units, _abs2prom
 
 
 class TestMisc(unittest.TestCase):
@@ -34,6 +37,23 @@ class TestMisc(unittest.TestCase):
             get_rate_units('m', 's', deriv=0)
         self.assertEqual(str(e.exception), 'deriv argument must be 1 or 2.')
 
+    def test_abs2prom(self):
+        p = om.Problem()
+        sub = p.model.add_subsystem('sub', om.Group(), promotes_outputs=['y'])
+        sub.add_subsystem('comp', om.ExecComp('y = 2 * x'), promotes=['*'])
+        p.setup()
+
+        self.assertEqual(_abs2prom(p.model, 'sub.comp.y'), 'y')
+        self.assertEqual(_abs2prom(p.model, 'sub.comp.x', 'input'), 'sub.x')
+
+    def test_abs2prom_without_resolver(self):
+        # Systems of OpenMDAO versions without a name resolver.
+        system = types.SimpleNamespace(_var_allprocs_abs2prom={'input': {'sub.comp.x': 'sub.x'},
+                                                               'output': {'sub.comp.y': 'y'}})
+
+        self.assertEqual(_abs2prom(system, 'sub.comp.y'), 'y')
+        self.assertEqual(_abs2prom(system, 'sub.comp.x', 'input'), 'sub.x')
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -0,0 +1,142 @@
+import sqlite3
+import unittest
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.utils.recorders import AsyncSqliteRecorder
+
+
+def _make_problem(recorder):
+    p = om.Problem(model=om.Group())
+    p.driver = om.ScipyOptimizeDriver()
+    p.driver.add_recorder(recorder)
+    p.driver.recording_options['includes'] = ['*timeseries*']
+
+    phase = p.model.add_subsystem('phase0', dm.Phase(ode_class=BrachistochroneODE,
+                                                     transcription=dm.Radau(num_segments=10)))
+    phase.set_time_options(fix_initial=True, duration_bounds=(.5, 10))
+    phase.add_state('x', fix_initial=True, fix_final=True)
+    phase.add_state('y', fix_initial=True, fix_final=True)
+    phase.add_state('v', fix_initial=True)
+    phase.add_control('theta', units='deg', lower=0.01, upper=179.9)
+    phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+    phase.add_objective('time', loc='final', scaler=10)
+
+    p.model.linear_solver = om.DirectSolver()
+
+    p.setup()
+
+    phase.set_time_val(initial=0.0, duration=2.0)
+    phase.set_state_val('x', [0, 10])
+    phase.set_state_val('y', [10, 5])
+    phase.set_state_val('v', [0, 9.9])
+    phase.set_control_val('theta', [5, 100])
+
+    return p
+
+
+def _get_global_iterations(db_path):
+    """
+    Return the record type, source, and iteration of each case in the order they were recorded.
+
+    The iteration is taken from the row of the case table referenced by the global_iterations table.
+    """
+    tables = {'driver': ('driver_iterations', 'iteration_coordinate'),
+              'problem': ('problem_cases', 'case_name'),
+              'system': ('system_iterations', 'iteration_coordinate'),
+              'solver': ('solver_iterations', 'iteration_coordinate')}
+
+    con = sqlite3.connect(db_path)
+    try:
+        cases = []
+        for record_type, rowid, source in con.execute('SELECT record_type, rowid, source FROM global_iterations '
+                                                      'ORDER BY id'):
+            table, name_col = tables[record_type]
+            row = con.execute(f'SELECT counter, {name_col} FROM {table} WHERE id=?', (rowid,)).fetchone()
+            cases.append((record_type, source, row))
+    finally:
+        con.close()
+    return cases
+
+
+@use_tempdirs
+class TestAsyncSqliteRecorder(unittest.TestCase):
+
+    def test_same_cases_as_sqlite_recorder(self):
+        p = _make_problem(om.SqliteRecorder('sync.db'))
+        p.run_driver()
+        p.cleanup()
+
+        q = _make_problem(AsyncSqliteRecorder('async.db', max_queued_cases=2))
+        q.run_driver()
+        q.cleanup()
+
+        sync_cr = om.CaseReader(p.get_outputs_dir() / 'sync.db')
+        async_cr = om.CaseReader(q.get_outputs_dir() / 'async.db')
+
+        sync_cases = sync_cr.list_cases('driver', out_stream=None)
+        async_cases = async_cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(async_cases, sync_cases)
+        self.assertGreater(len(async_cases), 2)
+
+        for case_name in (sync_cases[0], sync_cases[-1]):
+            sync_case = sync_cr.get_case(case_name)
+            async_case = async_cr.get_case(case_name)
+            for name in ('phase0.timeseries.time', 'phase0.timeseries.x', 'phase0.states:y'):
+                assert_near_equal(async_case.get_val(name), sync_case.get_val(name), tolerance=1.0E-14)
+
+    def test_global_iterations_reference_case_rows(self):
+        cases = {}
+        for name, recorder in (('sync', om.SqliteRecorder('sync.db')),
+                               ('async', AsyncSqliteRecorder('async.db', max_queued_cases=2))):
+            p = _make_problem(recorder)
+            p.add_recorder(recorder)
+            p.model.add_recorder(recorder)
+            p.model.nonlinear_solver.add_recorder(recorder)
+            p.run_driver()
+            p.record('final')
+            p.cleanup()
+
+            cases[name] = _get_global_iterations(p.get_outputs_dir() / f'{name}.db')
+
+        # Each case of each type must be referenced by the global_iterations table in the order recorded.
+        self.assertEqual({case[0] for case in cases['sync']}, {'driver', 'problem', 'system', 'solver'})
+        self.assertNotIn(None, [case[2] for case in cases['async']])
+        self.assertEqual(cases['async'], cases['sync'])
+
+    def test_flush(self):
+        recorder = AsyncSqliteRecorder('async.db')
+        p = _make_problem(recorder)
+        p.run_driver()
+
+        # Cases can be read once they are flushed, before the problem is cleaned up.
+        recorder.flush()
+        cr = om.CaseReader(p.get_outputs_dir() / 'async.db')
+        self.assertEqual(len(cr.list_cases('driver', out_stream=None)), recorder._counter)
+
+        p.cleanup()
+
+    def test_delete_recordings(self):
+        recorder = AsyncSqliteRecorder('async.db')
+        p = _make_problem(recorder)
+        p.add_recorder(recorder)
+        p.run_driver()
+
+        # Writes made by the main thread must not lock the writer thread out of the database.
+        recorder.delete_recordings()
+        p.record('final')
+        recorder.flush()
+        p.cleanup()
+
+        cr = om.CaseReader(p.get_outputs_dir() / 'async.db')
+        self.assertEqual(cr.list_cases('driver', out_stream=None), [])
+        self.assertEqual(cr.list_cases('problem', out_stream=None), ['final'])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+try:
+    import bokeh
+except ImportError:
+    bokeh = None
+
+import openmdao.api as om
+from openmdao.recorders.case import Case
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+import dymos as dm
+from dymos.examples.brachistochrone.brachistochrone_ode import BrachistochroneODE
+from dymos.visualization.timeseries.bokeh_timeseries_report import _get_traj_and_phases_from_problem, \
+    _get_timeseries_columns, _load_data_sources, make_timeseries_report
+
+
+@use_tempdirs
+class TestLoadDataSources(unittest.TestCase):
+
+    def setUp(self):
+        p = om.Problem(model=om.Group())
+
+        traj = p.model.add_subsystem('traj', dm.Trajectory())
+        for i in range(2):
+            phase = traj.add_phase(f'phase{i}', dm.Phase(ode_class=BrachistochroneODE,
+                                                         transcription=dm.Radau(num_segments=10, order=3)))
+            phase.set_time_options(fix_initial=True, fix_duration=True)
+            phase.add_state('x')
+            phase.add_state('y')
+            phase.add_state('v')
+            phase.add_control('theta', units='deg')
+            phase.add_parameter('g', units='m/s**2', val=9.80665, opt=False)
+
+        p.setup()
+
+        for i in range(2):
+            phase = traj.phases._get_subsystem(f'phase{i}')
+            phase.set_time_val(initial=i, duration=1.0)
+            phase.set_state_val('x', [0, 10])
+            phase.set_state_val('y', [10, 5])
+            phase.set_state_val('v', [0, 9.9])
+            phase.set_control_val('theta', [5, 100])
+
+        dm.run_problem(p, run_driver=False)
+
+        self.p = p
+        self.record_file = p.get_outputs_dir() / 'dymos_solution.db'
+
+    def test_data_read_when_used(self):
+        traj_meta = _get_traj_and_phases_from_problem(self.p)
+
+        with mock.patch.object(Case, 'get_val', autospec=True, side_effect=Case.get_val) as get_val:
+            data = _load_data_sources(traj_meta, self.record_file)
+
+            # Only the parameter values are read up front.
+            self.assertEqual(get_val.call_count, 2)
+
+            sol_data = data['traj']['sol_data_by_phase']['phase1']
+            self.assertIn('x', sol_data)
+            self.assertNotIn('foo', sol_data)
+
+            x = sol_data['x']
+            sol_data['x']
+            self.assertEqual(get_val.call_count, 3)
+
+        assert_near_equal(x, self.p.get_val('traj.phase1.timeseries.x'))
+        self.assertEqual(data['traj']['timeseries_units']['theta'], 'deg')
+
+    def test_downsample_simulation(self):
+        traj_meta = _get_traj_and_phases_from_problem(self.p)
+
+        data = _load_data_sources(traj_meta, self.record_file, self.record_file, max_simulation_points=7)
+
+        sol_time = data['traj']['sol_data_by_phase']['phase0']['time']
+        sim_time = data['traj']['sim_data_by_phase']['phase0']['time']
+        sim_x = data['traj']['sim_data_by_phase']['phase0']['x']
+
+        self.assertEqual(sol_time.shape, (40, 1))
+        self.assertEqual(sim_time.shape, (7, 1))
+        self.assertEqual(sim_x.shape, (7, 1))
+        assert_near_equal(sim_time[[0, -1]], sol_time[[0, -1]])
+        self.assertTrue(np.all(np.diff(sim_time.ravel()) >= 0))
+
+    def test_timeseries_columns(self):
+        traj_meta = _get_traj_and_phases_from_problem(self.p)
+
+        data = _load_data_sources(traj_meta, self.record_file, self.record_file, max_simulation_points=7)
+        ts_units = data['traj']['timeseries_units']
+
+        for phase_name in ('phase0', 'phase1'):
+            for kind, num_points in (('sol_data_by_phase', 40), ('sim_data_by_phase', 7)):
+                phase_data = data['traj'][kind][phase_name]
+                self.assertEqual(len(phase_data['time']), num_points)
+
+                for var_name in ts_units:
+                    with self.subTest(phase_name=phase_name, kind=kind, var_name=var_name):
+                        labels, columns = _get_timeseries_columns(var_name, 'time', phase_data)
+
+                        # Every column, including those of downsampled simulations, matches the x column.
+                        self.assertEqual(labels, {var_name: var_name})
+                        self.assertEqual(set(columns), set() if var_name == 'time' else {var_name})
+                        for column in columns.values():
+                            self.assertEqual(len(column), len(phase_data['time']))
+
+    def test_timeseries_columns_of_array_outputs(self):
+        phase_data = {'time': np.linspace(0, 1, 5).reshape((5, 1)),
+                      'pos': np.arange(30.0).reshape((5, 3, 2))}
+
+        labels, columns = _get_timeseries_columns('pos', 'time', phase_data)
+
+        self.assertEqual(labels, {f'pos[{i},{j}]': f'pos_{i}_{j}' for i in range(3) for j in range(2)})
+        self.assertEqual(list(columns), list(labels.values()))
+        for i in range(3):
+            for j in range(2):
+                assert_near_equal(columns[f'pos_{i}_{j}'], phase_data['pos'][:, i, j])
+
+    @unittest.skipUnless(bokeh, 'requires bokeh')
+    def test_make_timeseries_report(self):
+        from bokeh.models import ColumnDataSource
+
+        report_path = self.p.get_reports_dir() / 'traj_results_report.html'
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+
+        for max_simulation_points in (None, 7):
+            with self.subTest(max_simulation_points=max_simulation_points):
+                sources = []
+
+                def make_source(*args, **kwargs):
+                    source = ColumnDataSource(*args, **kwargs)
+                    sources.append(source)
+                    return source
+
+                with mock.patch('dymos.visualization.timeseries.bokeh_timeseries_report.ColumnDataSource',
+                                side_effect=make_source):
+                    make_timeseries_report(self.p, self.record_file, self.record_file,
+                                           max_simulation_points=max_simulation_points)
+
+                self.assertTrue(report_path.exists())
+
+                # Each phase has one parameter table, and one data source for each of its solution and
+                # simulation, which holds a column for every plotted variable.
+                ts_sources = [source for source in sources if 'time' in source.data]
+                self.assertEqual(len(sources), 6)
+                self.assertEqual(len(ts_sources), 4)
+                for source in ts_sources:
+                    self.assertTrue({'x', 'y', 'v', 'theta'}.issubset(source.data), msg=list(source.data))
+
+                num_points = sorted(len(source.data['time']) for source in ts_sources)
+                if max_simulation_points is None:
+                    self.assertEqual(num_points, [40, 40, 40, 40])
+                else:
+                    self.assertEqual(num_points, [7, 7, 40, 40])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
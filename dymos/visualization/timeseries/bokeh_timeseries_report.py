@@ -231,10 +231,158 @@ def _get_trajs_and_phases_from_cr(cr, problem=None):  # pragma: no cover
     return trajs
 
 
-def _load_data_sources(traj_and_phase_meta=None, solution_record_file=None, simulation_record_file=None):
+def _downsample_indices(num_points, max_points):
+    """
+    Return the indices of approximately evenly spaced points, including the first and last points.
+
+    Parameters
+    ----------
+    num_points : int
+        The number of points in the data.
+    max_points : int
+        The maximum number of points to be kept.
+
+    Returns
+    -------
+    np.ndarray
+        The sorted indices of the points to be kept.
+    """
+    return np.unique(np.linspace(0, num_points - 1, max(max_points, 2)).round().astype(int))
+
+
+class _TimeseriesCaseData(object):
+    """
+    The timeseries outputs of a phase in a case, which are read from the case when first accessed.
+
+    Parameters
+    ----------
+    case : Case
+        The case from which the timeseries outputs are read.
+    prom_names : dict
+        The promoted name in the case of each timeseries output, keyed by variable name.
+    units : dict
+        The units in which each timeseries output is returned, keyed by variable name.
+    max_points : int or None
+        If given, the outputs are downsampled to at most this many points.
+
+    Attributes
+    ----------
+    _case : Case
+        The case from which the timeseries outputs are read.
+    _prom_names : dict
+        The promoted name in the case of each timeseries output, keyed by variable name.
+    _units : dict
+        The units in which each timeseries output is returned, keyed by variable name.
+    _max_points : int or None
+        If given, the outputs are downsampled to at most this many points.
+    _cache : dict
+        The values of the timeseries outputs which have been read, keyed by variable name.
+    """
+
+    def __init__(self, case, prom_names, units, max_points=None):
+        self._case = case
+        self._prom_names = prom_names
+        self._units = units
+        self._max_points = max_points
+        self._cache = {}
+
+    def __contains__(self, var_name):
+        """
+        Return True if the phase has a timeseries output with the given name.
+
+        Parameters
+        ----------
+        var_name : str
+            The name of the timeseries output.
+
+        Returns
+        -------
+        bool
+            True if the phase has a timeseries output with the given name.
+        """
+        return var_name in self._prom_names
+
+    def __bool__(self):
+        """
+        Return True if the phase has any timeseries outputs.
+
+        Returns
+        -------
+        bool
+            True if the phase has any timeseries outputs.
+        """
+        return bool(self._prom_names)
+
+    def __getitem__(self, var_name):
+        """
+        Return the value of the given timeseries output, reading it from the case if necessary.
+
+        Parameters
+        ----------
+        var_name : str
+            The name of the timeseries output.
+
+        Returns
+        -------
+        np.ndarray
+            The value of the timeseries output.
+        """
+        if var_name not in self._cache:
+            val = self._case.get_val(self._prom_names[var_name], units=self._units[var_name])
+            if self._max_points is not None and val.shape[0] > self._max_points:
+                val = val[_downsample_indices(val.shape[0], self._max_points)]
+            self._cache[var_name] = val
+        return self._cache[var_name]
+
+
+def _get_timeseries_columns(var_name, x_name, data):
+    """
+    Return the columns of the data source in which the given timeseries output is plotted.
+
+    An output with more than one element per node is split into a column for each element.
+
+    Parameters
+    ----------
+    var_name : str
+        The name of the timeseries output.
+    x_name : str
+        The name of the timeseries output plotted on the x-axis, which is already a column of the data source.
+    data : dict or _TimeseriesCaseData
+        The timeseries outputs of the phase, keyed by variable name.
+
+    Returns
+    -------
+    dict
+        The name of the column plotted in each figure, keyed by the y-axis label of the figure.
+    dict
+        The value of each column to be added to the data source, keyed by column name.
+    """
+    val = data[var_name]
+    shape = val.shape[1:]
+
+    if np.prod(shape) <= 1:
+        return {var_name: var_name}, ({} if var_name == x_name else {var_name: val})
+
+    labels = {}
+    columns = {}
+    for idxs in itertools.product(*(range(dim) for dim in shape)):
+        str_idxs = ','.join([str(i) for i in idxs])
+        # Bokeh ColumnDataSource doesn't allow special characters in keys,
+        # but we want the y_axis label to show the indices of the columns
+        # being plotted as 'varname[i,j,k]'.
+        labels[f'{var_name}[{str_idxs}]'] = column_name = f'{var_name}_{str_idxs.replace(",", "_")}'
+        columns[column_name] = val[(slice(None), *idxs)]
+    return labels, columns
+
+
+def _load_data_sources(traj_and_phase_meta=None, solution_record_file=None, simulation_record_file=None,
+                       max_simulation_points=None):
     """
     Load the data for the timeseries plots from the given solution and record files.
 
+    Only the metadata of the timeseries outputs is read here. The value of each timeseries
+    output is read from its case when it is first plotted.
+
     Parameters
     ----------
     traj_and_phase_meta : dict
@@ -242,8 +390,10 @@ def _load_data_sources(traj_and_phase_meta=None, solution_record_file=None, simu
         and associated options.
     solution_record_file : str
         The path to the solution record file.
-    sim_record_file : str
+    simulation_record_file : str
         The path to the corresponding simulation record file.
+    max_simulation_points : int or None
+        If given, the simulation timeseries of each phase is downsampled to at most this many points.
 
     Returns
     -------
@@ -266,25 +416,23 @@ def _load_data_sources(traj_and_phase_meta=None, solution_record_file=None, simu
         sim_case = None
 
     source_case = sol_case or sim_case or None
-    outputs = {abs_path: meta for abs_path, meta in source_case.list_outputs(out_stream=None, units=True)}
 
     if source_case is None:
         om.issue_warning('No recorded data provided. Trajectory results report will not be created.')
         return
 
     if sol_case:
-        sol_outputs = {abs_path: meta for abs_path, meta in
-                       sol_case.list_outputs(out_stream=None, units=True) if 'timeseries' in abs_path}
+        sol_outputs = sol_case.get_io_metadata(iotypes='output', metadata_keys=['units'],
+                                               includes='*.timeseries.*')
     else:
         sol_outputs = None
 
     if sim_case:
-        sim_outputs = {abs_path: meta for abs_path, meta in
-                       sim_case.list_outputs(out_stream=None, units=True) if 'timeseries' in abs_path}
+        sim_outputs = sim_case.get_io_metadata(iotypes='output', metadata_keys=['units'],
+                                               includes='*.timeseries.*')
     else:
         sim_outputs = None
 
-    source_case = sol_case or sim_case
     outputs = sol_outputs or sim_outputs
 
     if sim_outputs is not None and sol_outputs is not None:
@@ -295,6 +443,12 @@ def _load_data_sources(traj_and_phase_meta=None, solution_record_file=None, simu
                              f'{set(sim_outputs.keys()) - set(sol_outputs.keys())}')
             sim_case = None
 
+    # Group the timeseries outputs by phase.
+    ts_outputs_by_phase = {}
+    for abs_name, meta in outputs.items():
+        phase_path, _, _ = abs_name.rpartition('.timeseries.')
+        ts_outputs_by_phase.setdefault(phase_path, {})[abs_name] = meta
+
     for traj_path, traj_data in traj_and_phase_meta.items():
         data_dict[traj_path] = {'param_data_by_phase': {},
                                 'sol_data_by_phase': {},
@@ -307,11 +461,7 @@ def _load_data_sources(traj_and_phase_meta=None, solution_record_file=None, simu
                 data_dict[traj_path]['param_data_by_phase'][phase_name] = \
                 {'param': [], 'val': [], 'units': []}
 
-            phase_sol_data = data_dict[traj_path]['sol_data_by_phase'][phase_name] = {}
-            phase_sim_data = data_dict[traj_path]['sim_data_by_phase'][phase_name] = {}
-
-            ts_outputs = {op: meta for op, meta in outputs.items()
-                          if op.startswith(f'{phase_path}.timeseries.')}
+            ts_outputs = ts_outputs_by_phase.get(phase_path, {})
 
             # Populate the phase parameter data
             phase_params = traj_and_phase_meta[traj_path]['phases'][phase_path]['parameter_options']
@@ -324,10 +474,12 @@ def _load_data_sources(traj_and_phase_meta=None, solution_record_file=None, simu
 
             # Find the "largest" unit used for any timeseries output across all phases
             ts_units_dict = data_dict[traj_path]['timeseries_units']
+            prom_names = {}
             for abs_name in sorted(ts_outputs.keys(), key=str.casefold):
                 meta = ts_outputs[abs_name]
                 prom_name = meta['prom_name']
                 var_name = prom_name.split('.')[-1]
+                prom_names[var_name] = prom_name
 
                 if var_name not in ts_units_dict:
                     ts_units_dict[var_name] = meta['units']
@@ -337,18 +489,13 @@ def _load_data_sources(traj_and_phase_meta=None, solution_record_file=None, simu
                     if new_conv_factor < old_conv_factor:
                         ts_units_dict[var_name] = meta['units']
 
-            # Populate the phase timeseries data
-            for output_name in sorted(ts_outputs.keys(), key=str.casefold):
-                meta = ts_outputs[output_name]
-                prom_name = meta['prom_name']
-                var_name = prom_name.split('.')[-1]
-
-                if sol_case:
-                    data = sol_case.get_val(prom_name, units=ts_units_dict[var_name])
-                    phase_sol_data[var_name] = data
-                if sim_case:
-                    data = sim_case.get_val(prom_name, units=ts_units_dict[var_name])
-                    phase_sim_data[var_name] = data
+            # The phase timeseries data is read from the cases when it is plotted, once the units of
+            # each variable across all phases are known.
+            data_dict[traj_path]['sol_data_by_phase'][phase_name] = \
+                _TimeseriesCaseData(sol_case, prom_names, ts_units_dict) if sol_case else {}
+            data_dict[traj_path]['sim_data_by_phase'][phase_name] = \
+                _TimeseriesCaseData(sim_case, prom_names, ts_units_dict,
+                                    max_points=max_simulation_points) if sim_case else {}
 
     return data_dict
 
@@ -408,7 +555,7 @@ def _new_figure(x_name, y_name, x_units, y_units, margin, x_range=None):
 
 
 def make_timeseries_report(prob, solution_record_file=None, simulation_record_file=None,
-                           x_name='time', ncols=2, margin=10, theme='light_minimal'):
+                           x_name='time', ncols=2, margin=10, theme='light_minimal', max_simulation_points=None):
     """
     Create the bokeh-based timeseries results report.
 
@@ -428,6 +575,9 @@ def make_timeseries_report(prob, solution_record_file=None, simulation_record_fi
         A margin to be placed between the plot figures.
     theme : str
         A valid bokeh theme name to style the report.
+    max_simulation_points : int or None
+        If given, the simulation timeseries of each phase is downsampled to at most this many points
+        to limit the size of the report.
     """
     comm_rank = 0 if MPI is None else MPI.COMM_WORLD.rank
     report_dir = Path(prob.get_reports_dir()) if prob is not None else Path(os.getcwd())
@@ -443,7 +593,8 @@ def make_timeseries_report(prob, solution_record_file=None, simulation_record_fi
 
         # For the primary timeseries in each phase in each trajectory, build a set of the pathnames
         # to be plotted.
-        source_data = _load_data_sources(traj_data, solution_record_file, simulation_record_file)
+        source_data = _load_data_sources(traj_data, solution_record_file, simulation_record_file,
+                                         max_simulation_points=max_simulation_points)
 
         # Colors of each phase in the plot. Start with the bright colors followed by the faded ones.
         if not _NO_BOKEH:
@@ -482,6 +633,11 @@ def make_timeseries_report(prob, solution_record_file=None, simulation_record_fi
             legend_data_per_figure = {}
             x_range = None
 
+            # Each phase has a single data source for its solution and one for its simulation, shared
+            # by all of the figures, to which the column of each plotted variable is added once.
+            sol_sources = {}
+            sim_sources = {}
+
             # var_name is the actual dymos variable name, without any index information.
             # var_name_with_idxs is the variable name with index information.
 
@@ -492,26 +648,20 @@ def make_timeseries_report(prob, solution_record_file=None, simulation_record_fi
                     sim_data = source_data[traj_path]['sim_data_by_phase'][phase_name]
 
                     if x_name in sol_data and var_name in sol_data:
-                        shape = sol_data[var_name].shape[1:]
-                        indices = list(itertools.product(*(range(dim) for dim in shape)))
-                        if np.prod(shape) > 1:
-                            sources = {}
-                            for idxs in indices:
-                                str_idxs = ','.join([str(i) for i in idxs])
-                                # Bokeh ColumnDataSource doesn't allow special characters in keys,
-                                # but we want the y_axis label to show the indices of the columns
-                                # being plotted as 'varname[i,j,k]'.
-                                sources[f'{var_name}[{str_idxs}]'] = s = f'{var_name}_{str_idxs.replace(",", "_")}'
-                                sol_data_column = sol_data[var_name][(slice(None), *idxs)]
-                                sol_data[s] = sol_data_column
-                                if sim_data:
-                                    sim_data_column = sim_data[var_name][(slice(None), *idxs)]
-                                    sim_data[s] = sim_data_column
-                        else:
-                            sources = {var_name: var_name}
-                        sol_source = ColumnDataSource(sol_data)
-                        if sim_data:
-                            sim_source = ColumnDataSource(sim_data)
+                        if phase_name not in sol_sources:
+                            sol_sources[phase_name] = ColumnDataSource({x_name: sol_data[x_name]})
+                            if sim_data and x_name in sim_data:
+                                sim_sources[phase_name] = ColumnDataSource({x_name: sim_data[x_name]})
+                        sol_source = sol_sources[phase_name]
+                        sim_source = sim_sources.get(phase_name) if var_name in sim_data else None
+
+                        sources, sol_columns = _get_timeseries_columns(var_name, x_name, sol_data)
+                        for column_name, column_data in sol_columns.items():
+                            sol_source.add(column_data, name=column_name)
+                        if sim_source is not None:
+                            _, sim_columns = _get_timeseries_columns(var_name, x_name, sim_data)
+                            for column_name, column_data in sim_columns.items():
+                                sim_source.add(column_data, name=column_name)
 
                         for var_name_with_idxs, _source in sources.items():
                             legend_items = []
@@ -532,7 +682,7 @@ def make_timeseries_report(prob, solution_record_file=None, simulation_record_fi
                                                        color=color, size=5)
                                 sol_plot.tags.extend(['sol', f'phase:{phase_name}'])
                                 legend_items.append(sol_plot)
-                            if sim_data:
+                            if sim_source is not None:
                                 sim_plot = fig.line(x=x_name, y=_source, source=sim_source, color=color)
                                 sim_plot.tags.extend(['sim', f'phase:{phase_name}'])
                                 legend_items.append(sim_plot)